@@ -14,13 +14,10 @@ import sys
 import os
 from pathlib import Path
 from datetime import datetime
-from compare import Compare
-from excel_export import ExcelExporter
-from json_export import JSONExporter
-from csv_export import CSVExporter
-from html_export import HTMLExporter
+from typing import Optional
+from result_cache import get_comparison_bundle
 from llm_adapter import LLMAdapter
-from validators import validate_file_path, validate_output_path
+from validators import validate_file_paths, validate_output_path
 from logger_config import logger, setup_logger
 from exceptions import CompareDocxError
 import logging
@@ -52,6 +49,12 @@ def create_parser():
   # Отключение LLM анализа:
   python cli.py file1.docx file2.docx --no-llm
 
+  # Сохранение результатов точно в указанную папку:
+  python cli.py file1.docx file2.docx --result-dir results/run1
+
+  # Повторное сравнение с кэшем результатов:
+  python cli.py file1.docx file2.docx --cache
+
   # Уровень логирования DEBUG:
   python cli.py file1.docx file2.docx --log-level DEBUG
         """
@@ -117,6 +120,13 @@ def create_parser():
         help='Директория для сохранения результатов (для CSV создается несколько файлов)'
     )
     
+    parser.add_argument(
+        '--result-dir',
+        type=str,
+        help='Папка для файлов результатов без вложенной папки с временной меткой '
+             '(имеет приоритет над --output-dir)'
+    )
+    
     parser.add_argument(
         '--filter-status',
         nargs='+',
@@ -142,6 +152,18 @@ def create_parser():
         help='Отключить LLM анализ изменений'
     )
     
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument(
+        '--cache',
+        action='store_true',
+        help='Использовать кэш результатов сравнения и парсинга (по умолчанию отключен)'
+    )
+    cache_group.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Не использовать кэш, даже если он включен через CACHE_ENABLED'
+    )
+    
     parser.add_argument(
         '--log-level',
         choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
@@ -171,10 +193,29 @@ def create_parser():
     return parser
 
 
-def main():
-    """Основная функция CLI."""
+def cache_mode(args) -> Optional[bool]:
+    """
+    Режим кэша по флагам --cache/--no-cache.
+    
+    Returns:
+        True или False при явном флаге, None - по config.cache.enabled
+    """
+    if args.cache:
+        return True
+    if args.no_cache:
+        return False
+    return None
+
+
+def main(argv=None):
+    """
+    Основная функция CLI.
+    
+    Args:
+        argv: Список аргументов командной строки (по умолчанию sys.argv[1:])
+    """
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Настройка логирования
     log_level = getattr(logging, args.log_level.upper())
@@ -186,8 +227,9 @@ def main():
     
     # Валидация путей к файлам
     try:
-        file1_path, file1_path_obj = validate_file_path(args.file1)
-        file2_path, file2_path_obj = validate_file_path(args.file2)
+        (file1_path, file1_path_obj), (file2_path, file2_path_obj) = validate_file_paths(
+            [args.file1, args.file2]
+        )
         logger.info(f"Валидация файлов успешна")
     except CompareDocxError as e:
         logger.error(f"Ошибка валидации: {e}")
@@ -212,14 +254,16 @@ def main():
     # Сравнение документов
     try:
         print("\nВыполнение сравнения...")
-        comparator = Compare(file1_path, file2_path, llm_adapter=llm_adapter)
+        bundle = get_comparison_bundle(
+            file1_path, file2_path, llm_adapter=llm_adapter, use_cache=cache_mode(args)
+        )
         
         # Получение результатов
-        results = comparator.get_comparison_results()
-        statistics = comparator.get_statistics()
-        table_changes = comparator.get_table_changes()
-        image_changes = comparator.get_image_changes()
-        summary_changes = comparator._generate_summary_changes()
+        results = bundle["results"]
+        statistics = bundle["statistics"]
+        table_changes = bundle["table_changes"]
+        image_changes = bundle["image_changes"]
+        summary_changes = bundle["summary_changes"]
         
         # Применение фильтров
         filters = {}
@@ -232,6 +276,7 @@ def main():
         
         if filters:
             # Используем метод фильтрации напрямую
+            from json_export import JSONExporter
             filtered_results = JSONExporter._apply_filters(None, results, filters)
             logger.info(f"Применены фильтры: {len(filtered_results)} из {len(results)} результатов")
         else:
@@ -298,7 +343,10 @@ def main():
             base_output_dir = Path("results")
         
         # Создание папки для этого запуска
-        comparison_dir = base_output_dir / comparison_dir_name
+        if args.result_dir:
+            comparison_dir = Path(args.result_dir)
+        else:
+            comparison_dir = base_output_dir / comparison_dir_name
         comparison_dir.mkdir(parents=True, exist_ok=True)
         
         logger.info(f"Результаты будут сохранены в папку: {comparison_dir}")
@@ -314,6 +362,9 @@ def main():
             print(f"\nЭкспорт в {fmt.upper()}...")
             
             if fmt == 'excel':
+                # Экспортеры импортируются только для выбранных форматов:
+                # openpyxl и шаблоны HTML не загружаются без необходимости
+                from excel_export import ExcelExporter
                 output_path = str(comparison_dir / f"{output_base}.xlsx")
                 exporter = ExcelExporter(output_path)
                 exporter.export_comparison(
@@ -328,6 +379,7 @@ def main():
                 print(f"  [OK] Excel: {output_path}")
             
             elif fmt == 'json':
+                from json_export import JSONExporter
                 output_path = str(comparison_dir / f"{output_base}.json")
                 pretty = args.json_pretty and not args.json_compact
                 exporter = JSONExporter(output_path, pretty=pretty)
@@ -344,6 +396,7 @@ def main():
                 print(f"  [OK] JSON: {output_path}")
             
             elif fmt == 'csv':
+                from csv_export import CSVExporter
                 exporter = CSVExporter(str(comparison_dir))
                 exporter.export_comparison(
                     filtered_results if filters else results,
@@ -357,6 +410,7 @@ def main():
                 print(f"  [OK] CSV: файлы сохранены в {comparison_dir}")
             
             elif fmt == 'html':
+                from html_export import HTMLExporter
                 output_path = str(comparison_dir / f"{output_base}.html")
                 exporter = HTMLExporter(output_path)
                 exporter.export_comparison(
@@ -17,14 +17,72 @@
 - Полные тексты в описании различий
 """
 
-from typing import List, Dict, Tuple, Set, Optional
+from typing import List, Dict, Tuple, Set, Optional, Sequence
 from docx_file import DocxFile
+from sequence_diff import get_matching_blocks
 import difflib
 import re
+from functools import lru_cache
 from config import config
 from logger_config import logger
 from exceptions import ComparisonError
 
+# Регулярные выражения компилируются один раз при импорте модуля
+WHITESPACE_RE = re.compile(r'\s+')
+WORD_RE = re.compile(r'\b\w+\b')
+PUNCTUATION_RE = re.compile(r'[.,;:!?—–-]')
+SENTENCE_END_RE = re.compile(r'[.!?]\s+')
+VERSION_NUMBER_RE = re.compile(r'верси[ияею]\s+([\d.]+)', re.IGNORECASE)
+
+# Паттерны версии документа и количества листов/страниц (общие правки).
+# Порядок важен: используется первый паттерн, найденный в обоих текстах.
+VERSION_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'верси[яиюе]\s*:?\s*(\d+\.?\d*\.?\d*)',
+    r'version\s*:?\s*(\d+\.?\d*\.?\d*)',
+    r'v\.?\s*(\d+\.?\d*\.?\d*)',
+    r'ревизи[яиюе]\s*:?\s*(\d+\.?\d*\.?\d*)',
+    r'revision\s*:?\s*(\d+\.?\d*\.?\d*)',
+    r'ред\.?\s*(\d+\.?\d*\.?\d*)',
+))
+PAGE_COUNT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'лист[ов]?\s*:?\s*(\d+)',
+    r'страниц[аы]?\s*:?\s*(\d+)',
+    r'pages?\s*:?\s*(\d+)',
+    r'всего\s+лист[ов]?\s*:?\s*(\d+)',
+    r'количество\s+лист[ов]?\s*:?\s*(\d+)',
+))
+
+# Объединение паттернов семейства в одно выражение: один проход по тексту
+# показывает, найдется ли в нем хотя бы один из паттернов
+VERSION_MARKER_RE = re.compile('|'.join(f'(?:{p.pattern})' for p in VERSION_PATTERNS), re.IGNORECASE)
+PAGE_COUNT_MARKER_RE = re.compile('|'.join(f'(?:{p.pattern})' for p in PAGE_COUNT_PATTERNS), re.IGNORECASE)
+
+
+def find_numbered_change(marker, patterns, text1: str, text2: str) -> Optional[Tuple[str, str]]:
+    """
+    Поиск изменения номера (версии, количества листов) между двумя текстами.
+    
+    Используется первый паттерн, найденный в обоих текстах с разными номерами.
+    Тексты без маркеров семейства отсекаются одним проходом marker.
+    
+    Args:
+        marker: Объединенное выражение семейства (например, VERSION_MARKER_RE)
+        patterns: Паттерны семейства в порядке приоритета
+        text1: Первый текст
+        text2: Второй текст
+    
+    Returns:
+        Кортеж (старый номер, новый номер) или None
+    """
+    if not (marker.search(text1) and marker.search(text2)):
+        return None
+    for pattern in patterns:
+        match1 = pattern.search(text1)
+        match2 = pattern.search(text2)
+        if match1 and match2 and match1.group(1) != match2.group(1):
+            return match1.group(1), match2.group(1)
+    return None
+
 # Импорт tqdm для прогресс-бара (опционально)
 try:
     from tqdm import tqdm
@@ -35,6 +93,131 @@ except ImportError:
     def tqdm(iterable, *args, **kwargs):
         return iterable
 
+# Импорт rapidfuzz для вычисления схожести строк в нативном коде (опционально)
+try:
+    from rapidfuzz.fuzz import ratio as _rapidfuzz_ratio
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+# Пакетное вычисление схожести (rapidfuzz.process.cdist) возвращает массив NumPy
+try:
+    import numpy as np
+    from rapidfuzz.process import cdist as _rapidfuzz_cdist
+    CDIST_AVAILABLE = True
+except ImportError:
+    CDIST_AVAILABLE = False
+
+
+def similarity_backend() -> str:
+    """
+    Используемая реализация коэффициента схожести.
+    
+    rapidfuzz используется только при явном выборе в
+    config.comparison.similarity_backend и наличии пакета, иначе difflib:
+    результаты сравнения не зависят от установленных пакетов. Значения
+    реализаций немного различаются, поэтому она входит в ключ кэша результатов.
+    
+    Returns:
+        "rapidfuzz" или "difflib"
+    """
+    if config.comparison.similarity_backend == "rapidfuzz" and RAPIDFUZZ_AVAILABLE:
+        return "rapidfuzz"
+    return "difflib"
+
+
+def text_ratio(text1: str, text2: str, cutoff: float = 0.0) -> float:
+    """
+    Коэффициент схожести двух строк от 0.0 до 1.0.
+    
+    По умолчанию используется difflib.SequenceMatcher.ratio(), при выборе
+    rapidfuzz (см. similarity_backend) - нормализованное расстояние Indel
+    (fuzz.ratio).
+    
+    Args:
+        text1: Первая строка
+        text2: Вторая строка
+        cutoff: Порог, ниже которого точное значение не нужно: такие
+                пары отсекаются по верхней оценке и получают 0.0
+    """
+    # Одинаковые строки (обе реализации дают 1.0) - без построения индексов
+    if text1 is text2 or text1 == text2:
+        return 1.0
+    
+    if similarity_backend() == "rapidfuzz":
+        # Небольшой запас, чтобы ошибка округлений при переводе в проценты
+        # не отсекла значение, равное порогу
+        score_cutoff = max(cutoff * 100.0 - 1e-9, 0.0)
+        return _rapidfuzz_ratio(text1, text2, score_cutoff=score_cutoff) / 100.0
+    
+    return _matcher_ratio(difflib.SequenceMatcher(None, text1, text2), cutoff)
+
+
+def _matcher_ratio(matcher: difflib.SequenceMatcher, cutoff: float) -> float:
+    """ratio() подготовленного SequenceMatcher с отсечением по порогу (см. text_ratio)."""
+    # Быстрые верхние оценки ratio() (как в difflib.get_close_matches)
+    if cutoff and (matcher.real_quick_ratio() < cutoff or matcher.quick_ratio() < cutoff):
+        return 0.0
+    return matcher.ratio()
+
+
+@lru_cache(maxsize=256)
+def word_opcodes(norm1: str, norm2: str) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple]:
+    """
+    Пословное выравнивание двух нормализованных текстов.
+    
+    Для измененного абзаца выравнивание нужно и списку различий, и описанию
+    изменения; кэш позволяет выполнить SequenceMatcher для пары один раз.
+    Результат общий для всех вызывающих, поэтому возвращаются только кортежи.
+    
+    Returns:
+        Кортеж (слова norm1, слова norm2, опкоды SequenceMatcher.get_opcodes())
+    """
+    words1 = tuple(norm1.split())
+    words2 = tuple(norm2.split())
+    opcodes = tuple(difflib.SequenceMatcher(None, words1, words2).get_opcodes())
+    return words1, words2, opcodes
+
+
+def similarity_matrix(texts1: Sequence[str], texts2: Sequence[str], cutoff: float = 0.0):
+    """
+    Коэффициенты схожести всех пар строк (texts1[i], texts2[j]).
+    
+    При выборе rapidfuzz (см. similarity_backend) и наличии NumPy матрица
+    считается одним вызовом cdist в нативном коде на всех ядрах, иначе
+    через difflib по столбцам.
+    Значения совпадают с text_ratio для каждой пары.
+    
+    Args:
+        texts1: Строки матрицы
+        texts2: Столбцы матрицы
+        cutoff: Порог, ниже которого значения могут быть заменены на 0.0
+    
+    Returns:
+        Матрица len(texts1) x len(texts2): numpy.ndarray при вычислении
+        через rapidfuzz, иначе список списков
+    """
+    if CDIST_AVAILABLE and similarity_backend() == "rapidfuzz":
+        score_cutoff = max(cutoff * 100.0 - 1e-9, 0.0)
+        # float64, чтобы значения совпадали с fuzz.ratio (по умолчанию float32)
+        scores = _rapidfuzz_cdist(texts1, texts2, scorer=_rapidfuzz_ratio, dtype=np.float64,
+                                  score_cutoff=score_cutoff, workers=-1)
+        return scores / 100.0
+    
+    # SequenceMatcher индексирует вторую последовательность (b2j): для каждого
+    # столбца индекс строится один раз и используется для всех строк
+    matrix = [[0.0] * len(texts2) for _ in texts1]
+    matcher = difflib.SequenceMatcher(None)
+    for j, text2 in enumerate(texts2):
+        matcher.set_seq2(text2)
+        for i, text1 in enumerate(texts1):
+            if text1 == text2:
+                matrix[i][j] = 1.0
+                continue
+            matcher.set_seq1(text1)
+            matrix[i][j] = _matcher_ratio(matcher, cutoff)
+    return matrix
+
 # Импорт colorama для цветного вывода (опционально)
 try:
     from colorama import init, Fore, Style
@@ -85,7 +268,8 @@ class Compare:
     - Строятся детальные описания всех изменений
     """
     
-    def __init__(self, file1_path: str, file2_path: str, llm_adapter=None):
+    def __init__(self, file1_path: str, file2_path: str, llm_adapter=None,
+                 use_cache: Optional[bool] = None):
         """
         Инициализация класса сравнения.
         
@@ -100,10 +284,11 @@ class Compare:
             file1_path: Путь к первому DOCX файлу (базовый документ)
             file2_path: Путь ко второму DOCX файлу (измененный документ)
             llm_adapter: Опциональный адаптер LLM для дополнительного анализа изменений
+            use_cache: Использовать кэш парсинга документов; None - по config.cache.enabled
         """
         # Загрузка документов
-        self.file1 = DocxFile(file1_path)  # Базовый документ
-        self.file2 = DocxFile(file2_path)  # Измененный документ
+        self.file1 = DocxFile(file1_path, use_cache=use_cache)  # Базовый документ
+        self.file2 = DocxFile(file2_path, use_cache=use_cache)  # Измененный документ
         
         # LLM адаптер для дополнительного анализа
         self.llm_adapter = llm_adapter
@@ -113,6 +298,9 @@ class Compare:
         self.table_changes = []  # Результаты сравнения таблиц
         self.image_changes = []  # Результаты сравнения изображений
         
+        # Количество неудавшихся LLM запросов (такие результаты не кэшируются)
+        self.llm_failures = 0
+        
         # Автоматическое выполнение сравнения при инициализации
         try:
             logger.info("Начало сравнения документов")
@@ -165,24 +353,10 @@ class Compare:
         if config.comparison.normalize_case:
             text = text.lower()
         
-        # Шаг 1: Замена множественных пробелов на один
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Шаг 2: Удаление пробелов в начале и конце
-        text = text.strip()
-        
-        # Шаг 3: Нормализация переносов строк (замена на пробелы)
-        text = re.sub(r'[\n\r]+', ' ', text)
-        
-        # Шаг 4: Удаление специальных символов форматирования
-        text = text.replace('\xa0', ' ')  # Неразрывный пробел (U+00A0)
-        text = text.replace('\u2009', ' ')  # Тонкий пробел (U+2009)
-        text = text.replace('\u2008', ' ')  # Пунктуационный пробел (U+2008)
-        
-        # Шаг 5: Финальная очистка множественных пробелов после нормализации
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text.strip()
+        # Разбиение по пробельным символам Unicode (включая переносы строк,
+        # неразрывный и тонкий пробелы) и склейка через один пробел:
+        # пробелы в начале и конце отбрасываются, множественные схлопываются
+        return ' '.join(text.split())
     
     def _get_text_fingerprint(self, text: str) -> str:
         """
@@ -220,7 +394,7 @@ class Compare:
         Алгоритм сравнения (6 шагов):
         1. Нормализация всех текстов (игнорируя стили)
         2. Создание отпечатков для быстрого поиска
-        3. Сопоставление по позиции (SequenceMatcher)
+        3. Сопоставление по позиции (алгоритм Myers)
         4. Дополнительный поиск по отпечаткам (независимо от позиции)
         5. Анализ каждого абзаца и построение описаний изменений
         6. Обработка добавленных/удаленных абзацев
@@ -231,15 +405,20 @@ class Compare:
         paragraphs1 = self.file1.get_all_paragraphs()
         paragraphs2 = self.file2.get_all_paragraphs()
         
+        texts1 = self.file1.get_paragraph_columns()["text"]
+        texts2 = self.file2.get_paragraph_columns()["text"]
+        
         # Шаг 1: Нормализация текстов для сравнения (игнорируя стили)
         # Это позволяет сравнивать тексты независимо от форматирования
-        normalized_texts1 = [self._normalize_text(p["text"]) for p in paragraphs1]
-        normalized_texts2 = [self._normalize_text(p["text"]) for p in paragraphs2]
+        normalize = self._normalize_text
+        normalized_texts1 = [normalize(text) for text in texts1]
+        normalized_texts2 = [normalize(text) for text in texts2]
         
         # Шаг 2: Создание отпечатков для быстрого поиска идентичных абзацев
         # Отпечаток = первые/последние слова + длина + количество слов
-        fingerprints1 = {i: self._get_text_fingerprint(p["text"]) for i, p in enumerate(paragraphs1)}
-        fingerprints2 = {i: self._get_text_fingerprint(p["text"]) for i, p in enumerate(paragraphs2)}
+        fingerprint = self._get_text_fingerprint
+        fingerprints1 = {i: fingerprint(text) for i, text in enumerate(texts1)}
+        fingerprints2 = {i: fingerprint(text) for i, text in enumerate(texts2)}
         
         # Шаг 3: Создание индекса по отпечаткам для второго документа
         # Это позволяет быстро находить абзацы с одинаковыми отпечатками
@@ -250,10 +429,9 @@ class Compare:
                     fingerprint_index2[fp] = []
                 fingerprint_index2[fp].append(idx2)
         
-        # Шаг 4: Использование SequenceMatcher для поиска похожих последовательностей
+        # Шаг 4: Выравнивание абзацев алгоритмом Myers (линейная память)
         # Находит блоки идентичных абзацев по позиции
-        matcher = difflib.SequenceMatcher(None, normalized_texts1, normalized_texts2)
-        matching_blocks = matcher.get_matching_blocks()
+        matching_blocks = get_matching_blocks(normalized_texts1, normalized_texts2)
         
         # Шаг 5: Создание карты соответствий по позиции
         matched_indices_1 = set()  # Индексы абзацев из первого документа, которые уже сопоставлены
@@ -282,7 +460,9 @@ class Compare:
                         # Проверяем, действительно ли тексты идентичны
                         norm1 = normalized_texts1[idx1]
                         norm2 = normalized_texts2[idx2]
-                        similarity_check = self._calculate_similarity(norm1, norm2)
+                        similarity_check = self._calculate_similarity(
+                            norm1, norm2, config.comparison.similarity_threshold_high
+                        )
                         if norm1 == norm2 or similarity_check >= config.comparison.similarity_threshold_high:
                             if idx1 not in match_map:
                                 match_map[idx1] = idx2
@@ -373,7 +553,8 @@ class Compare:
                 # Используем нормализованный текст для сравнения
                 normalized_text1 = normalized_texts1[idx1]
                 best_match_idx, best_similarity = self._find_best_match_by_content(
-                    normalized_text1, paragraphs2, normalized_texts2, matched_indices_2
+                    normalized_text1, paragraphs2, normalized_texts2, matched_indices_2,
+                    config.comparison.similarity_threshold_low
                 )
                 
                 if best_similarity >= config.comparison.similarity_threshold_low:
@@ -429,7 +610,7 @@ class Compare:
                 result["change_subtype"] = "Добавление абзаца"
                 self.comparison_results.append(result)
     
-    def _calculate_similarity(self, text1: str, text2: str) -> float:
+    def _calculate_similarity(self, text1: str, text2: str, cutoff: float = 0.0) -> float:
         """
         Вычисление схожести двух текстов.
         Использует нормализованные тексты для сравнения по содержимому.
@@ -437,10 +618,16 @@ class Compare:
         Args:
             text1: Первый текст
             text2: Второй текст
+            cutoff: Порог, ниже которого схожесть может быть возвращена как 0.0
+                    (см. text_ratio)
             
         Returns:
             Коэффициент схожести от 0.0 до 1.0
         """
+        # Одинаковые тексты совпадают и после нормализации
+        if text1 is text2 or text1 == text2:
+            return 1.0
+        
         # Нормализуем тексты перед сравнением
         norm1 = self._normalize_text(text1)
         norm2 = self._normalize_text(text2)
@@ -449,8 +636,11 @@ class Compare:
         if norm1 == norm2:
             return 1.0
         
-        # Используем SequenceMatcher для вычисления схожести
-        return difflib.SequenceMatcher(None, norm1, norm2).ratio()
+        # Пустой текст не имеет общих символов с непустым
+        if not norm1 or not norm2:
+            return 0.0
+        
+        return text_ratio(norm1, norm2, cutoff)
     
     def _find_best_match(self, text: str, paragraphs: List[Dict], 
                         excluded_indices: set) -> Tuple[int, float]:
@@ -475,7 +665,7 @@ class Compare:
             
             # Сравниваем нормализованные тексты
             normalized_para = self._normalize_text(para["text"])
-            similarity = difflib.SequenceMatcher(None, normalized_text, normalized_para).ratio()
+            similarity = text_ratio(normalized_text, normalized_para)
             
             if similarity > best_similarity:
                 best_similarity = similarity
@@ -484,7 +674,8 @@ class Compare:
         return best_idx, best_similarity
     
     def _find_best_match_by_content(self, normalized_text: str, paragraphs: List[Dict],
-                                   normalized_texts: List[str], excluded_indices: Set[int]) -> Tuple[int, float]:
+                                   normalized_texts: List[str], excluded_indices: Set[int],
+                                   min_similarity: float = 0.0) -> Tuple[int, float]:
         """
         Поиск наиболее похожего абзаца по содержимому (игнорируя стили).
         
@@ -493,19 +684,36 @@ class Compare:
             paragraphs: Список абзацев для поиска
             normalized_texts: Список нормализованных текстов
             excluded_indices: Индексы, которые уже использованы
+            min_similarity: Минимальная схожесть, нужная вызывающему коду;
+                            кандидаты ниже нее отсекаются без точного расчета
             
         Returns:
-            Кортеж (индекс, схожесть)
+            Кортеж (индекс, схожесть); (-1, 0.0), если ни один абзац
+            не достиг min_similarity
         """
         best_idx = -1
         best_similarity = 0.0
         
+        if CDIST_AVAILABLE and similarity_backend() == "rapidfuzz":
+            # Схожесть со всеми абзацами одним пакетным вызовом; argmax выбирает
+            # первый из лучших, как и последовательный перебор ниже
+            scores = similarity_matrix([normalized_text], normalized_texts, min_similarity)[0]
+            if excluded_indices:
+                scores[list(excluded_indices)] = 0.0
+            if len(scores):
+                idx = int(np.argmax(scores))
+                if scores[idx] > 0.0:
+                    best_idx, best_similarity = idx, float(scores[idx])
+            return best_idx, best_similarity
+        
         for idx, normalized_para_text in enumerate(normalized_texts):
             if idx in excluded_indices:
                 continue
             
-            # Сравниваем нормализованные тексты
-            similarity = difflib.SequenceMatcher(None, normalized_text, normalized_para_text).ratio()
+            # Сравниваем нормализованные тексты; кандидаты не лучше
+            # текущего лучшего отсекаются по порогу
+            similarity = text_ratio(normalized_text, normalized_para_text,
+                                    max(best_similarity, min_similarity))
             
             if similarity > best_similarity:
                 best_similarity = similarity
@@ -537,8 +745,8 @@ class Compare:
             return differences
         
         # Разбиваем на предложения для более точного сравнения
-        sentences1 = re.split(r'[.!?]\s+', norm1)
-        sentences2 = re.split(r'[.!?]\s+', norm2)
+        sentences1 = SENTENCE_END_RE.split(norm1)
+        sentences2 = SENTENCE_END_RE.split(norm2)
         
         # Если тексты короткие, сравниваем целиком
         if len(norm1) < 100 and len(norm2) < 100:
@@ -573,12 +781,8 @@ class Compare:
         
         # Если не нашли различий по предложениям, сравниваем по словам
         if not differences:
-            words1 = norm1.split()
-            words2 = norm2.split()
-            
             # Находим измененные фразы
-            matcher = difflib.SequenceMatcher(None, words1, words2)
-            opcodes = matcher.get_opcodes()
+            words1, words2, opcodes = word_opcodes(norm1, norm2)
             
             for tag, i1, i2, j1, j2 in opcodes:
                 if tag == 'delete':
@@ -658,7 +862,9 @@ class Compare:
                 
                 for t2 in tables2:
                     if t2["hash"] not in matched_hashes:
-                        similarity = self._calculate_similarity(t1["text"], t2["text"])
+                        similarity = self._calculate_similarity(
+                            t1["text"], t2["text"], max(best_similarity, 0.5)
+                        )
                         if similarity > best_similarity and similarity >= 0.5:
                             best_similarity = similarity
                             best_match = t2
@@ -957,8 +1163,8 @@ class Compare:
                 else:
                     # Поиск конкретных изменений
                     # Версии
-                    version1_match = re.search(r'верси[ияею]\s+([\d.]+)', text1, re.IGNORECASE)
-                    version2_match = re.search(r'верси[ияею]\s+([\d.]+)', text2, re.IGNORECASE)
+                    version1_match = VERSION_NUMBER_RE.search(text1)
+                    version2_match = VERSION_NUMBER_RE.search(text2)
                     
                     if version1_match and version2_match and version1_match.group(1) != version2_match.group(1):
                         change_text_parts.append(
@@ -966,10 +1172,7 @@ class Compare:
                         )
                     else:
                         # Находим измененные фразы
-                        words1 = norm1.split()
-                        words2 = norm2.split()
-                        matcher = difflib.SequenceMatcher(None, words1, words2)
-                        opcodes = matcher.get_opcodes()
+                        words1, words2, opcodes = word_opcodes(norm1, norm2)
                         
                         changes_found = False
                         for tag, i1, i2, j1, j2 in opcodes:
@@ -1063,57 +1266,32 @@ class Compare:
         norm1 = self._normalize_text(text1).lower()
         norm2 = self._normalize_text(text2).lower()
         
-        # Паттерны для версии документа
-        version_patterns = [
-            r'верси[яиюе]\s*:?\s*(\d+\.?\d*\.?\d*)',
-            r'version\s*:?\s*(\d+\.?\d*\.?\d*)',
-            r'v\.?\s*(\d+\.?\d*\.?\d*)',
-            r'ревизи[яиюе]\s*:?\s*(\d+\.?\d*\.?\d*)',
-            r'revision\s*:?\s*(\d+\.?\d*\.?\d*)',
-            r'ред\.?\s*(\d+\.?\d*\.?\d*)'
-        ]
-        
         # Проверка на изменение версии
-        for pattern in version_patterns:
-            match1 = re.search(pattern, text1, re.IGNORECASE)
-            match2 = re.search(pattern, text2, re.IGNORECASE)
-            if match1 and match2 and match1.group(1) != match2.group(1):
-                return True
-        
-        # Паттерны для количества листов/страниц
-        page_patterns = [
-            r'лист[ов]?\s*:?\s*(\d+)',
-            r'страниц[аы]?\s*:?\s*(\d+)',
-            r'pages?\s*:?\s*(\d+)',
-            r'всего\s+лист[ов]?\s*:?\s*(\d+)',
-            r'количество\s+лист[ов]?\s*:?\s*(\d+)'
-        ]
+        if find_numbered_change(VERSION_MARKER_RE, VERSION_PATTERNS, text1, text2):
+            return True
         
         # Проверка на изменение количества листов
-        for pattern in page_patterns:
-            match1 = re.search(pattern, text1, re.IGNORECASE)
-            match2 = re.search(pattern, text2, re.IGNORECASE)
-            if match1 and match2 and match1.group(1) != match2.group(1):
-                return True
+        if find_numbered_change(PAGE_COUNT_MARKER_RE, PAGE_COUNT_PATTERNS, text1, text2):
+            return True
         
         # Проверка на орфографические и пунктуационные исправления
         # Если тексты очень похожи, но отличаются только небольшими изменениями
         # (например, запятые, точки, исправление опечаток)
-        similarity = self._calculate_similarity(text1, text2)
+        similarity = self._calculate_similarity(text1, text2, 0.9)
         
         # Если схожесть высокая (>0.9), но есть различия - возможно это правки
         if similarity > 0.9:
             # Подсчет различий в символах (исключая пробелы)
-            chars1 = re.sub(r'\s+', '', norm1)
-            chars2 = re.sub(r'\s+', '', norm2)
+            chars1 = WHITESPACE_RE.sub('', norm1)
+            chars2 = WHITESPACE_RE.sub('', norm2)
             
             # Если разница в символах небольшая (<10%), возможно это правки
             if len(chars1) > 0 and len(chars2) > 0:
                 char_diff = abs(len(chars1) - len(chars2)) / max(len(chars1), len(chars2))
                 if char_diff < 0.1:  # Разница менее 10%
                     # Проверяем, что основные слова совпадают
-                    words1_set = set(re.findall(r'\b\w+\b', norm1))
-                    words2_set = set(re.findall(r'\b\w+\b', norm2))
+                    words1_set = set(WORD_RE.findall(norm1))
+                    words2_set = set(WORD_RE.findall(norm2))
                     word_overlap = len(words1_set & words2_set) / max(len(words1_set), len(words2_set), 1)
                     if word_overlap > 0.95:  # 95% слов совпадают
                         return True
@@ -1139,49 +1317,28 @@ class Compare:
             norm2 = self._normalize_text(text2).lower()
             
             # Проверка на версию документа
-            version_patterns = [
-                r'верси[яиюе]\s*:?\s*(\d+\.?\d*\.?\d*)',
-                r'version\s*:?\s*(\d+\.?\d*\.?\d*)',
-                r'v\.?\s*(\d+\.?\d*\.?\d*)',
-                r'ревизи[яиюе]\s*:?\s*(\d+\.?\d*\.?\d*)',
-                r'revision\s*:?\s*(\d+\.?\d*\.?\d*)',
-                r'ред\.?\s*(\d+\.?\d*\.?\d*)'
-            ]
-            
-            for pattern in version_patterns:
-                match1 = re.search(pattern, text1, re.IGNORECASE)
-                match2 = re.search(pattern, text2, re.IGNORECASE)
-                if match1 and match2 and match1.group(1) != match2.group(1):
-                    return f"Исправление версии документа ({match1.group(1)} → {match2.group(1)})"
+            change = find_numbered_change(VERSION_MARKER_RE, VERSION_PATTERNS, text1, text2)
+            if change:
+                return f"Исправление версии документа ({change[0]} → {change[1]})"
             
             # Проверка на количество листов
-            page_patterns = [
-                r'лист[ов]?\s*:?\s*(\d+)',
-                r'страниц[аы]?\s*:?\s*(\d+)',
-                r'pages?\s*:?\s*(\d+)',
-                r'всего\s+лист[ов]?\s*:?\s*(\d+)',
-                r'количество\s+лист[ов]?\s*:?\s*(\d+)'
-            ]
-            
-            for pattern in page_patterns:
-                match1 = re.search(pattern, text1, re.IGNORECASE)
-                match2 = re.search(pattern, text2, re.IGNORECASE)
-                if match1 and match2 and match1.group(1) != match2.group(1):
-                    return f"Актуализация количества листов ({match1.group(1)} → {match2.group(1)})"
+            change = find_numbered_change(PAGE_COUNT_MARKER_RE, PAGE_COUNT_PATTERNS, text1, text2)
+            if change:
+                return f"Актуализация количества листов ({change[0]} → {change[1]})"
             
             # Проверка на орфографические и пунктуационные ошибки
             # Если тексты очень похожи, но есть небольшие различия
-            similarity = self._calculate_similarity(text1, text2)
+            similarity = self._calculate_similarity(text1, text2, 0.9)
             if similarity > 0.9:
                 # Подсчет различий в пунктуации
-                punct1 = re.findall(r'[.,;:!?—–-]', text1)
-                punct2 = re.findall(r'[.,;:!?—–-]', text2)
+                punct1 = PUNCTUATION_RE.findall(text1)
+                punct2 = PUNCTUATION_RE.findall(text2)
                 if len(punct1) != len(punct2):
                     return "Исправление пунктуации"
                 
                 # Проверка на орфографические ошибки (изменение отдельных букв в словах)
-                words1 = re.findall(r'\b\w+\b', norm1)
-                words2 = re.findall(r'\b\w+\b', norm2)
+                words1 = WORD_RE.findall(norm1)
+                words2 = WORD_RE.findall(norm2)
                 
                 if len(words1) == len(words2):
                     # Проверяем, есть ли слова с небольшими различиями
@@ -1358,7 +1515,8 @@ class Compare:
             
             context = "; ".join(context_parts) if context_parts else None
             
-            # Анализ в зависимости от статуса
+            # Анализ в зависимости от статуса (None - запрос не отправлялся)
+            llm_response = None
             if status == "modified" and text1 and text2:
                 # Для измененных элементов - сравниваем оба текста
                 llm_response = self.llm_adapter.analyze_changes(text1, text2, context)
@@ -1374,6 +1532,10 @@ class Compare:
                 llm_response = self.llm_adapter.analyze_changes(text1, "", context)
                 result["llm_response"] = llm_response
             
+            # Пустой ответ на отправленный запрос - ошибка LLM
+            if llm_response == "":
+                self.llm_failures += 1
+            
             # Если LLM не вернул ответ, ставим "Без изменений"
             if not result.get("llm_response"):
                 result["llm_response"] = "Без изменений"
@@ -1484,6 +1646,10 @@ class Compare:
         if llm_responses_with_pages:
             logger.info(f"Генерация краткого описания на основе {len(llm_responses_with_pages)} изменений...")
             summary = self.llm_adapter.generate_summary(llm_responses_with_pages)
+            if not summary:
+                # generate_summary возвращает None при ошибке запроса
+                self.llm_failures += 1
+                return "Общие правки."
             logger.info("Краткое описание сгенерировано.")
             return summary
         else:
@@ -1497,20 +1663,26 @@ class Compare:
             Словарь со статистикой, включая статистику по типам изменений
         """
         total = len(self.comparison_results)
-        identical = sum(1 for r in self.comparison_results if r["status"] == "identical")
-        modified = sum(1 for r in self.comparison_results if r["status"] == "modified")
-        added = sum(1 for r in self.comparison_results if r["status"] == "added")
-        deleted = sum(1 for r in self.comparison_results if r["status"] == "deleted")
         
-        # Статистика по типам изменений
+        # Статусы, типы изменений и LLM анализ считаются за один проход
+        status_counts = {}
         change_types = {}
+        llm_analyzed = 0
         for result in self.comparison_results:
+            status = result["status"]
+            status_counts[status] = status_counts.get(status, 0) + 1
+            
             change_type = result.get("change_type", "Не определен")
             if change_type:
                 change_types[change_type] = change_types.get(change_type, 0) + 1
+            
+            if result.get("llm_response"):
+                llm_analyzed += 1
         
-        # Статистика по LLM анализу
-        llm_analyzed = sum(1 for r in self.comparison_results if r.get("llm_response"))
+        identical = status_counts.get("identical", 0)
+        modified = status_counts.get("modified", 0)
+        added = status_counts.get("added", 0)
+        deleted = status_counts.get("deleted", 0)
         
         # Статистика по таблицам
         tables1 = self.file1.get_tables()
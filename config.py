@@ -5,7 +5,7 @@
 Позволяет легко изменять параметры без модификации основного кода.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 import os
 
@@ -26,6 +26,14 @@ class ComparisonConfig:
     # Параметры отпечатков текста
     fingerprint_first_words: int = 5  # Количество первых слов для отпечатка
     fingerprint_last_words: int = 5  # Количество последних слов для отпечатка
+    
+    # Реализация коэффициента схожести: "difflib" (стандартная библиотека)
+    # или "rapidfuzz" (нативный код, если пакет установлен). Значения
+    # немного различаются, поэтому по умолчанию - difflib во всех окружениях
+    similarity_backend: str = "difflib"
+    
+    # Параметры выравнивания абзацев (алгоритм Myers)
+    diff_min_common_ratio: float = 0.0  # Доля общих абзацев, не выше которой фрагмент считается замененным целиком
 
 
 @dataclass
@@ -75,6 +83,29 @@ class ExcelExportConfig:
     max_column_width: int = 100  # Максимальная ширина столбца
 
 
+def _default_cache_directory() -> str:
+    """
+    Папка кэша текущего пользователя.
+    
+    Windows: %LOCALAPPDATA%\\compareDocx, остальные системы:
+    $XDG_CACHE_HOME/compareDocx или ~/.cache/compareDocx.
+    """
+    if os.name == "nt":
+        base = os.getenv("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), "AppData", "Local")
+    else:
+        base = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "compareDocx")
+
+
+@dataclass
+class CacheConfig:
+    """Конфигурация для кэширования результатов сравнения."""
+    
+    enabled: bool = False  # Кэш отключен по умолчанию (включается флагом --cache или CACHE_ENABLED=1)
+    directory: str = field(default_factory=_default_cache_directory)  # Папка для файлов кэша
+    max_entries: int = 32  # Максимальное количество записей (старые вытесняются)
+
+
 class Config:
     """
     Главный класс конфигурации проекта.
@@ -89,6 +120,7 @@ class Config:
         self.document = DocumentConfig()
         self.llm = LLMConfig()
         self.excel = ExcelExportConfig()
+        self.cache = CacheConfig()
         
         # Загрузка настроек из переменных окружения (если есть)
         self._load_from_env()
@@ -101,6 +133,9 @@ class Config:
                 os.getenv("COMPARISON_SIMILARITY_THRESHOLD_MEDIUM")
             )
         
+        if os.getenv("COMPARISON_SIMILARITY_BACKEND"):
+            self.comparison.similarity_backend = os.getenv("COMPARISON_SIMILARITY_BACKEND").lower()
+        
         # Документы
         if os.getenv("DOCUMENT_CHARS_PER_PAGE"):
             self.document.chars_per_page = int(os.getenv("DOCUMENT_CHARS_PER_PAGE"))
@@ -108,6 +143,13 @@ class Config:
         if os.getenv("DOCUMENT_MAX_FILE_SIZE_MB"):
             self.document.max_file_size_mb = int(os.getenv("DOCUMENT_MAX_FILE_SIZE_MB"))
         
+        # Кэш
+        if os.getenv("CACHE_DIR"):
+            self.cache.directory = os.getenv("CACHE_DIR")
+        
+        if os.getenv("CACHE_ENABLED"):
+            self.cache.enabled = os.getenv("CACHE_ENABLED").lower() not in ("0", "false", "no")
+        
         # LLM
         if os.getenv("LLM_TIMEOUT_SECONDS"):
             self.llm.timeout_seconds = int(os.getenv("LLM_TIMEOUT_SECONDS"))
@@ -11,6 +11,7 @@ from typing import List, Dict, Optional, Tuple
 import re
 import hashlib
 import io
+import mmap
 from config import config
 from logger_config import logger
 from exceptions import DocumentLoadError, DocumentParseError, ValidationError
@@ -42,21 +43,37 @@ except ImportError:
         RESET_ALL = ''
 
 
+class _MappedFile(mmap.mmap):
+    """
+    Отображение файла в память, пригодное для передачи в zipfile.
+    
+    До Python 3.13 у mmap нет метода seekable(), который требуется zipfile.
+    """
+    
+    def seekable(self) -> bool:
+        return True
+
+
 class DocxFile:
     """Класс для работы с DOCX файлами."""
     
-    def __init__(self, file_path: str):
+    # Атрибуты с результатами парсинга, сохраняемые в кэш
+    _PARSED_ATTRIBUTES = ("paragraphs", "sections", "chapters", "tables", "images")
+    
+    def __init__(self, file_path: str, use_cache: Optional[bool] = None):
         """
         Инициализация класса.
         
         Args:
             file_path: Путь к DOCX файлу
+            use_cache: Использовать кэш парсинга; None - по config.cache.enabled
         
         Raises:
             DocumentLoadError: Если не удалось загрузить документ
             DocumentParseError: Если произошла ошибка при парсинге
         """
         self.file_path = file_path
+        self.use_cache = config.cache.enabled if use_cache is None else use_cache
         
         # Валидация размера файла
         try:
@@ -66,9 +83,16 @@ class DocxFile:
             logger.error(f"Ошибка валидации файла {file_path}: {e}")
             raise DocumentLoadError(file_path, str(e))
         
+        # Документ открывается только при обращении к self.document,
+        # при попадании в кэш парсинга файл не распаковывается
+        self._document = None
+        self._paragraph_columns = None
+        if self._load_parsed_from_cache():
+            return
+        
         # Загрузка документа
         try:
-            self.document = Document(file_path)
+            self._document = self._open_document(file_path)
             logger.debug(f"Документ загружен: {file_path}")
         except Exception as e:
             logger.error(f"Ошибка загрузки документа {file_path}: {e}")
@@ -91,6 +115,80 @@ class DocxFile:
         except Exception as e:
             logger.error(f"Ошибка парсинга документа {file_path}: {e}")
             raise DocumentParseError(file_path, str(e))
+        
+        self._save_parsed_to_cache()
+    
+    @property
+    def document(self):
+        """Объект docx.Document (открывается при первом обращении)."""
+        if self._document is None:
+            self._document = self._open_document(self.file_path)
+        return self._document
+    
+    def _parse_cache_key(self) -> Optional[str]:
+        """Ключ кэша парсинга или None, если кэш отключен или недоступен."""
+        if not self.use_cache:
+            return None
+        # Импорт здесь, так как result_cache зависит от compare, а тот - от docx_file
+        from result_cache import make_parse_key
+        try:
+            return make_parse_key(self.file_path)
+        except OSError:
+            return None
+    
+    def _load_parsed_from_cache(self) -> bool:
+        """
+        Загрузка результатов парсинга из кэша.
+        
+        Returns:
+            True, если результаты загружены из кэша
+        """
+        key = self._parse_cache_key()
+        if key is None:
+            return False
+        from result_cache import load_results, PARSED_SUBDIR
+        state = load_results(key, PARSED_SUBDIR)
+        if state is None:
+            return False
+        for name in self._PARSED_ATTRIBUTES:
+            setattr(self, name, state[name])
+        self.hierarchy_stack = []
+        return True
+    
+    def _save_parsed_to_cache(self):
+        """Сохранение результатов парсинга в кэш."""
+        key = self._parse_cache_key()
+        if key is None:
+            return
+        from result_cache import save_results, PARSED_SUBDIR
+        state = {name: getattr(self, name) for name in self._PARSED_ATTRIBUTES}
+        save_results(key, state, PARSED_SUBDIR)
+    
+    @staticmethod
+    def _open_document(file_path: str):
+        """
+        Открытие DOCX файла через отображение в память (mmap).
+        
+        zipfile читает части архива напрямую из страничного кэша ОС,
+        без промежуточного копирования файла в пользовательскую память.
+        python-docx считывает все части при открытии, поэтому отображение
+        закрывается сразу после загрузки.
+        
+        Args:
+            file_path: Путь к DOCX файлу
+            
+        Returns:
+            Объект docx.Document
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                mapped = _MappedFile(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Пустой файл или файловая система без поддержки mmap
+            return Document(file_path)
+        
+        with mapped:
+            return Document(mapped)
     
     def _parse_document(self):
         """Парсинг документа: извлечение абзацев, разделов, глав, таблиц и изображений."""
@@ -367,6 +465,28 @@ class DocxFile:
         """
         return self.paragraphs
     
+    def get_paragraph_columns(self) -> Dict[str, List]:
+        """
+        Получить поля абзацев в виде столбцов (строится при первом вызове).
+        
+        Столбцы выровнены по позиции: i-й элемент каждого из них относится
+        к i-му абзацу get_all_paragraphs(). Пакетная обработка (нормализация,
+        отпечатки, пакетное вычисление схожести) работает со списком
+        значений одного поля без обращения к словарю каждого абзаца.
+        
+        Returns:
+            Словарь {"text": [...], "index": [...], "page": [...], "full_path": [...]}
+        """
+        if self._paragraph_columns is None:
+            paragraphs = self.paragraphs
+            self._paragraph_columns = {
+                "text": [p["text"] for p in paragraphs],
+                "index": [p.get("index") for p in paragraphs],
+                "page": [p.get("page") for p in paragraphs],
+                "full_path": [p.get("full_path", "") for p in paragraphs],
+            }
+        return self._paragraph_columns
+    
     def get_sections(self) -> List[Dict]:
         """
         Получить все разделы документа.
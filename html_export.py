@@ -8,7 +8,7 @@
 - Удобного просмотра в браузере
 """
 
-from typing import List, Dict, Optional
+from typing import Dict, Iterator, List, Optional
 from pathlib import Path
 from datetime import datetime
 from logger_config import logger
@@ -56,15 +56,13 @@ class HTMLExporter:
             image_changes: Список изменений изображений
         """
         try:
-            html_content = self._generate_html(
-                comparison_results, statistics, file1_name, file2_name,
-                table_changes, image_changes, summary_changes
-            )
-            
-            # Сохранение файла
+            # Сохранение файла: части HTML записываются по мере генерации
             self.output_path.parent.mkdir(parents=True, exist_ok=True)
             with open(self.output_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+                f.writelines(self._iter_html(
+                    comparison_results, statistics, file1_name, file2_name,
+                    table_changes, image_changes, summary_changes
+                ))
             
             logger.info(f"Результаты экспортированы в HTML: {self.output_path}")
             
@@ -72,17 +70,22 @@ class HTMLExporter:
             logger.error(f"Ошибка при экспорте в HTML: {e}")
             raise ExportError(str(self.output_path), str(e))
     
-    def _generate_html(self, comparison_results: List[Dict],
-                      statistics: Dict, file1_name: str, file2_name: str,
-                      table_changes: List[Dict] = None,
-                      image_changes: List[Dict] = None,
-                      summary_changes: str = "") -> str:
-        """Генерация HTML контента."""
+    def _iter_html(self, comparison_results: List[Dict],
+                   statistics: Dict, file1_name: str, file2_name: str,
+                   table_changes: List[Dict] = None,
+                   image_changes: List[Dict] = None,
+                   summary_changes: str = "") -> Iterator[str]:
+        """
+        Генерация HTML контента по частям.
+        
+        Части (шапка, строки таблиц, скрипт) отдаются по мере формирования,
+        что позволяет записывать их в файл без сборки всей страницы в памяти.
+        """
         
         # Фильтруем только изменения
         changes_only = [r for r in comparison_results if r.get("status") != "identical"]
         
-        html = f"""<!DOCTYPE html>
+        yield f"""<!DOCTYPE html>
 <html lang="ru">
 <head>
     <meta charset="UTF-8">
@@ -362,7 +365,7 @@ class HTMLExporter:
             if not llm_resp:
                 llm_resp = 'Без изменений'
             
-            html += f"""
+            yield f"""
                     <tr class="{status_class}">
                         <td>{idx}</td>
                         <td><span class="badge {badge_class}">{status_ru}</span></td>
@@ -378,7 +381,7 @@ class HTMLExporter:
                     </tr>
 """
         
-        html += """
+        yield """
                 </tbody>
             </table>
         </div>
@@ -386,7 +389,7 @@ class HTMLExporter:
         
         # Таблицы
         if table_changes:
-            html += f"""
+            yield f"""
         <h2 class="section-toggle" onclick="toggleSection('tables')">📊 Изменения в таблицах</h2>
         <div id="tables" class="section-content">
             <table>
@@ -403,7 +406,7 @@ class HTMLExporter:
                 <tbody>
 """
             for idx, change in enumerate(table_changes, 1):
-                html += f"""
+                yield f"""
                     <tr>
                         <td>{idx}</td>
                         <td>{change.get('status', '')}</td>
@@ -413,7 +416,7 @@ class HTMLExporter:
                         <td>{self._escape_html(change.get('change_description', ''))}</td>
                     </tr>
 """
-            html += """
+            yield """
                 </tbody>
             </table>
         </div>
@@ -421,7 +424,7 @@ class HTMLExporter:
         
         # Изображения
         if image_changes:
-            html += f"""
+            yield f"""
         <h2 class="section-toggle" onclick="toggleSection('images')">🖼️ Изменения в изображениях</h2>
         <div id="images" class="section-content">
             <table>
@@ -438,7 +441,7 @@ class HTMLExporter:
                 <tbody>
 """
             for idx, change in enumerate(image_changes, 1):
-                html += f"""
+                yield f"""
                     <tr>
                         <td>{idx}</td>
                         <td>{change.get('status', '')}</td>
@@ -448,14 +451,14 @@ class HTMLExporter:
                         <td>{self._escape_html(change.get('change_description', ''))}</td>
                     </tr>
 """
-            html += """
+            yield """
                 </tbody>
             </table>
         </div>
 """
         
         # JavaScript для фильтрации и поиска
-        html += """
+        yield """
         <script>
             function toggleSection(sectionId) {
                 const section = document.getElementById(sectionId);
@@ -514,8 +517,6 @@ class HTMLExporter:
 </body>
 </html>
 """
-        
-        return html
     
     def _escape_html(self, text: str) -> str:
         """Экранирование HTML символов."""
@@ -8,18 +8,27 @@
 """
 
 import json
+from collections import Counter
 from typing import List, Dict, Optional
 from pathlib import Path
 from datetime import datetime
 from logger_config import logger
 from exceptions import ExportError
 
+# Импорт orjson для быстрой сериализации (опционально)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class JSONExporter:
     """
     Класс для экспорта результатов сравнения в JSON.
     
     Создает структурированный JSON файл с:
+    - Сводкой по количеству изменений (summary)
     - Детальным сравнением абзацев
     - Статистикой сравнения
     - Изменениями в таблицах и изображениях
@@ -81,22 +90,33 @@ class JSONExporter:
                     "total_original": len(comparison_results),
                     "summary_changes": summary_changes
                 },
+                # Сводка расположена в начале файла: ее можно прочитать,
+                # не разбирая весь список результатов
+                "summary": JSONExporter._build_summary(filtered_results, table_changes, image_changes),
                 "statistics": statistics,
                 "comparison_results": filtered_results,
                 "table_changes": table_changes or [],
                 "image_changes": image_changes or []
             }
             
-            # Сериализация в JSON
-            if self.pretty:
-                json_str = json.dumps(export_data, ensure_ascii=False, indent=2)
-            else:
-                json_str = json.dumps(export_data, ensure_ascii=False, separators=(',', ':'))
-            
-            # Сохранение файла
+            # Сериализация в JSON и сохранение файла
             self.output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.output_path, 'w', encoding='utf-8') as f:
-                f.write(json_str)
+            if ORJSON_AVAILABLE:
+                # orjson сразу возвращает UTF-8 байты, без промежуточной строки
+                option = orjson.OPT_NON_STR_KEYS
+                if self.pretty:
+                    option |= orjson.OPT_INDENT_2
+                with open(self.output_path, 'wb') as f:
+                    f.write(orjson.dumps(export_data, option=option))
+            else:
+                # json.dump пишет в файл по частям, без промежуточной строки
+                # со всем документом
+                if self.pretty:
+                    dump_options = {"indent": 2}
+                else:
+                    dump_options = {"separators": (',', ':')}
+                with open(self.output_path, 'w', encoding='utf-8') as f:
+                    json.dump(export_data, f, ensure_ascii=False, **dump_options)
             
             logger.info(f"Результаты экспортированы в JSON: {self.output_path}")
             
@@ -104,6 +124,39 @@ class JSONExporter:
             logger.error(f"Ошибка при экспорте в JSON: {e}")
             raise ExportError(str(self.output_path), str(e))
     
+    @staticmethod
+    def _build_summary(results: List[Dict], table_changes: Optional[List[Dict]],
+                       image_changes: Optional[List[Dict]]) -> Dict:
+        """
+        Подсчет сводки по экспортируемым результатам за один проход.
+        
+        Args:
+            results: Экспортируемые (отфильтрованные) результаты сравнения
+            table_changes: Список изменений таблиц
+            image_changes: Список изменений изображений
+        
+        Returns:
+            Словарь с количеством результатов по статусам, с LLM ответом,
+            изменений таблиц и изображений
+        """
+        statuses = Counter()
+        with_llm = 0
+        for result in results:
+            statuses[result.get("status")] += 1
+            if result.get("llm_response"):
+                with_llm += 1
+        
+        return {
+            "total": len(results),
+            "identical": statuses["identical"],
+            "modified": statuses["modified"],
+            "added": statuses["added"],
+            "deleted": statuses["deleted"],
+            "with_llm": with_llm,
+            "tables": len(table_changes or []),
+            "images": len(image_changes or [])
+        }
+    
     @staticmethod
     def _apply_filters(exporter_instance, results: List[Dict], filters: Optional[Dict]) -> List[Dict]:
         """
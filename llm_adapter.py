@@ -303,19 +303,7 @@ class LLMAdapter:
                 }
                 
                 # Дополнительные параметры из переменных окружения (для Cloud.ru и других провайдеров)
-                presence_penalty = os.getenv("OPENAI_PRESENCE_PENALTY")
-                if presence_penalty:
-                    try:
-                        request_params["presence_penalty"] = float(presence_penalty)
-                    except (ValueError, TypeError):
-                        pass
-                
-                top_p = os.getenv("OPENAI_TOP_P")
-                if top_p:
-                    try:
-                        request_params["top_p"] = float(top_p)
-                    except (ValueError, TypeError):
-                        pass
+                request_params.update(self._extra_request_params())
                 
                 response = self.client.chat.completions.create(**request_params)
                 
@@ -395,6 +383,45 @@ class LLMAdapter:
         """
         return self.enabled
     
+    def _extra_request_params(self) -> Dict[str, float]:
+        """
+        Дополнительные параметры генерации из переменных окружения.
+        
+        OPENAI_PRESENCE_PENALTY и OPENAI_TOP_P (для Cloud.ru и других провайдеров);
+        некорректные значения пропускаются.
+        
+        Returns:
+            Словарь параметров запроса, заданных в окружении
+        """
+        params = {}
+        for name, env_var in (("presence_penalty", "OPENAI_PRESENCE_PENALTY"),
+                              ("top_p", "OPENAI_TOP_P")):
+            value = os.getenv(env_var)
+            if value:
+                try:
+                    params[name] = float(value)
+                except (ValueError, TypeError):
+                    pass
+        return params
+    
+    def get_request_params(self) -> Dict:
+        """
+        Параметры, от которых зависят ответы LLM.
+        
+        Используются в ключе кэша результатов (см. result_cache): при изменении
+        модели, адреса API или параметров генерации старые записи не используются.
+        
+        Returns:
+            Словарь с адресом API, моделью и параметрами генерации
+        """
+        return {
+            "api_url": self.api_url,
+            "model": self.model,
+            "temperature": self.temperature,
+            "max_tokens": self.max_tokens,
+            **self._extra_request_params()
+        }
+    
     def get_model_info(self) -> Dict[str, str]:
         """
         Получение информации о настройках модели.
@@ -409,7 +436,7 @@ class LLMAdapter:
             "enabled": str(self.enabled)
         }
     
-    def generate_summary(self, llm_responses: list) -> str:
+    def generate_summary(self, llm_responses: list) -> Optional[str]:
         """
         Генерация краткого смыслового описания всех изменений на основе LLM ответов.
         
@@ -422,9 +449,10 @@ class LLMAdapter:
         
         Returns:
             Краткое смысловое описание изменений в формате нумерованного списка
+            или None, если описание получить не удалось
         """
         if not self.enabled or not self.client:
-            return "Общие правки."
+            return None
         
         # Обрабатываем входные данные: могут быть словари или строки
         processed_responses = []
@@ -449,7 +477,7 @@ class LLMAdapter:
         
         if not processed_responses:
             logger.warning("Нет LLM ответов для генерации краткого описания")
-            return "Общие правки."
+            return None
         
         # Загружаем промпт для краткого описания
         summary_prompt_file = Path(__file__).parent / "prompts" / "summary_prompt.txt"
@@ -523,19 +551,7 @@ class LLMAdapter:
                 }
                 
                 # Дополнительные параметры из переменных окружения
-                presence_penalty = os.getenv("OPENAI_PRESENCE_PENALTY")
-                if presence_penalty:
-                    try:
-                        request_params["presence_penalty"] = float(presence_penalty)
-                    except (ValueError, TypeError):
-                        pass
-                
-                top_p = os.getenv("OPENAI_TOP_P")
-                if top_p:
-                    try:
-                        request_params["top_p"] = float(top_p)
-                    except (ValueError, TypeError):
-                        pass
+                request_params.update(self._extra_request_params())
                 
                 response = self.client.chat.completions.create(**request_params)
                 
@@ -570,7 +586,7 @@ class LLMAdapter:
                             return result
                         else:
                             logger.warning("LLM вернул пустой ответ после strip() для краткого описания")
-                            return "Общие правки."
+                            return None
                     else:
                         logger.warning(f"LLM вернул None для краткого описания. Finish reason: {finish_reason}")
                         # Если ответ был обрезан из-за лимита токенов, увеличиваем лимит и пробуем снова
@@ -590,10 +606,10 @@ class LLMAdapter:
                             delay = retry_delay * (2 ** attempt)
                             time.sleep(delay)
                             continue
-                        return "Общие правки."
+                        return None
                 else:
                     logger.warning("LLM не вернул choices для краткого описания")
-                    return "Общие правки."
+                    return None
                     
             except Exception as e:
                 error_msg = str(e)
@@ -601,10 +617,10 @@ class LLMAdapter:
                 
                 if attempt == max_retries - 1:
                     logger.error(f"Не удалось сгенерировать краткое описание: {error_msg}")
-                    return "Общие правки."
+                    return None
                 
                 delay = retry_delay * (2 ** attempt)
                 time.sleep(delay)
         
-        return "Общие правки."
+        return None
 
@@ -6,7 +6,7 @@
 2. Интерактивный режим - ввод путей при запуске
 
 Использование:
-    python main.py файл1.docx файл2.docx результат.xlsx
+    python main.py файл1.docx файл2.docx результат.xlsx [--cache | --no-cache]
     или
     python main.py  # интерактивный режим
 """
@@ -15,10 +15,10 @@ import sys
 import os
 from pathlib import Path
 from datetime import datetime
-from compare import Compare
+from result_cache import get_comparison_bundle
 from excel_export import ExcelExporter
 from llm_adapter import LLMAdapter
-from validators import validate_file_path, validate_output_path
+from validators import validate_file_paths, validate_output_path
 from logger_config import logger
 from exceptions import CompareDocxError
 
@@ -45,12 +45,21 @@ def main():
     print("Сравнение DOCX документов")
     print("=" * 60)
     
+    # Кэш отключен по умолчанию: --cache включает его, --no-cache отключает
+    # даже при CACHE_ENABLED
+    argv = [arg for arg in sys.argv if arg not in ("--cache", "--no-cache")]
+    use_cache = None
+    if "--cache" in sys.argv:
+        use_cache = True
+    elif "--no-cache" in sys.argv:
+        use_cache = False
+    
     # Получение путей к файлам
-    if len(sys.argv) >= 3:
+    if len(argv) >= 3:
         # Режим командной строки
-        file1_path = sys.argv[1]  # Первый документ (базовый)
-        file2_path = sys.argv[2]  # Второй документ (измененный)
-        output_path = sys.argv[3] if len(sys.argv) >= 4 else "comparison_result.xlsx"  # Выходной файл
+        file1_path = argv[1]  # Первый документ (базовый)
+        file2_path = argv[2]  # Второй документ (измененный)
+        output_path = argv[3] if len(argv) >= 4 else "comparison_result.xlsx"  # Выходной файл
     else:
         # Интерактивный режим - запрос путей у пользователя
         print("\nВведите пути к файлам для сравнения:")
@@ -63,8 +72,9 @@ def main():
     
     # Валидация путей к файлам
     try:
-        file1_path, file1_path_obj = validate_file_path(file1_path)
-        file2_path, file2_path_obj = validate_file_path(file2_path)
+        (file1_path, file1_path_obj), (file2_path, file2_path_obj) = validate_file_paths(
+            [file1_path, file2_path]
+        )
         output_path_obj = validate_output_path(output_path)
         output_path = str(output_path_obj)
         logger.info(f"Валидация файлов успешна")
@@ -109,14 +119,15 @@ def main():
         # - Сравнение изображений
         # - Дополнительный анализ через LLM (если адаптер доступен)
         print("\nВыполнение сравнения...")
-        comparator = Compare(file1_path, file2_path, llm_adapter=llm_adapter)
+        # Повторное сравнение тех же файлов берется из кэша результатов
+        bundle = get_comparison_bundle(file1_path, file2_path, llm_adapter=llm_adapter, use_cache=use_cache)
         
         # Шаг 3: Получение результатов
-        results = comparator.get_comparison_results()  # Результаты сравнения абзацев
-        statistics = comparator.get_statistics()  # Общая статистика
-        table_changes = comparator.get_table_changes()  # Изменения в таблицах
-        image_changes = comparator.get_image_changes()  # Изменения в изображениях
-        summary_changes = comparator._generate_summary_changes()  # Краткое описание всех изменений
+        results = bundle["results"]  # Результаты сравнения абзацев
+        statistics = bundle["statistics"]  # Общая статистика
+        table_changes = bundle["table_changes"]  # Изменения в таблицах
+        image_changes = bundle["image_changes"]  # Изменения в изображениях
+        summary_changes = bundle["summary_changes"]  # Краткое описание всех изменений
         
         # Шаг 4: Вывод статистики
         print(f"\nОбработано абзацев: {statistics['total']}")
@@ -0,0 +1,304 @@
+"""
+Модуль для кэширования результатов сравнения на диске.
+
+При повторном сравнении тех же документов (типичный цикл разработки:
+сравнить, посмотреть результат, поправить промпт/экспорт, сравнить снова)
+весь конвейер от парсинга до LLM анализа пропускается, а результаты
+загружаются из кэша.
+
+Дополнительно кэшируется результат парсинга отдельных документов
+(см. DocxFile): повторное открытие того же файла не требует распаковки
+и разбора XML.
+
+Особенности:
+- Кэш отключен по умолчанию и включается флагом --cache
+  (или переменной окружения CACHE_ENABLED=1)
+- Ключ кэша строится по SHA-256 содержимого обоих файлов, исходного кода
+  модулей сравнения и парсинга, файлов промптов, реализации коэффициента
+  схожести, настройкам сравнения и параметрам запросов LLM (модель,
+  температура, лимит токенов и т.д.): после изменения кода
+  или промптов старые записи не используются
+- Результаты с неудавшимся LLM анализом в кэш не сохраняются
+- Кэш хранится в папке пользователя (см. config.cache.directory) в виде
+  pickle файлов и ограничен по количеству записей (LRU)
+- Кэш предназначен только для локальных результатов: pickle файлы
+  из недоверенных источников загружать нельзя
+"""
+
+import hashlib
+import os
+import pickle
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from compare import Compare, similarity_backend
+from config import config
+from logger_config import logger
+
+# Размер блока чтения при вычислении хеша файла
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Подпапка кэша для распарсенных документов
+PARSED_SUBDIR = "parsed"
+
+# Папка с исходным кодом проекта и папка промптов LLM
+SOURCE_DIR = Path(__file__).parent
+PROMPTS_DIR = SOURCE_DIR / "prompts"
+
+# Модули, от кода которых зависят результаты сравнения
+COMPARE_MODULES = ("compare", "docx_file", "sequence_diff", "llm_adapter")
+
+# Модули, от кода которых зависят результаты парсинга документа
+PARSER_MODULES = ("docx_file",)
+
+
+def file_hash(file_path: str) -> str:
+    """
+    Вычисление SHA-256 хеша содержимого файла.
+
+    Args:
+        file_path: Путь к файлу
+
+    Returns:
+        Шестнадцатеричная строка хеша
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=None)
+def source_hash(module_names: Tuple[str, ...]) -> str:
+    """
+    SHA-256 исходного кода модулей проекта.
+
+    Заменяет ручную версию алгоритма: любое изменение кода модулей
+    меняет ключ кэша. Загруженный код не меняется во время работы
+    процесса, поэтому хеш вычисляется один раз.
+
+    Args:
+        module_names: Имена модулей проекта (файлы <имя>.py в SOURCE_DIR)
+
+    Returns:
+        Шестнадцатеричная строка хеша
+    """
+    digest = hashlib.sha256()
+    for name in module_names:
+        digest.update(name.encode('utf-8'))
+        digest.update((SOURCE_DIR / f"{name}.py").read_bytes())
+    return digest.hexdigest()
+
+
+def prompts_hash() -> str:
+    """SHA-256 содержимого файлов промптов (prompts/*.txt)."""
+    digest = hashlib.sha256()
+    for prompt_file in sorted(PROMPTS_DIR.glob("*.txt")):
+        digest.update(prompt_file.name.encode('utf-8'))
+        digest.update(prompt_file.read_bytes())
+    return digest.hexdigest()
+
+
+def make_cache_key(file1_path: str, file2_path: str, llm_mode: str = "") -> str:
+    """
+    Построение ключа кэша для пары документов.
+
+    Args:
+        file1_path: Путь к первому DOCX файлу
+        file2_path: Путь ко второму DOCX файлу
+        llm_mode: Идентификатор режима LLM (параметры запросов, см.
+            LLMAdapter.get_request_params); пустая строка - без LLM
+
+    Returns:
+        Ключ кэша (SHA-256 от составного ключа)
+    """
+    key = "|".join([
+        file_hash(file1_path),
+        file_hash(file2_path),
+        source_hash(COMPARE_MODULES),
+        prompts_hash(),
+        similarity_backend(),
+        repr(config.comparison),
+        llm_mode,
+    ])
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+def llm_cache_mode(llm_adapter) -> str:
+    """
+    Идентификатор режима LLM для ключа кэша.
+
+    Args:
+        llm_adapter: Адаптер LLM
+
+    Returns:
+        Строка с параметрами запросов адаптера (см. LLMAdapter.get_request_params)
+    """
+    return repr(sorted(llm_adapter.get_request_params().items()))
+
+
+def make_parse_key(file_path: str) -> str:
+    """
+    Построение ключа кэша для распарсенного документа.
+
+    Ключ строится по метаданным файла (путь, время изменения, размер) без
+    чтения содержимого, поэтому проверка кэша обходится одним вызовом stat().
+    Исходный код парсера (PARSER_MODULES) также входит в ключ.
+
+    Args:
+        file_path: Путь к DOCX файлу
+
+    Returns:
+        Ключ кэша (SHA-256 от составного ключа)
+    """
+    stat = os.stat(file_path)
+    key = "|".join([
+        os.path.abspath(file_path),
+        str(stat.st_mtime_ns),
+        str(stat.st_size),
+        source_hash(PARSER_MODULES),
+        repr(config.document),
+    ])
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+def _cache_path(key: str, subdir: str = "") -> Path:
+    """Путь к файлу записи кэша."""
+    return Path(config.cache.directory) / subdir / f"{key}.pkl"
+
+
+def load_results(key: str, subdir: str = "") -> Optional[Dict]:
+    """
+    Загрузка результатов сравнения из кэша.
+
+    Args:
+        key: Ключ кэша (см. make_cache_key)
+        subdir: Подпапка кэша (например, PARSED_SUBDIR)
+
+    Returns:
+        Словарь с результатами сравнения или None, если записи нет
+    """
+    path = _cache_path(key, subdir)
+    try:
+        with open(path, 'rb') as f:
+            bundle = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        # Поврежденная или несовместимая запись - просто пересчитываем
+        logger.warning(f"Не удалось прочитать кэш {path}: {e}")
+        return None
+
+    # Обновляем время доступа для вытеснения по LRU
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+    logger.info(f"Данные загружены из кэша: {path}")
+    return bundle
+
+
+def save_results(key: str, bundle: Dict, subdir: str = "") -> None:
+    """
+    Сохранение результатов сравнения в кэш.
+
+    Ошибки записи не прерывают работу программы, а только логируются.
+
+    Args:
+        key: Ключ кэша (см. make_cache_key)
+        bundle: Словарь с результатами сравнения
+        subdir: Подпапка кэша (например, PARSED_SUBDIR)
+    """
+    path = _cache_path(key, subdir)
+    try:
+        # Папка кэша доступна только владельцу: записи загружаются через pickle
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Имя временного файла уникально для процесса: кэш может заполняться
+        # параллельно (например, тестами под pytest-xdist)
+        tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+        logger.debug(f"Данные сохранены в кэш: {path}")
+    except Exception as e:
+        logger.warning(f"Не удалось сохранить кэш {path}: {e}")
+        return
+
+    _evict(path.parent)
+
+
+def _evict(cache_dir: Path) -> None:
+    """Удаление самых старых записей кэша сверх config.cache.max_entries."""
+    try:
+        entries = [e for e in os.scandir(cache_dir) if e.name.endswith('.pkl')]
+    except OSError:
+        return
+
+    excess = len(entries) - config.cache.max_entries
+    if excess <= 0:
+        return
+
+    entries.sort(key=lambda e: e.stat().st_mtime)
+    for entry in entries[:excess]:
+        try:
+            os.unlink(entry.path)
+        except OSError:
+            pass
+
+
+def get_comparison_bundle(file1_path: str, file2_path: str, llm_adapter=None,
+                          use_cache: Optional[bool] = None) -> Dict:
+    """
+    Сравнение документов с использованием кэша результатов.
+
+    При попадании в кэш документы не парсятся и не сравниваются,
+    LLM запросы не выполняются.
+
+    Args:
+        file1_path: Путь к первому DOCX файлу (базовый документ)
+        file2_path: Путь ко второму DOCX файлу (измененный документ)
+        llm_adapter: Опциональный адаптер LLM
+        use_cache: Использовать кэш; None - по config.cache.enabled
+
+    Returns:
+        Словарь с ключами results, statistics, table_changes,
+        image_changes, summary_changes
+    """
+    if use_cache is None:
+        use_cache = config.cache.enabled
+
+    key = None
+    if use_cache:
+        llm_mode = ""
+        if llm_adapter and llm_adapter.is_enabled():
+            llm_mode = llm_cache_mode(llm_adapter)
+        try:
+            key = make_cache_key(file1_path, file2_path, llm_mode)
+        except OSError as e:
+            logger.warning(f"Не удалось вычислить ключ кэша: {e}")
+        if key:
+            bundle = load_results(key)
+            if bundle is not None:
+                return bundle
+
+    comparator = Compare(file1_path, file2_path, llm_adapter=llm_adapter, use_cache=use_cache)
+    bundle = {
+        "results": comparator.get_comparison_results(),
+        "statistics": comparator.get_statistics(),
+        "table_changes": comparator.get_table_changes(),
+        "image_changes": comparator.get_image_changes(),
+        "summary_changes": comparator._generate_summary_changes(),
+    }
+
+    if key:
+        if comparator.llm_failures:
+            # Иначе при следующих запусках возвращался бы неудавшийся анализ
+            logger.warning(
+                f"Результаты не сохранены в кэш: LLM анализ не удался "
+                f"для {comparator.llm_failures} элементов"
+            )
+        else:
+            save_results(key, bundle)
+    return bundle
@@ -0,0 +1,287 @@
+"""
+Модуль для выравнивания последовательностей (абзацев) двух документов.
+
+Реализует алгоритм Myers O(ND) в варианте с линейной памятью
+("разделяй и властвуй" по средней змейке, раздел 4b статьи Myers, 1986):
+- Предварительное отсечение общего префикса и суффикса
+- Быстрый выход для вырожденного случая (средние части не имеют общих элементов)
+- Поиск средней змейки встречным обходом с начала и с конца
+- Рекурсивное разбиение без рекурсии Python (явный стек)
+
+Результат совместим с difflib.SequenceMatcher.get_matching_blocks():
+список Match(a, b, size), отсортированный по позиции и завершающийся
+блоком нулевой длины Match(len(a), len(b), 0).
+"""
+
+import importlib.util
+from difflib import Match
+from typing import Hashable, List, Optional, Sequence, Tuple
+from config import config
+
+# numba для JIT-компиляции внутреннего цикла (опционально). Импорт numba и numpy
+# заметно замедляет запуск программы, а JIT-версия нужна только для больших
+# участков, поэтому они загружаются при первом таком участке (см. _load_jit)
+NUMBA_AVAILABLE = (importlib.util.find_spec("numba") is not None
+                   and importlib.util.find_spec("numpy") is not None)
+
+# Кортеж (JIT-версия _middle_snake, модуль numpy) после первой загрузки
+_jit = None
+
+# Минимальная суммарная длина участка, начиная с которой используется JIT-версия.
+# Для небольших документов интерпретатор быстрее первой загрузки скомпилированного кода.
+JIT_MIN_LENGTH = 256
+
+
+def _intern(seq1: Sequence[Hashable], seq2: Sequence[Hashable]) -> Tuple[List[int], List[int]]:
+    """
+    Замена элементов последовательностей целочисленными идентификаторами.
+
+    Одинаковые элементы получают одинаковые идентификаторы, поэтому
+    во внутреннем цикле сравниваются целые числа, а не строки.
+
+    Args:
+        seq1: Первая последовательность
+        seq2: Вторая последовательность
+
+    Returns:
+        Кортеж (идентификаторы seq1, идентификаторы seq2)
+    """
+    ids = {}
+    ids1 = [ids.setdefault(item, len(ids)) for item in seq1]
+    ids2 = [ids.setdefault(item, len(ids)) for item in seq2]
+    return ids1, ids2
+
+
+def _snake_buffer_size(n: int, m: int) -> int:
+    """Размер буферов диагоналей для участка длиной n x m."""
+    return n + m + 4
+
+
+def _middle_snake(a, a_lo: int, a_hi: int, b, b_lo: int, b_hi: int,
+                  forward, backward) -> Tuple[int, int, int, int, int]:
+    """
+    Поиск средней змейки кратчайшего пути редактирования.
+
+    Обход ведется одновременно с начала (вперед) и с конца (назад) до встречи.
+    Обратный обход выполняется как прямой по развернутым последовательностям.
+    Функция работает как со списками, так и с массивами NumPy,
+    поэтому используется и интерпретатором, и JIT-компилятором numba.
+
+    Args:
+        a, b: Последовательности идентификаторов
+        a_lo, a_hi: Границы рассматриваемого участка a
+        b_lo, b_hi: Границы рассматриваемого участка b
+        forward: Буфер самых дальних x на диагоналях k = x - y (с начала)
+        backward: Буфер самых дальних x на диагоналях (с конца, развернутые координаты)
+
+    Returns:
+        Кортеж (x0, y0, x1, y1, d): змейка от (x0, y0) до (x1, y1)
+        в абсолютных индексах и длина кратчайшего пути редактирования d
+    """
+    n = a_hi - a_lo
+    m = b_hi - b_lo
+    delta = n - m
+    odd = delta & 1
+    max_d = (n + m + 1) // 2
+    offset = max_d + 1
+    # Буферы переиспользуются между вызовами: достаточно сбросить стартовые диагонали
+    forward[offset + 1] = 0
+    backward[offset + 1] = 0
+
+    for d in range(max_d + 1):
+        # Прямой обход
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and forward[offset + k - 1] < forward[offset + k + 1]):
+                x = forward[offset + k + 1]
+            else:
+                x = forward[offset + k - 1] + 1
+            y = x - k
+            x0, y0 = x, y
+            while x < n and y < m and a[a_lo + x] == b[b_lo + y]:
+                x += 1
+                y += 1
+            forward[offset + k] = x
+
+            c = delta - k
+            if odd and -(d - 1) <= c <= d - 1 and x + backward[offset + c] >= n:
+                return a_lo + x0, b_lo + y0, a_lo + x, b_lo + y, 2 * d - 1
+
+        # Обратный обход
+        for c in range(-d, d + 1, 2):
+            if c == -d or (c != d and backward[offset + c - 1] < backward[offset + c + 1]):
+                x = backward[offset + c + 1]
+            else:
+                x = backward[offset + c - 1] + 1
+            y = x - c
+            x0, y0 = x, y
+            while x < n and y < m and a[a_hi - 1 - x] == b[b_hi - 1 - y]:
+                x += 1
+                y += 1
+            backward[offset + c] = x
+
+            k = delta - c
+            if not odd and -d <= k <= d and x + forward[offset + k] >= n:
+                # Перевод змейки из развернутых координат в прямые
+                return a_hi - x, b_hi - y, a_hi - x0, b_hi - y0, 2 * d
+
+    # Недостижимо: пути встречаются не позднее шага max_d
+    raise AssertionError("Средняя змейка не найдена")
+
+
+def _load_jit():
+    """
+    Импорт numba и numpy и подготовка JIT-версии _middle_snake при первом вызове.
+
+    Returns:
+        Кортеж (JIT-версия _middle_snake, модуль numpy)
+        или None, если numba не удалось импортировать
+    """
+    global _jit, NUMBA_AVAILABLE
+    if _jit is None:
+        try:
+            import numpy as np
+            from numba import njit
+        except ImportError:
+            NUMBA_AVAILABLE = False
+            return None
+        _jit = (njit(cache=True)(_middle_snake), np)
+    return _jit
+
+
+def _trivial_blocks(a: List[int], a_lo: int, a_hi: int,
+                    b: List[int], b_lo: int, b_hi: int) -> List[Tuple[int, int, int]]:
+    """
+    Совпадающие блоки для участка с расстоянием редактирования не более 1.
+
+    Более короткий участок является подпоследовательностью более длинного,
+    отличающейся не более чем одним элементом.
+    """
+    blocks = []
+    i, j = a_lo, b_lo
+    while i < a_hi and j < b_hi and a[i] == b[j]:
+        i += 1
+        j += 1
+    if i > a_lo:
+        blocks.append((a_lo, b_lo, i - a_lo))
+
+    # Пропуск единственного лишнего элемента
+    if a_hi - a_lo > b_hi - b_lo:
+        i += 1
+    elif b_hi - b_lo > a_hi - a_lo:
+        j += 1
+
+    if i < a_hi:
+        blocks.append((i, j, a_hi - i))
+    return blocks
+
+
+def _is_degenerate(a: List[int], a_lo: int, a_hi: int,
+                   b: List[int], b_lo: int, b_hi: int,
+                   min_common_ratio: float) -> bool:
+    """
+    Проверка вырожденного случая: участки почти не имеют общих элементов.
+
+    В этом случае поиск пути не нужен, участки целиком считаются
+    удаленными/добавленными (оптимизация из JGit).
+    """
+    smaller, larger = a[a_lo:a_hi], b[b_lo:b_hi]
+    if len(smaller) > len(larger):
+        smaller, larger = larger, smaller
+    larger_set = set(larger)
+    common = sum(1 for item in smaller if item in larger_set)
+    return common <= min_common_ratio * len(smaller)
+
+
+def _append_block(blocks: List[Match], i: int, j: int, size: int) -> None:
+    """Добавление блока в конец списка со слиянием с предыдущим смежным блоком."""
+    if size <= 0:
+        return
+    if blocks:
+        last = blocks[-1]
+        if last.a + last.size == i and last.b + last.size == j:
+            blocks[-1] = Match(last.a, last.b, last.size + size)
+            return
+    blocks.append(Match(i, j, size))
+
+
+def get_matching_blocks(seq1: Sequence[Hashable], seq2: Sequence[Hashable],
+                        min_common_ratio: Optional[float] = None) -> List[Match]:
+    """
+    Поиск совпадающих блоков двух последовательностей алгоритмом Myers.
+
+    Находит наибольшую общую подпоследовательность (LCS) за O((N+M)D) времени
+    и O(N+M) памяти, где D - расстояние редактирования.
+
+    Args:
+        seq1: Первая последовательность (например, нормализованные абзацы)
+        seq2: Вторая последовательность
+        min_common_ratio: Доля общих элементов в средней части, не выше которой
+                          она целиком считается замененной. По умолчанию берется
+                          из config.comparison.diff_min_common_ratio
+
+    Returns:
+        Список Match(a, b, size) в формате difflib.SequenceMatcher.get_matching_blocks()
+    """
+    if min_common_ratio is None:
+        min_common_ratio = config.comparison.diff_min_common_ratio
+
+    a, b = _intern(seq1, seq2)
+    n, m = len(a), len(b)
+    blocks = []
+
+    # Отсечение общего префикса
+    prefix = 0
+    while prefix < n and prefix < m and a[prefix] == b[prefix]:
+        prefix += 1
+    _append_block(blocks, 0, 0, prefix)
+
+    # Отсечение общего суффикса
+    suffix = 0
+    while suffix < n - prefix and suffix < m - prefix and a[n - 1 - suffix] == b[m - 1 - suffix]:
+        suffix += 1
+
+    a_hi, b_hi = n - suffix, m - suffix
+    if (prefix < a_hi and prefix < b_hi
+            and not _is_degenerate(a, prefix, a_hi, b, prefix, b_hi, min_common_ratio)):
+        # Буферы диагоналей выделяются один раз на все разбиения
+        buffer_size = _snake_buffer_size(a_hi - prefix, b_hi - prefix)
+        jit = None
+        if NUMBA_AVAILABLE and (a_hi - prefix) + (b_hi - prefix) >= JIT_MIN_LENGTH:
+            jit = _load_jit()
+        if jit is not None:
+            middle_snake, np = jit
+            snake_a = np.array(a, dtype=np.int64)
+            snake_b = np.array(b, dtype=np.int64)
+            forward = np.zeros(buffer_size, dtype=np.int64)
+            backward = np.zeros(buffer_size, dtype=np.int64)
+        else:
+            middle_snake = _middle_snake
+            snake_a, snake_b = a, b
+            forward = [0] * buffer_size
+            backward = [0] * buffer_size
+
+        # Обход в порядке "левая часть -> змейка -> правая часть":
+        # блоки выдаются сразу упорядоченными, без сортировки и копирования путей.
+        # Элемент стека из 4 чисел - участок для разбиения, из 3 - готовая змейка.
+        stack = [(prefix, a_hi, prefix, b_hi)]
+        while stack:
+            item = stack.pop()
+            if len(item) == 3:
+                _append_block(blocks, *item)
+                continue
+            a_lo, a_up, b_lo, b_up = item
+            if a_lo >= a_up or b_lo >= b_up:
+                continue
+            x0, y0, x1, y1, d = middle_snake(snake_a, a_lo, a_up, snake_b, b_lo, b_up,
+                                             forward, backward)
+            if d <= 1:
+                for block in _trivial_blocks(a, a_lo, a_up, b, b_lo, b_up):
+                    _append_block(blocks, *block)
+                continue
+            stack.append((x1, a_up, y1, b_up))
+            stack.append((x0, y0, x1 - x0))
+            stack.append((a_lo, x0, b_lo, y0))
+
+    _append_block(blocks, n - suffix, m - suffix, suffix)
+    blocks.append(Match(n, m, 0))
+    return blocks
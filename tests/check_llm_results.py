@@ -3,7 +3,7 @@
 """
 
 import json
-import glob
+import os
 import sys
 from pathlib import Path
 
@@ -18,7 +18,38 @@ if not results_path.exists():
     print("Папка results не найдена")
     exit(1)
 
-result_dirs = sorted([d for d in results_path.iterdir() if d.is_dir() and d.name.startswith("comparison_")], reverse=True)
+def scan_result_dirs(path):
+    """
+    Папки результатов сравнения (comparison_*) в директории.
+    
+    os.scandir возвращает DirEntry с уже известным типом записи,
+    поэтому отдельный stat() нужен только для времени изменения.
+    Папки результатов прогонов comprehensive_test.py (comprehensive_*/test_*)
+    тоже учитываются.
+    """
+    found = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            if entry.name.startswith("comparison_"):
+                found.append(entry)
+            elif entry.name.startswith("comprehensive_"):
+                with os.scandir(entry.path) as run_entries:
+                    found.extend(e for e in run_entries if e.name.startswith("test_") and e.is_dir())
+    return found
+
+def first_json_file(result_dir):
+    """Первый JSON файл в папке результатов (или None)."""
+    with os.scandir(result_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".json") and entry.is_file():
+                return entry.path
+    return None
+
+# Сначала самые свежие результаты
+result_dirs = scan_result_dirs(results_path)
+result_dirs.sort(key=lambda e: e.stat().st_mtime, reverse=True)
 
 if not result_dirs:
     print("Не найдены результаты сравнения")
@@ -27,25 +58,22 @@ if not result_dirs:
 # Ищем последний файл с LLM ответами
 json_file = None
 for result_dir in result_dirs:
-    json_files = list(result_dir.glob("*.json"))
-    if json_files:
+    candidate = first_json_file(result_dir.path)
+    if candidate:
         try:
-            with open(json_files[0], 'r', encoding='utf-8') as f:
+            with open(candidate, 'r', encoding='utf-8') as f:
                 data = json.load(f)
                 # Проверяем, есть ли LLM ответы
                 if any(r.get('llm_response') for r in data.get('comparison_results', [])):
-                    json_file = json_files[0]
+                    json_file = candidate
                     break
         except:
             continue
 
 if not json_file:
     # Если не нашли файл с LLM, берем последний
-    latest_dir = result_dirs[0]
-    json_files = list(latest_dir.glob("*.json"))
-    if json_files:
-        json_file = json_files[0]
-    else:
+    json_file = first_json_file(result_dirs[0].path)
+    if not json_file:
         print("Не найден JSON файл с результатами")
         exit(1)
 
@@ -57,8 +85,11 @@ with open(json_file, 'r', encoding='utf-8') as f:
 
 # Статистика
 total_results = len(data['comparison_results'])
-results_with_llm = [r for r in data['comparison_results'] if r.get('llm_response')]
-results_without_llm = [r for r in data['comparison_results'] if not r.get('llm_response')]
+# Разделение результатов за один проход
+results_with_llm = []
+results_without_llm = []
+for r in data['comparison_results']:
+    (results_with_llm if r.get('llm_response') else results_without_llm).append(r)
 
 print("=" * 60)
 print("СТАТИСТИКА LLM АНАЛИЗА")
@@ -0,0 +1,165 @@
+"""
+Постоянный процесс для выполнения команд CLI (используется comprehensive_test.py
+и edge_cases_test.py).
+
+Читает из stdin по одной JSON строке со списком аргументов cli.main,
+выполняет команду в своем процессе и отвечает одной JSON строкой
+{"rc": код возврата, "out": вывод команды}. Модули проекта импортируются
+один раз на все команды, при этом тесты изолированы от процесса,
+который их запускает.
+"""
+
+import contextlib
+import io
+import json
+import logging
+import queue
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+# Корень проекта - для импорта cli
+PROJECT_ROOT = Path(__file__).parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+
+@contextlib.contextmanager
+def capture_cli_output(buffer):
+    """
+    Перехват stdout, stderr и консольного лога compareDocx в buffer.
+
+    Консольный обработчик логгера хранит ссылку на исходный sys.stdout,
+    поэтому его поток подменяется отдельно.
+    """
+    console_handlers = [h for h in logging.getLogger("compareDocx").handlers
+                        if type(h) is logging.StreamHandler]
+    old_streams = [h.setStream(buffer) for h in console_handlers]
+    try:
+        with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+            yield
+    finally:
+        for handler, stream in zip(console_handlers, old_streams):
+            handler.setStream(stream)
+
+
+# Логгеры, настройки которых восстанавливаются после каждой команды: корневой и логгер проекта
+PRESERVED_LOGGERS = ("", "compareDocx")
+
+
+@contextlib.contextmanager
+def preserve_logging():
+    """
+    Сохранение и восстановление уровней и обработчиков логгеров PRESERVED_LOGGERS.
+
+    cli.main настраивает логгер по --log-level/--log-file; без восстановления
+    эти настройки переходили бы на следующие команды в том же процессе.
+    """
+    saved = []
+    for name in PRESERVED_LOGGERS:
+        log = logging.getLogger(name)
+        saved.append((log, log.level, list(log.handlers), [h.level for h in log.handlers]))
+    try:
+        yield
+    finally:
+        for log, level, handlers, handler_levels in saved:
+            for handler in log.handlers:
+                if handler not in handlers:
+                    handler.close()
+            log.handlers[:] = handlers
+            log.setLevel(level)
+            for handler, handler_level in zip(handlers, handler_levels):
+                handler.setLevel(handler_level)
+
+
+def run_cli(cli_main, argv):
+    """
+    Выполнение cli.main с перехватом вывода.
+
+    Args:
+        cli_main: Функция cli.main
+        argv: Аргументы командной строки
+
+    Returns:
+        Кортеж (код возврата, вывод команды)
+    """
+    buffer = io.StringIO()
+    with preserve_logging(), capture_cli_output(buffer):
+        try:
+            returncode = cli_main(argv)
+        except SystemExit as e:
+            returncode = e.code
+    return returncode, buffer.getvalue()
+
+
+def start_worker():
+    """Запуск постоянного процесса cli_worker.py для выполнения команд CLI."""
+    return subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve())],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+        encoding='utf-8'
+    )
+
+
+def call_worker(worker, argv, timeout=None):
+    """
+    Выполнение команды в процессе, запущенном start_worker().
+
+    Ответ читается в отдельном потоке, чтобы ожидание можно было ограничить
+    по времени. При превышении timeout рабочий процесс завершается
+    (его нужно запустить заново) и выбрасывается subprocess.TimeoutExpired.
+
+    Args:
+        worker: Рабочий процесс
+        argv: Аргументы cli.main (без 'python cli.py')
+        timeout: Ограничение времени ответа в секундах; None - без ограничения
+
+    Returns:
+        Словарь {"rc": код возврата, "out": вывод команды}
+        или None, если рабочий процесс завершился
+    """
+    worker.stdin.write(json.dumps(argv) + '\n')
+    worker.stdin.flush()
+    
+    replies = queue.Queue(maxsize=1)
+    reader = threading.Thread(target=lambda: replies.put(worker.stdout.readline()), daemon=True)
+    reader.start()
+    try:
+        reply = replies.get(timeout=timeout)
+    except queue.Empty:
+        worker.kill()
+        worker.wait()
+        raise subprocess.TimeoutExpired(argv, timeout)
+    return json.loads(reply) if reply else None
+
+
+def stop_worker(worker):
+    """Завершение рабочего процесса (закрытие stdin и ожидание выхода)."""
+    worker.stdin.close()
+    worker.wait()
+
+
+def serve():
+    """Цикл обработки команд из stdin до его закрытия."""
+    # Ответы пишутся в исходный stdout; любой посторонний вывод
+    # (в том числе логи при импорте) уходит в stderr и не ломает протокол
+    protocol = sys.stdout
+    sys.stdout = sys.stderr
+
+    from cli import main as cli_main
+
+    for line in sys.stdin:
+        argv = json.loads(line)
+        try:
+            returncode, output = run_cli(cli_main, argv)
+        except Exception as e:
+            returncode, output = 1, f"ИСКЛЮЧЕНИЕ: {e}"
+        protocol.write(json.dumps({'rc': returncode, 'out': output}) + '\n')
+        protocol.flush()
+
+
+if __name__ == "__main__":
+    serve()
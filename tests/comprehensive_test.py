@@ -2,70 +2,335 @@
 Масштабное тестирование проекта compareDocx
 """
 
-import subprocess
+import argparse
+import asyncio
 import sys
+import os
 import json
 import io
+from collections import Counter, deque
 from pathlib import Path
 import time
 from datetime import datetime
 
+# Импорт ijson для потокового разбора JSON результатов (опционально)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Импорт orjson для быстрой записи отчета (опционально)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Установка кодировки для Windows
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
-def run_command(cmd, description):
-    """Запуск команды и возврат результата"""
-    print(f"\n{'='*60}")
-    print(f"ТЕСТ: {description}")
-    print(f"{'='*60}")
-    print(f"Команда: {' '.join(cmd)}")
+# Корень проекта - для импорта cli при запуске тестов в текущем процессе
+PROJECT_ROOT = Path(__file__).parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from cli_worker import call_worker, run_cli, start_worker, stop_worker
+
+# Папка результатов (относительно текущей директории, как и у cli.py)
+RESULTS_DIR = Path('results')
+
+# Флаги выбора формата экспорта CLI
+FORMAT_FLAGS = ('--xlsx', '--json', '--csv', '--html')
+
+# Количество последних строк вывода команды, сохраняемых для отчета
+TAIL_LINES = 10
+
+async def read_tail(stream, tail):
+    """
+    Построчное чтение потока с сохранением последних строк в tail.
+    
+    Строки хранятся в байтах: декодируются только оставшиеся в tail
+    (см. decode_tail), а не весь вывод команды.
+    """
+    async for line in stream:
+        tail.append(line)
+
+def decode_tail(tail):
+    """Декодирование сохраненных строк вывода в список строк."""
+    return [line.decode('utf-8', 'replace').rstrip() for line in tail]
+
+async def run_command(cmd, description, semaphore, timeout):
+    """
+    Асинхронный запуск команды в подпроцессе и возврат результата.
+    
+    Вывод не печатается сразу, а накапливается в списке строк,
+    чтобы журналы параллельно выполняемых тестов не перемешивались.
+    
+    Args:
+        cmd: Команда
+        description: Описание теста
+        semaphore: Ограничение числа одновременно выполняемых подпроцессов
+        timeout: Ограничение времени выполнения в секундах
+    
+    Returns:
+        Кортеж (успех, время выполнения, вывод команды, строки журнала)
+    """
+    log = start_log(cmd, description)
+    loop = asyncio.get_running_loop()
+    
+    async with semaphore:
+        start_time = loop.time()
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except Exception as e:
+            log.append(f"[FAIL] ИСКЛЮЧЕНИЕ: {e}")
+            return False, loop.time() - start_time, str(e), log
+        
+        # stdout и stderr читаются одновременно, в памяти остаются только
+        # последние строки; заполненный канал не блокирует дочерний процесс
+        stdout_tail = deque(maxlen=TAIL_LINES)
+        stderr_tail = deque(maxlen=TAIL_LINES)
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    read_tail(process.stdout, stdout_tail),
+                    read_tail(process.stderr, stderr_tail),
+                    process.wait()
+                ),
+                timeout
+            )
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            elapsed = loop.time() - start_time
+            log.append(f"[FAIL] ПРЕВЫШЕНО ВРЕМЯ ВЫПОЛНЕНИЯ ({timeout} сек)")
+            return False, elapsed, '\n'.join(decode_tail(stdout_tail)), log
+        elapsed = loop.time() - start_time
+    
+    returncode = process.returncode
+    stdout_tail = decode_tail(stdout_tail)
+    stderr_tail = decode_tail(stderr_tail)
+    if returncode == 0:
+        log.append(f"[OK] УСПЕХ ({elapsed:.2f} сек)")
+        for line in stdout_tail:
+            log.append(f"  {line}")
+        return True, elapsed, '\n'.join(stdout_tail), log
+    else:
+        log.append(f"[FAIL] ОШИБКА (код: {returncode})")
+        if stderr_tail:
+            log.append("STDERR:")
+            for line in stderr_tail:
+                log.append(f"  {line}")
+        return False, elapsed, '\n'.join(stderr_tail), log
+
+def start_log(cmd, description):
+    """Заголовок журнала теста."""
+    return [
+        f"\n{'='*60}",
+        f"ТЕСТ: {description}",
+        f"{'='*60}",
+        f"Команда: {' '.join(cmd)}",
+    ]
+
+def finish_log(log, returncode, elapsed, output):
+    """
+    Завершение журнала теста по коду возврата и выводу CLI.
+    
+    Returns:
+        Кортеж (успех, время выполнения, последние строки вывода, строки журнала)
+    """
+    output = '\n'.join(output.strip().split('\n')[-TAIL_LINES:])
+    if not returncode:
+        log.append(f"[OK] УСПЕХ ({elapsed:.2f} сек)")
+    else:
+        log.append(f"[FAIL] ОШИБКА (код: {returncode})")
+    for line in output.split('\n'):
+        log.append(f"  {line}")
+    return not returncode, elapsed, output, log
+
+def run_in_process(cli_main, cmd, description):
+    """
+    Запуск CLI в текущем процессе без создания подпроцесса.
+    
+    Интерпретатор, модули проекта и LLM клиент загружаются один раз
+    на весь набор тестов. Вывод CLI (включая консольный лог) перехватывается.
+    
+    Args:
+        cli_main: Функция cli.main
+        cmd: Команда вида ['python', 'cli.py', аргументы...]
+        description: Описание теста
+    
+    Returns:
+        Кортеж (успех, время выполнения, вывод команды, строки журнала)
+    """
+    log = start_log(cmd, description)
     
     start_time = time.time()
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='replace'
-        )
-        elapsed = time.time() - start_time
-        
-        if result.returncode == 0:
-            print(f"[OK] УСПЕХ ({elapsed:.2f} сек)")
-            if result.stdout:
-                # Показываем только последние строки вывода
-                lines = result.stdout.strip().split('\n')
-                for line in lines[-10:]:
-                    print(f"  {line}")
-            return True, elapsed, result.stdout
-        else:
-            print(f"[FAIL] ОШИБКА (код: {result.returncode})")
-            if result.stderr:
-                print("STDERR:")
-                for line in result.stderr.split('\n')[:10]:
-                    print(f"  {line}")
-            return False, elapsed, result.stderr
+        returncode, output = run_cli(cli_main, cmd[2:])
     except Exception as e:
         elapsed = time.time() - start_time
-        print(f"[FAIL] ИСКЛЮЧЕНИЕ: {e}")
-        return False, elapsed, str(e)
+        log.append(f"[FAIL] ИСКЛЮЧЕНИЕ: {e}")
+        return False, elapsed, str(e), log
+    elapsed = time.time() - start_time
+    
+    return finish_log(log, returncode, elapsed, output)
+
+def run_in_worker(worker, cmd, description):
+    """
+    Запуск CLI в постоянном рабочем процессе (см. cli_worker.py).
+    
+    Модули проекта импортируются в рабочем процессе один раз на все тесты,
+    при этом тесты изолированы от процесса, который их запускает.
+    
+    Args:
+        worker: Процесс, созданный start_worker()
+        cmd: Команда вида ['python', 'cli.py', аргументы...]
+        description: Описание теста
+    
+    Returns:
+        Кортеж (успех, время выполнения, вывод команды, строки журнала)
+    """
+    log = start_log(cmd, description)
+    
+    start_time = time.time()
+    reply = call_worker(worker, cmd[2:])
+    elapsed = time.time() - start_time
+    
+    if reply is None:
+        log.append(f"[FAIL] Рабочий процесс завершился (код: {worker.poll()})")
+        return False, elapsed, '', log
+    return finish_log(log, reply['rc'], elapsed, reply['out'])
+
+def preflight_inputs(test_cases):
+    """
+    Проверка наличия входных документов до запуска тестов.
+    
+    Каждый уникальный файл проверяется одним вызовом stat().
+    
+    Returns:
+        Множество отсутствующих путей
+    """
+    inputs = {arg for test_case in test_cases for arg in test_case['cmd'] if arg.endswith('.docx')}
+    return {path for path in inputs if not os.path.isfile(path)}
+
+def group_test_cases(test_cases, exclude=()):
+    """
+    Объединение тестов, отличающихся только флагами форматов экспорта.
+    
+    Тесты с одинаковыми документами и остальными аргументами выполняются
+    одним запуском CLI с объединенным набором форматов, а результат затем
+    проверяется отдельно по форматам каждого теста.
+    
+    Args:
+        test_cases: Список тестов
+        exclude: Номера тестов (с 1), которые не запускаются
+    
+    Returns:
+        Список групп: {'members': номера тестов (с 1), 'cmd': объединенная команда,
+        'desc': описание запуска}
+    """
+    groups = {}
+    for i, test_case in enumerate(test_cases, 1):
+        if i in exclude:
+            continue
+        base_cmd = [arg for arg in test_case['cmd'] if arg not in FORMAT_FLAGS]
+        # Без флагов формата CLI экспортирует в Excel
+        flags = [arg for arg in test_case['cmd'] if arg in FORMAT_FLAGS] or ['--xlsx']
+        group = groups.setdefault(tuple(base_cmd), {'members': [], 'cmd': base_cmd, 'flags': set()})
+        group['members'].append(i)
+        group['flags'].update(flags)
+    
+    return [
+        {
+            'members': group['members'],
+            'cmd': group['cmd'] + [flag for flag in FORMAT_FLAGS if flag in group['flags']],
+            'desc': '; '.join(test_cases[i - 1]['desc'] for i in group['members'])
+        }
+        for group in groups.values()
+    ]
+
+def split_by_comparison(groups):
+    """
+    Разбиение запусков на две волны по сравниваемым документам.
+    
+    Запуски с одинаковой парой документов (и режимом LLM) отличаются только
+    форматами экспорта и фильтрами, а само сравнение для них общее и
+    сохраняется в кэш результатов (см. result_cache, флаг --cache). Первая
+    волна содержит по одному запуску на каждую пару, вторая - остальные,
+    которые берут результаты сравнения из кэша.
+    
+    Args:
+        groups: Группы тестов (словари с ключом 'cmd')
+    
+    Returns:
+        Кортеж (группы первой волны, группы второй волны)
+    """
+    first_wave, second_wave = [], []
+    seen = set()
+    for group in groups:
+        key = (tuple(group['cmd'][2:4]), '--no-llm' in group['cmd'])
+        if key in seen:
+            second_wave.append(group)
+        else:
+            seen.add(key)
+            first_wave.append(group)
+    return first_wave, second_wave
+
+def append_report_line(jsonl_file, record):
+    """
+    Дозапись результата одного теста в JSONL файл отчета.
+    
+    Файл дописывается сразу после завершения теста, поэтому при аварийном
+    завершении прогона результаты уже выполненных тестов сохраняются.
+    """
+    if ORJSON_AVAILABLE:
+        line = orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS) + b'\n'
+    else:
+        line = (json.dumps(record, ensure_ascii=False) + '\n').encode('utf-8')
+    with open(jsonl_file, 'ab') as f:
+        f.write(line)
+
+def summarize_report_lines(jsonl_file):
+    """
+    Подсчет итогов по JSONL файлу отчета за один проход.
+    
+    Returns:
+        Counter с ключами passed, failed, skipped
+    """
+    counts = Counter()
+    with open(jsonl_file, 'rb') as f:
+        for line in f:
+            record = json.loads(line)
+            if record.get('skipped'):
+                counts['skipped'] += 1
+            elif record['success']:
+                counts['passed'] += 1
+            else:
+                counts['failed'] += 1
+    return counts
 
 def check_result_files(result_dir, expected_formats):
-    """Проверка наличия файлов результатов"""
-    result_path = Path(result_dir)
-    if not result_path.exists():
+    """Проверка наличия файлов результатов (result_dir - str, Path или DirEntry)"""
+    # Один проход по директории: расширения файлов собираются в множество
+    wanted = set(expected_formats)
+    found = set()
+    try:
+        with os.scandir(result_dir) as entries:
+            for entry in entries:
+                ext = entry.name.rpartition('.')[2]
+                if ext in wanted:
+                    found.add(ext)
+    except FileNotFoundError:
         return False, f"Директория не найдена: {result_dir}"
-    
-    files = list(result_path.glob("*"))
-    found_formats = []
-    for fmt in expected_formats:
-        pattern = f"*.{fmt}"
-        matching = list(result_path.glob(pattern))
-        if matching:
-            found_formats.append(fmt)
+    found_formats = [fmt for fmt in expected_formats if fmt in found]
     
     missing = set(expected_formats) - set(found_formats)
     if missing:
@@ -73,19 +338,79 @@ def check_result_files(result_dir, expected_formats):
     
     return True, f"Найдены все форматы: {found_formats}"
 
+def analyze_json_result_streaming(json_file):
+    """
+    Потоковый анализ JSON результата через ijson.
+    
+    Файл читается за один проход по событиям парсера, без загрузки
+    всего документа в память.
+    """
+    statuses = Counter()
+    counts = Counter()
+    with_llm = 0
+    with open(json_file, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if event == 'start_map' and prefix.endswith('.item'):
+                counts[prefix] += 1
+            elif prefix == 'comparison_results.item.status':
+                statuses[value] += 1
+            elif prefix == 'comparison_results.item.llm_response' and event == 'string' and value:
+                with_llm += 1
+    
+    return {
+        'total': counts['comparison_results.item'],
+        'identical': statuses['identical'],
+        'modified': statuses['modified'],
+        'added': statuses['added'],
+        'deleted': statuses['deleted'],
+        'with_llm': with_llm,
+        'tables': counts['table_changes.item'],
+        'images': counts['image_changes.item']
+    }
+
+def read_json_summary(json_file):
+    """
+    Чтение готовой сводки (summary) из JSON результата.
+    
+    Сводка записывается экспортером в начало файла, поэтому при наличии
+    ijson читается только начало файла.
+    
+    Returns:
+        Словарь сводки или None, если файл создан без сводки
+    """
+    if IJSON_AVAILABLE:
+        with open(json_file, 'rb') as f:
+            return next(ijson.items(f, 'summary'), None)
+    
+    with open(json_file, 'r', encoding='utf-8') as f:
+        return json.load(f).get('summary')
+
 def analyze_json_result(json_file):
     """Анализ JSON результата"""
     try:
+        summary = read_json_summary(json_file)
+        if summary is not None:
+            return True, summary
+        
+        # Файлы старого формата без сводки - подсчет по результатам
+        if IJSON_AVAILABLE:
+            return True, analyze_json_result_streaming(json_file)
+        
         with open(json_file, 'r', encoding='utf-8') as f:
             data = json.load(f)
         
+        # Один проход по результатам вместо отдельного прохода на каждый статус
+        results = data.get('comparison_results', [])
+        statuses = Counter(r.get('status') for r in results)
+        with_llm = sum(1 for r in results if r.get('llm_response'))
+        
         stats = {
-            'total': len(data.get('comparison_results', [])),
-            'identical': sum(1 for r in data.get('comparison_results', []) if r.get('status') == 'identical'),
-            'modified': sum(1 for r in data.get('comparison_results', []) if r.get('status') == 'modified'),
-            'added': sum(1 for r in data.get('comparison_results', []) if r.get('status') == 'added'),
-            'deleted': sum(1 for r in data.get('comparison_results', []) if r.get('status') == 'deleted'),
-            'with_llm': sum(1 for r in data.get('comparison_results', []) if r.get('llm_response')),
+            'total': len(results),
+            'identical': statuses['identical'],
+            'modified': statuses['modified'],
+            'added': statuses['added'],
+            'deleted': statuses['deleted'],
+            'with_llm': with_llm,
             'tables': len(data.get('table_changes', [])),
             'images': len(data.get('image_changes', []))
         }
@@ -94,13 +419,24 @@ def analyze_json_result(json_file):
         return False, str(e)
 
 def main():
+    arg_parser = argparse.ArgumentParser(description='Масштабное тестирование проекта compareDocx')
+    mode = arg_parser.add_mutually_exclusive_group()
+    mode.add_argument('--subprocess', action='store_true',
+                      help='Запускать каждый тест в отдельном подпроцессе (полная изоляция, параллельно)')
+    mode.add_argument('--worker', action='store_true',
+                      help='Запускать тесты в одном постоянном подпроцессе (изоляция от тестового скрипта)')
+    arg_parser.add_argument('--timeout', type=float, default=600,
+                            help='Ограничение времени одного теста в секундах (режим --subprocess)')
+    args = arg_parser.parse_args()
+    
     print("="*60)
     print("МАСШТАБНОЕ ТЕСТИРОВАНИЕ ПРОЕКТА compareDocx")
     print("="*60)
-    print(f"Время начала: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    started = datetime.now()
+    run_stamp = started.strftime('%Y%m%d_%H%M%S')
+    print(f"Время начала: {started.strftime('%Y-%m-%d %H:%M:%S')}")
     
-    test_results = []
-    total_time = 0
+    start_time = time.time()
     
     # Базовые тесты
     test_cases = [
@@ -174,55 +510,145 @@ def main():
         },
     ]
     
-    # Запуск тестов
+    # Результат каждого теста сразу дописывается в JSONL файл рядом с отчетом
+    report_file = RESULTS_DIR / f"test_report_{run_stamp}.json"
+    jsonl_file = report_file.with_suffix('.jsonl')
+    RESULTS_DIR.mkdir(exist_ok=True)
+    
+    # Тесты с отсутствующими входными документами не запускаются
+    results = {}
+    missing = preflight_inputs(test_cases)
     for i, test_case in enumerate(test_cases, 1):
-        print(f"\n[{i}/{len(test_cases)}]")
-        success, elapsed, output = run_command(test_case['cmd'], test_case['desc'])
-        total_time += elapsed
-        
-        result_info = {
-            'test': test_case['desc'],
-            'success': success,
-            'time': elapsed,
-            'output': output[:500] if output else ''
-        }
+        absent = sorted(missing.intersection(test_case['cmd']))
+        if absent:
+            results[i] = {
+                'test': test_case['desc'],
+                'success': False,
+                'skipped': True,
+                'time': 0.0,
+                'output': f"Не найдены входные файлы: {', '.join(absent)}"
+            }
+            append_report_line(jsonl_file, {'index': i, **results[i]})
+    
+    # Тесты, отличающиеся только форматами экспорта, выполняются одним запуском CLI
+    groups = group_test_cases(test_cases, exclude=results)
+    
+    # Каждая группа пишет результаты точно в заранее известную папку (--result-dir):
+    # искать "последнюю" папку результатов не нужно, параллельные запуски не пересекаются
+    run_dir = RESULTS_DIR / f"comprehensive_{run_stamp}"
+    for group in groups:
+        group['result_dir'] = run_dir / ("test_" + "_".join(f"{i:02d}" for i in group['members']))
+    
+    # Кэш парсинга документов (и результатов сравнения) включается флагом --cache
+    # и хранится в папке текущего запуска: тесты разделяют распарсенные документы,
+    # а записи прошлых запусков и пользовательский кэш не используются.
+    # Переменная окружения наследуется подпроцессами и читается config при импорте cli
+    os.environ['CACHE_DIR'] = os.path.abspath(run_dir / '.cache')
+    
+    # По умолчанию CLI вызывается в текущем процессе: модули проекта
+    # импортируются один раз на все тесты
+    cli_main = None
+    worker = None
+    if args.worker:
+        worker = start_worker()
+    elif not args.subprocess:
+        from cli import main as cli_main
+    
+    def command_for(group):
+        return group['cmd'] + ['--cache', '--result-dir', str(group['result_dir'])]
+    
+    def evaluate(group, outcome):
+        success, elapsed, output, log = outcome
         
-        # Проверка файлов результатов (если успешно)
+        json_stats = None
         if success:
-            # Находим последнюю директорию результатов
-            results_dir = Path('results')
-            if results_dir.exists():
-                result_dirs = sorted([d for d in results_dir.iterdir() if d.is_dir() and d.name.startswith('comparison_')], 
-                                    key=lambda x: x.stat().st_mtime, reverse=True)
-                if result_dirs:
-                    latest_dir = result_dirs[0]
-                    files_ok, files_msg = check_result_files(latest_dir, test_case['formats'])
-                    result_info['files_check'] = files_ok
-                    result_info['files_msg'] = files_msg
-                    
-                    # Анализ JSON если есть
-                    json_files = list(latest_dir.glob("*.json"))
-                    if json_files:
-                        json_ok, json_stats = analyze_json_result(json_files[0])
-                        result_info['json_stats'] = json_stats if json_ok else None
+            # Анализ JSON (один раз на группу)
+            json_files = list(group['result_dir'].glob("*.json"))
+            if json_files:
+                json_ok, json_stats = analyze_json_result(json_files[0])
+                json_stats = json_stats if json_ok else None
+        
+        for i in group['members']:
+            test_case = test_cases[i - 1]
+            result_info = {
+                'test': test_case['desc'],
+                'success': success,
+                'time': elapsed,
+                'output': output
+            }
+            if len(group['members']) > 1:
+                result_info['merged_with'] = [m for m in group['members'] if m != i]
+            
+            # Проверка файлов результатов (если успешно) по форматам самого теста
+            if success:
+                files_ok, files_msg = check_result_files(group['result_dir'], test_case['formats'])
+                result_info['files_check'] = files_ok
+                result_info['files_msg'] = files_msg
+                if 'json' in test_case['formats']:
+                    result_info['json_stats'] = json_stats
+            
+            results[i] = result_info
+            append_report_line(jsonl_file, {'index': i, **result_info})
         
-        test_results.append(result_info)
+        print(f"\n[{', '.join(map(str, group['members']))}/{len(test_cases)}]")
+        print('\n'.join(log))
+    
+    if args.subprocess:
+        # Подпроцессы независимы и выполняются параллельно (не больше числа ядер)
+        async def run_all():
+            semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+            
+            async def run_one(group):
+                outcome = await run_command(command_for(group), group['desc'],
+                                            semaphore, args.timeout)
+                evaluate(group, outcome)
+            
+            # Сначала по одному запуску на каждую пару документов: они заполняют
+            # кэш результатов сравнения, остальные запуски берут результаты из него
+            for wave in split_by_comparison(groups):
+                await asyncio.gather(*(run_one(group) for group in wave))
+        
+        asyncio.run(run_all())
+    else:
+        # В текущем и в рабочем процессе перехват stdout глобален,
+        # поэтому запуски идут последовательно; первый запуск для каждой пары
+        # документов заполняет кэш результатов, следующие берут их из него
+        for group in groups:
+            if cli_main is not None:
+                outcome = run_in_process(cli_main, command_for(group), group['desc'])
+            else:
+                outcome = run_in_worker(worker, command_for(group), group['desc'])
+            evaluate(group, outcome)
+    
+    if worker is not None:
+        stop_worker(worker)
+    
+    # Результаты в исходном порядке тестов
+    test_results = [results[i] for i in sorted(results)]
+    # Общее время - реальное время выполнения всех тестов
+    total_time = time.time() - start_time
     
     # Итоговый отчет
     print("\n" + "="*60)
     print("ИТОГОВЫЙ ОТЧЕТ")
     print("="*60)
     
-    passed = sum(1 for r in test_results if r['success'])
-    failed = len(test_results) - passed
+    counts = summarize_report_lines(jsonl_file)
+    passed = counts['passed']
+    skipped = counts['skipped']
+    failed = counts['failed']
     
     print(f"\nВсего тестов: {len(test_results)}")
     print(f"Успешно: {passed} ({passed/len(test_results)*100:.1f}%)")
     print(f"Провалено: {failed}")
+    print(f"Пропущено (нет входных файлов): {skipped}")
     print(f"Общее время: {total_time:.2f} сек")
     
     print("\nДетали тестов:")
     for i, result in enumerate(test_results, 1):
+        if result.get('skipped'):
+            print(f"[SKIP] [{i}] {result['test']}: {result['output']}")
+            continue
         status = "[OK]" if result['success'] else "[FAIL]"
         print(f"{status} [{i}] {result['test']} ({result['time']:.2f} сек)")
         if 'files_check' in result:
@@ -233,20 +659,24 @@ def main():
             print(f"    Статистика: всего={stats['total']}, изменено={stats['modified']}, "
                   f"добавлено={stats['added']}, LLM={stats['with_llm']}")
     
-    # Сохранение отчета
-    report_file = Path('results') / f"test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-    report_file.parent.mkdir(exist_ok=True)
-    with open(report_file, 'w', encoding='utf-8') as f:
-        json.dump({
-            'timestamp': datetime.now().isoformat(),
-            'summary': {
-                'total': len(test_results),
-                'passed': passed,
-                'failed': failed,
-                'total_time': total_time
-            },
-            'results': test_results
-        }, f, indent=2, ensure_ascii=False)
+    # Сохранение итогового отчета
+    report = {
+        'timestamp': datetime.now().isoformat(),
+        'summary': {
+            'total': len(test_results),
+            'passed': passed,
+            'failed': failed,
+            'skipped': skipped,
+            'total_time': total_time
+        },
+        'results': test_results
+    }
+    if ORJSON_AVAILABLE:
+        with open(report_file, 'wb') as f:
+            f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(report_file, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
     
     print(f"\nОтчет сохранен: {report_file}")
     
@@ -10,3 +10,36 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+
+def pytest_configure(config):
+    """Регистрация маркеров тестов (xdist_group - на случай запуска без pytest-xdist)."""
+    config.addinivalue_line("markers", "integration: интеграционные тесты на реальных документах")
+    config.addinivalue_line("markers", "xdist_group(name): группа тестов, выполняемая в одном процессе pytest-xdist")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_cache(tmp_path_factory):
+    """
+    Кэш отключен и направлен во временную папку на всю сессию тестов.
+
+    Тесты не читают записи кэша, оставшиеся от прошлых запусков, и не пишут
+    в папку кэша пользователя; тесты кэша включают его явно (use_cache=True).
+    """
+    from config import config
+    saved = (config.cache.directory, config.cache.enabled)
+    config.cache.directory = str(tmp_path_factory.mktemp("cache"))
+    config.cache.enabled = False
+    yield
+    config.cache.directory, config.cache.enabled = saved
+
+
+@pytest.fixture(scope="module")
+def comparator():
+    """
+    Сравнитель без загрузки документов (Compare.__new__ без __init__).
+
+    Один экземпляр на модуль: тесты вызывают только методы анализа текста,
+    которые не меняют состояние объекта.
+    """
+    from compare import Compare
+    return Compare.__new__(Compare)
@@ -7,17 +7,27 @@ from docx import Document
 from docx.shared import Pt, RGBColor, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from PIL import Image, ImageDraw
-import os
+from functools import lru_cache
 import re
+from pathlib import Path
 
 
-def create_simple_image(width, height, color, text, filename):
-    """Создание простого тестового изображения."""
+@lru_cache(maxsize=32)
+def _base_canvas(width, height, color):
+    """Заготовка изображения с фоном и рамкой (без текста)."""
     img = Image.new('RGB', (width, height), color=color)
     draw = ImageDraw.Draw(img)
     
     # Рамка
     draw.rectangle([10, 10, width-10, height-10], outline='black', width=2)
+    return img
+
+
+def create_simple_image(width, height, color, text, filename):
+    """Создание простого тестового изображения."""
+    # Копия закэшированной заготовки: фон и рамка уже нарисованы
+    img = _base_canvas(width, height, color).copy()
+    draw = ImageDraw.Draw(img)
     
     # Текст
     if text:
@@ -86,10 +96,12 @@ def create_additional_document_1():
         ['Оптимизация', 'Оптимизация рабочих процессов']
     ]
     
+    # Ячейки таблицы одним списком (по строкам)
+    cells = table1._cells
+    ncols = len(header_cells)
     for i, row_data in enumerate(data1, 1):
-        row_cells = table1.rows[i].cells
         for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
+            cells[i * ncols + j].text = cell_data
     
     # Раздел 2
     doc.add_page_break()
@@ -134,10 +146,12 @@ def create_additional_document_1():
         ['ОС', 'Linux/Windows', 'Linux/Windows']
     ]
     
+    # Ячейки таблицы одним списком (по строкам)
+    cells = table2._cells
+    ncols = len(header_cells)
     for i, row_data in enumerate(data2, 1):
-        row_cells = table2.rows[i].cells
         for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
+            cells[i * ncols + j].text = cell_data
     
     # Изображение 1
     doc.add_paragraph()
@@ -187,10 +201,12 @@ def create_additional_document_1():
         ['Аудитор', 'Чтение', 'Доступ только для чтения']
     ]
     
+    # Ячейки таблицы одним списком (по строкам)
+    cells = table3._cells
+    ncols = len(header_cells)
     for i, row_data in enumerate(data3, 1):
-        row_cells = table3.rows[i].cells
         for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
+            cells[i * ncols + j].text = cell_data
     
     # Изображение 2
     doc.add_paragraph()
@@ -231,10 +247,12 @@ def create_additional_document_1():
         ['Внедрение', '1 месяц', 'Внедренная система', 'Внедренцы']
     ]
     
+    # Ячейки таблицы одним списком (по строкам)
+    cells = table4._cells
+    ncols = len(header_cells)
     for i, row_data in enumerate(data4, 1):
-        row_cells = table4.rows[i].cells
         for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
+            cells[i * ncols + j].text = cell_data
     
     # Заключение
     doc.add_page_break()
@@ -255,8 +273,7 @@ def create_additional_document_1():
         '../documents/temp_img_add1_2.png'
     ]
     for f in temp_files:
-        if os.path.exists(f):
-            os.remove(f)
+        Path(f).unlink(missing_ok=True)
     
     doc.save('../documents/additional_test_document_1.docx')
     print("Создан файл: ../documents/additional_test_document_1.docx")
@@ -323,10 +340,12 @@ def create_additional_document_2():
         ['Безопасность', 'Обеспечение информационной безопасности']  # Новая строка
     ]
     
+    # Ячейки таблицы одним списком (по строкам)
+    cells = table1._cells
+    ncols = len(header_cells)
     for i, row_data in enumerate(data1, 1):
-        row_cells = table1.rows[i].cells
         for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
+            cells[i * ncols + j].text = cell_data
     
     # Раздел 2 - другой стиль
     doc.add_page_break()
@@ -372,10 +391,12 @@ def create_additional_document_2():
         ['ОС', 'Linux/Windows Server', 'Linux/Windows Server']
     ]
     
+    # Ячейки таблицы одним списком (по строкам)
+    cells = table2._cells
+    ncols = len(header_cells)
     for i, row_data in enumerate(data2, 1):
-        row_cells = table2.rows[i].cells
         for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
+            cells[i * ncols + j].text = cell_data
     
     # Изображение 1 (измененное)
     doc.add_paragraph()
@@ -426,10 +447,12 @@ def create_additional_document_2():
         ['Модератор', 'Модерация', 'Доступ к модерации контента']  # Новая строка
     ]
     
+    # Ячейки таблицы одним списком (по строкам)
+    cells = table3._cells
+    ncols = len(header_cells)
     for i, row_data in enumerate(data3, 1):
-        row_cells = table3.rows[i].cells
         for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
+            cells[i * ncols + j].text = cell_data
     
     # Изображение 2 (измененное)
     doc.add_paragraph()
@@ -476,10 +499,12 @@ def create_additional_document_2():
         ['Внедрение', '1.5 месяца', 'Внедренная и настроенная система', 'Внедренцы']  # Изменено
     ]
     
+    # Ячейки таблицы одним списком (по строкам)
+    cells = table4._cells
+    ncols = len(header_cells)
     for i, row_data in enumerate(data4, 1):
-        row_cells = table4.rows[i].cells
         for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
+            cells[i * ncols + j].text = cell_data
     
     # Заключение
     doc.add_page_break()
@@ -501,8 +526,7 @@ def create_additional_document_2():
         '../documents/temp_img_add2_3.png'
     ]
     for f in temp_files:
-        if os.path.exists(f):
-            os.remove(f)
+        Path(f).unlink(missing_ok=True)
     
     doc.save('../documents/additional_test_document_2.docx')
     print("Создан файл: ../documents/additional_test_document_2.docx")
@@ -3,923 +3,1094 @@
 """
 
 from docx import Document
-from docx.shared import Pt, RGBColor, Inches
+from docx.shared import Pt, RGBColor, Inches, Emu
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from PIL import Image, ImageDraw, ImageFont
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+import atexit
+import copy
+import io
 import os
 import random
+import struct
+import zipfile
+import zlib
+from pathlib import Path
+from xml.sax.saxutils import escape
 
+# Стиль всех таблиц документов
+TABLE_STYLE = 'Light Grid Accent 1'
 
-def create_simple_image(width, height, color, text, filename):
-    """Создание простого тестового изображения."""
+# Созданные изображения: (ширина, высота, цвет, текст) -> путь к файлу
+_png_cache = {}
+
+# FAST_IMAGES=1 - однотонные изображения без рамки и текста (см. make_solid_png)
+# и DOCX без сжатия (см. zip_rewrite). Для визуальной проверки документов
+# используется обычный вариант; без Pillow изображения также однотонные
+FAST_IMAGES = os.environ.get('FAST_IMAGES') == '1'
+
+# Цвета, используемые в документах, для make_solid_png
+SOLID_COLORS = {
+    'lightblue': (173, 216, 230),
+    'lightgreen': (144, 238, 144),
+    'lightyellow': (255, 255, 224),
+    'lightcoral': (240, 128, 128),
+    'lightpink': (255, 182, 193),
+    'lightcyan': (224, 255, 255),
+    'lightsteelblue': (176, 196, 222),
+    'lightgoldenrodyellow': (250, 250, 210),
+}
+
+# Цвет для make_solid_png, если цвет не найден в SOLID_COLORS и Pillow (lightgray)
+DEFAULT_SOLID_COLOR = (211, 211, 211)
+
+
+@lru_cache(maxsize=1)
+def _template():
+    """
+    Пустой документ-шаблон: загружается при первом обращении (не при импорте
+    и не в процессах, создающих только изображения) и копируется для каждого
+    документа, сам шаблон не изменяется.
+    """
+    return Document()
+
+
+@lru_cache(maxsize=1)
+def _default_font():
+    """Шрифт по умолчанию: загружается один раз на все изображения."""
+    from PIL import ImageFont
+    return ImageFont.load_default()
+
+
+@lru_cache(maxsize=32)
+def _base_template(width, height, color):
+    """Заготовка изображения с фоном и рамкой (без текста)."""
+    from PIL import Image, ImageDraw
     img = Image.new('RGB', (width, height), color=color)
     draw = ImageDraw.Draw(img)
     
     # Рамка
     draw.rectangle([10, 10, width-10, height-10], outline='black', width=2)
+    return img
+
+
+def _png_chunk(chunk_type, data):
+    """Упаковка блока PNG: длина, тип, данные и CRC."""
+    return (struct.pack('>I', len(data)) + chunk_type + data
+            + struct.pack('>I', zlib.crc32(chunk_type + data)))
+
+
+def make_solid_png(width, height, rgb, filename):
+    """
+    Создание однотонного PNG без Pillow.
+    
+    Файл собирается напрямую: сигнатура, IHDR (RGB, 8 бит на канал),
+    один блок IDAT со строками без фильтрации и IEND.
+    """
+    row = b'\x00' + bytes(rgb) * width
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)
+    with open(filename, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n'
+                + _png_chunk(b'IHDR', header)
+                + _png_chunk(b'IDAT', zlib.compress(row * height))
+                + _png_chunk(b'IEND', b''))
+    return filename
+
+
+def solid_rgb(color):
+    """
+    RGB значение цвета для make_solid_png.
+    
+    Цвета из SOLID_COLORS не требуют Pillow; остальные имена разбираются
+    через PIL.ImageColor, а без Pillow (или для неизвестного имени)
+    используется DEFAULT_SOLID_COLOR.
+    """
+    if color in SOLID_COLORS:
+        return SOLID_COLORS[color]
+    try:
+        from PIL import ImageColor
+        return ImageColor.getrgb(color)[:3]
+    except (ImportError, ValueError):
+        return DEFAULT_SOLID_COLOR
+
+
+def create_simple_image(width, height, color, text, filename):
+    """Создание простого тестового изображения."""
+    if FAST_IMAGES:
+        return make_solid_png(width, height, solid_rgb(color), filename)
+    
+    # Pillow импортируется только для обычных изображений
+    try:
+        from PIL import ImageDraw
+    except ImportError:
+        # Без Pillow - однотонное изображение
+        return make_solid_png(width, height, solid_rgb(color), filename)
+    
+    # Копия закэшированной заготовки: фон и рамка уже нарисованы
+    img = _base_template(width, height, color).copy()
+    draw = ImageDraw.Draw(img)
     
     # Текст
     if text:
         # Простой текст по центру
         text_y = height // 2 - 10
-        draw.text((width // 2 - 50, text_y), text, fill='black')
+        draw.text((width // 2 - 50, text_y), text, fill='black', font=_default_font())
     
-    img.save(filename)
+    # PNG без сжатия: файлы временные, а DOCX все равно упаковывается в ZIP
+    img.save(filename, 'PNG', compress_level=0, optimize=False)
     return filename
 
 
-def create_extended_document_1():
-    """Создание первого масштабного тестового документа."""
-    doc = Document()
-    
+def create_simple_image_star(spec):
+    """Создание изображения по кортежу аргументов create_simple_image."""
+    return create_simple_image(*spec)
+
+
+def generate_images(specs):
+    """
+    Параллельное создание изображений документа.
+    
+    Изображения независимы, поэтому сжатие PNG выполняется
+    в отдельных процессах на всех ядрах. Изображения с тем же содержимым
+    (ширина, высота, цвет, текст) создаются один раз за запуск скрипта.
+    
+    Returns:
+        Список путей к файлам изображений в порядке specs
+    """
+    pending = {}
+    for spec in specs:
+        key = spec[:4]
+        if key not in _png_cache:
+            pending.setdefault(key, spec)
+    
+    if pending:
+        if FAST_IMAGES:
+            # Однотонные изображения создаются быстрее запуска процессов
+            paths = list(map(create_simple_image_star, pending.values()))
+        else:
+            with ProcessPoolExecutor() as executor:
+                paths = list(executor.map(create_simple_image_star, pending.values()))
+        _png_cache.update(zip(pending, paths))
+    
+    return [_png_cache[spec[:4]] for spec in specs]
+
+
+def _cleanup_pngs():
+    """Удаление временных изображений при завершении скрипта."""
+    for path in _png_cache.values():
+        Path(path).unlink(missing_ok=True)
+
+
+atexit.register(_cleanup_pngs)
+
+
+# Запись готовых документов на диск в фоне, пока собирается следующий
+_SAVE_POOL = ThreadPoolExecutor(max_workers=2)
+_pending_saves = []
+
+
+def save_async(path, data):
+    """Фоновая запись содержимого документа в файл."""
+    _pending_saves.append(_SAVE_POOL.submit(Path(path).write_bytes, data))
+
+
+def flush_saves():
+    """Ожидание завершения фоновой записи (ошибки записи пробрасываются)."""
+    while _pending_saves:
+        _pending_saves.pop(0).result()
+
+
+atexit.register(flush_saves)
+
+
+# Заготовка абзаца маркированного списка: копируется для каждого пункта
+_BULLET_P = parse_xml(
+    '<w:p %s><w:pPr><w:pStyle w:val="ListBullet"/></w:pPr><w:r><w:t/></w:r></w:p>'
+    % nsdecls('w')
+)
+_XML_SPACE = '{http://www.w3.org/XML/1998/namespace}space'
+
+
+def bullet_p(text):
+    """Создание элемента абзаца маркированного списка (w:p)."""
+    p = copy.deepcopy(_BULLET_P)
+    t = p.find('.//' + qn('w:t'))
+    t.text = text
+    if text != text.strip():
+        t.set(_XML_SPACE, 'preserve')
+    return p
+
+
+def insert_elements(doc, elements):
+    """
+    Добавление элементов в конец документа одной вставкой.
+    
+    Элементы вставляются перед w:sectPr (как doc.add_paragraph),
+    поэтому простой body.extend не подходит.
+    """
+    body = doc.element.body
+    end = len(body) - 1 if body.sectPr is not None else len(body)
+    body[end:end] = elements
+
+
+def add_bullets(doc, bullets):
+    """Добавление абзацев маркированного списка одной вставкой."""
+    insert_elements(doc, [bullet_p(text) for text in bullets])
+
+
+# Шаблоны XML таблицы: та же разметка, что у doc.add_table,
+# но сразу со стилем и текстом ячеек
+TBL_TEMPLATE = (
+    '<w:tbl %s><w:tblPr><w:tblStyle w:val="{style_id}"/><w:tblW w:type="auto" w:w="0"/>'
+    '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0" '
+    'w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr>'
+    '<w:tblGrid>{grid}</w:tblGrid>{rows}</w:tbl>'
+) % nsdecls('w')
+GRID_COL_TEMPLATE = '<w:gridCol w:w="{width}"/>'
+ROW_TEMPLATE = '<w:tr>{cells}</w:tr>'
+CELL_TEMPLATE = '<w:tc><w:tcPr><w:tcW w:type="dxa" w:w="{width}"/></w:tcPr><w:p>{run}</w:p></w:tc>'
+
+
+def _run_xml(text):
+    """XML фрагмент w:r с текстом ячейки (None - ячейка без текста)."""
+    if text is None:
+        return ''
+    if not text:
+        return '<w:r/>'
+    space = ' xml:space="preserve"' if text != text.strip() else ''
+    return f'<w:r><w:t{space}>{escape(text)}</w:t></w:r>'
+
+
+def add_table_xml(doc, rows, header, data):
+    """
+    Добавление таблицы одним XML фрагментом.
+    
+    Таблица со стилем TABLE_STYLE строится по шаблонам и разбирается
+    одним вызовом parse_xml вместо создания пустой таблицы через
+    doc.add_table и заполнения ячеек по одной. Ширина колонок
+    распределяется так же, как в doc.add_table.
+    
+    Args:
+        doc: Документ
+        rows: Количество строк таблицы (вместе с заголовком)
+        header: Заголовки колонок
+        data: Строки данных
+    """
+    cols = len(header)
+    section = doc.sections[-1]
+    block_width = section.page_width - section.left_margin - section.right_margin
+    col_width = Emu(block_width / cols).twips
+    
+    all_rows = [header, *data]
+    all_rows += [()] * (rows - len(all_rows))
+    cell_xml = CELL_TEMPLATE.format
+    xml = TBL_TEMPLATE.format(
+        style_id=doc.styles[TABLE_STYLE].style_id,
+        grid=GRID_COL_TEMPLATE.format(width=col_width) * cols,
+        rows=''.join(
+            ROW_TEMPLATE.format(cells=''.join(
+                cell_xml(width=col_width, run=_run_xml(text))
+                for text in (*row_data, *[None] * (cols - len(row_data)))
+            ))
+            for row_data in all_rows
+        ),
+    )
+    insert_elements(doc, [parse_xml(xml)])
+
+
+# Описание документов: последовательность блоков в порядке следования.
+# Типы блоков:
+#   ('title', текст)                       - заголовок документа по центру
+#   ('page_break',)                        - разрыв страницы
+#   ('heading', текст, уровень)            - заголовок раздела
+#   ('para', текст)                        - абзац (пустая строка - пустой абзац)
+#   ('bullets', (пункты))                  - маркированный список
+#   ('table', строк, (заголовок), (данные)) - таблица
+#   ('image', ширина, высота, цвет, текст, ширина в дюймах) - изображение
+DOCUMENT_1 = (
     # Заголовок документа
-    title = doc.add_heading('Техническое задание на разработку информационной системы управления предприятием', 0)
-    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    ('title', 'Техническое задание на разработку информационной системы управления предприятием'),
     
     # Содержание
-    doc.add_page_break()
-    doc.add_heading('Содержание', 1)
-    doc.add_paragraph('1. Общие положения')
-    doc.add_paragraph('2. Требования к системе')
-    doc.add_paragraph('3. Функциональные требования')
-    doc.add_paragraph('4. Технические требования')
-    doc.add_paragraph('5. Требования к интерфейсу')
-    doc.add_paragraph('6. Требования к безопасности')
-    doc.add_paragraph('7. Этапы разработки')
-    doc.add_paragraph('8. Заключение')
+    ('page_break',),
+    ('heading', 'Содержание', 1),
+    ('para', '1. Общие положения'),
+    ('para', '2. Требования к системе'),
+    ('para', '3. Функциональные требования'),
+    ('para', '4. Технические требования'),
+    ('para', '5. Требования к интерфейсу'),
+    ('para', '6. Требования к безопасности'),
+    ('para', '7. Этапы разработки'),
+    ('para', '8. Заключение'),
     
     # Раздел 1
-    doc.add_page_break()
-    doc.add_heading('1. Общие положения', 1)
+    ('page_break',),
+    ('heading', '1. Общие положения', 1),
     
-    doc.add_paragraph(
+    ('para', (
         'Настоящее техническое задание определяет требования к разработке '
         'информационной системы управления предприятием. Система предназначена '
         'для комплексной автоматизации всех бизнес-процессов организации.'
-    )
+    )),
     
-    doc.add_heading('1.1. Назначение системы', 2)
+    ('heading', '1.1. Назначение системы', 2),
     
-    doc.add_paragraph(
+    ('para', (
         'Информационная система управления предприятием предназначена для решения '
         'следующих основных задач:'
-    )
+    )),
     
-    doc.add_paragraph('• Автоматизация учета и управления ресурсами предприятия', style='List Bullet')
-    doc.add_paragraph('• Управление документооборотом и делопроизводством', style='List Bullet')
-    doc.add_paragraph('• Контроль выполнения задач и проектов', style='List Bullet')
-    doc.add_paragraph('• Аналитика и формирование отчетности', style='List Bullet')
-    doc.add_paragraph('• Интеграция с внешними системами', style='List Bullet')
+    ('bullets', (
+        '• Автоматизация учета и управления ресурсами предприятия',
+        '• Управление документооборотом и делопроизводством',
+        '• Контроль выполнения задач и проектов',
+        '• Аналитика и формирование отчетности',
+        '• Интеграция с внешними системами'
+    )),
     
-    doc.add_heading('1.2. Область применения', 2)
+    ('heading', '1.2. Область применения', 2),
     
-    doc.add_paragraph(
+    ('para', (
         'Система предназначена для использования в организациях различных отраслей '
         'экономики. Может быть адаптирована под специфику конкретного предприятия.'
-    )
+    )),
     
     # Таблица 1 - Области применения
-    doc.add_heading('1.3. Области применения системы', 2)
-    
-    table1 = doc.add_table(rows=6, cols=2)
-    table1.style = 'Light Grid Accent 1'
-    header_cells = table1.rows[0].cells
-    header_cells[0].text = 'Отрасль'
-    header_cells[1].text = 'Применение'
-    
-    data1 = [
-        ['Производство', 'Управление производственными процессами'],
-        ['Торговля', 'Управление продажами и складом'],
-        ['Услуги', 'Управление клиентской базой'],
-        ['Строительство', 'Управление проектами'],
-        ['Образование', 'Управление учебным процессом']
-    ]
+    ('heading', '1.3. Области применения системы', 2),
     
-    for i, row_data in enumerate(data1, 1):
-        row_cells = table1.rows[i].cells
-        for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
+    ('table', 6, ('Отрасль', 'Применение'), (
+        ('Производство', 'Управление производственными процессами'),
+        ('Торговля', 'Управление продажами и складом'),
+        ('Услуги', 'Управление клиентской базой'),
+        ('Строительство', 'Управление проектами'),
+        ('Образование', 'Управление учебным процессом')
+    )),
     
     # Изображение 1
-    doc.add_paragraph()
-    doc.add_paragraph('Рисунок 1.1 - Схема архитектуры системы:')
-    img1_path = create_simple_image(500, 300, 'lightblue', 'Архитектура v1.0', '../documents/temp_img_ext1_1.png')
-    doc.add_picture(img1_path, width=Inches(5))
+    ('para', ''),
+    ('para', 'Рисунок 1.1 - Схема архитектуры системы:'),
+    ('image', 500, 300, 'lightblue', 'Архитектура v1.0', 5),
     
     # Раздел 2
-    doc.add_page_break()
-    doc.add_heading('2. Требования к системе', 1)
+    ('page_break',),
+    ('heading', '2. Требования к системе', 1),
     
-    doc.add_heading('2.1. Общие требования', 2)
+    ('heading', '2.1. Общие требования', 2),
     
-    doc.add_paragraph(
+    ('para', (
         'Система должна обеспечивать надежную работу в режиме 24/7. '
         'Время отклика системы не должно превышать 2 секунд для стандартных операций.'
-    )
+    )),
     
-    doc.add_heading('2.2. Требования к производительности', 2)
+    ('heading', '2.2. Требования к производительности', 2),
     
-    doc.add_paragraph(
+    ('para', (
         'Система должна обрабатывать не менее 5000 транзакций в минуту. '
         'Поддерживать одновременную работу не менее 500 пользователей.'
-    )
+    )),
     
     # Таблица 2 - Требования к производительности
-    table2 = doc.add_table(rows=5, cols=3)
-    table2.style = 'Light Grid Accent 1'
-    header_cells = table2.rows[0].cells
-    header_cells[0].text = 'Параметр'
-    header_cells[1].text = 'Требование'
-    header_cells[2].text = 'Единица измерения'
-    
-    data2 = [
-        ['Пропускная способность', '5000', 'транзакций/мин'],
-        ['Время отклика', '2', 'секунд'],
-        ['Количество пользователей', '500', 'одновременно'],
-        ['Доступность', '99.9', '%']
-    ]
-    
-    for i, row_data in enumerate(data2, 1):
-        row_cells = table2.rows[i].cells
-        for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
+    ('table', 5, ('Параметр', 'Требование', 'Единица измерения'), (
+        ('Пропускная способность', '5000', 'транзакций/мин'),
+        ('Время отклика', '2', 'секунд'),
+        ('Количество пользователей', '500', 'одновременно'),
+        ('Доступность', '99.9', '%')
+    )),
     
-    doc.add_heading('2.3. Требования к масштабируемости', 2)
+    ('heading', '2.3. Требования к масштабируемости', 2),
     
-    doc.add_paragraph(
+    ('para', (
         'Система должна поддерживать горизонтальное масштабирование. '
         'Возможность добавления новых серверов без остановки работы системы.'
-    )
+    )),
     
     # Изображение 2
-    doc.add_paragraph()
-    doc.add_paragraph('Рисунок 2.1 - Схема масштабирования:')
-    img2_path = create_simple_image(400, 250, 'lightgreen', 'Масштабирование', '../documents/temp_img_ext1_2.png')
-    doc.add_picture(img2_path, width=Inches(4))
+    ('para', ''),
+    ('para', 'Рисунок 2.1 - Схема масштабирования:'),
+    ('image', 400, 250, 'lightgreen', 'Масштабирование', 4),
     
     # Раздел 3
-    doc.add_page_break()
-    doc.add_heading('3. Функциональные требования', 1)
+    ('page_break',),
+    ('heading', '3. Функциональные требования', 1),
     
-    doc.add_heading('3.1. Модуль управления пользователями', 2)
+    ('heading', '3.1. Модуль управления пользователями', 2),
     
-    doc.add_paragraph(
+    ('para', (
         'Модуль должен обеспечивать создание, редактирование и удаление учетных записей пользователей. '
         'Поддержка ролевой модели доступа.'
-    )
+    )),
     
-    doc.add_heading('3.1.1. Управление ролями', 3)
+    ('heading', '3.1.1. Управление ролями', 3),
     
-    doc.add_paragraph('Система должна поддерживать следующие роли:')
-    doc.add_paragraph('• Администратор системы', style='List Bullet')
-    doc.add_paragraph('• Менеджер', style='List Bullet')
-    doc.add_paragraph('• Пользователь', style='List Bullet')
-    doc.add_paragraph('• Гость', style='List Bullet')
+    ('para', 'Система должна поддерживать следующие роли:'),
+    ('bullets', (
+        '• Администратор системы',
+        '• Менеджер',
+        '• Пользователь',
+        '• Гость'
+    )),
     
-    doc.add_heading('3.1.2. Аутентификация', 3)
+    ('heading', '3.1.2. Аутентификация', 3),
     
-    doc.add_paragraph(
+    ('para', (
         'Система должна обеспечивать безопасную аутентификацию пользователей. '
         'Поддержка двухфакторной аутентификации.'
-    )
+    )),
     
     # Таблица 3 - Роли и права доступа
-    table3 = doc.add_table(rows=5, cols=4)
-    table3.style = 'Light Grid Accent 1'
-    header_cells = table3.rows[0].cells
-    header_cells[0].text = 'Роль'
-    header_cells[1].text = 'Просмотр'
-    header_cells[2].text = 'Редактирование'
-    header_cells[3].text = 'Удаление'
-    
-    data3 = [
-        ['Администратор', 'Да', 'Да', 'Да'],
-        ['Менеджер', 'Да', 'Да', 'Нет'],
-        ['Пользователь', 'Да', 'Нет', 'Нет'],
-        ['Гость', 'Ограничен', 'Нет', 'Нет']
-    ]
-    
-    for i, row_data in enumerate(data3, 1):
-        row_cells = table3.rows[i].cells
-        for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
+    ('table', 5, ('Роль', 'Просмотр', 'Редактирование', 'Удаление'), (
+        ('Администратор', 'Да', 'Да', 'Да'),
+        ('Менеджер', 'Да', 'Да', 'Нет'),
+        ('Пользователь', 'Да', 'Нет', 'Нет'),
+        ('Гость', 'Ограничен', 'Нет', 'Нет')
+    )),
     
-    doc.add_heading('3.2. Модуль управления документами', 2)
+    ('heading', '3.2. Модуль управления документами', 2),
     
-    doc.add_paragraph(
+    ('para', (
         'Модуль обеспечивает полный цикл работы с документами: создание, редактирование, '
         'согласование, утверждение и архивирование.'
-    )
+    )),
     
-    doc.add_heading('3.2.1. Создание документов', 3)
+    ('heading', '3.2.1. Создание документов', 3),
     
-    doc.add_paragraph(
+    ('para', (
         'Система должна поддерживать создание документов различных типов: '
         'приказы, распоряжения, договоры, акты и другие.'
-    )
+    )),
     
-    doc.add_heading('3.2.2. Маршрутизация документов', 3)
+    ('heading', '3.2.2. Маршрутизация документов', 3),
     
-    doc.add_paragraph(
+    ('para', (
         'Система должна обеспечивать настройку маршрутов движения документов. '
         'Поддержка параллельного и последовательного согласования.'
-    )
+    )),
     
     # Изображение 3
-    doc.add_paragraph()
-    doc.add_paragraph('Рисунок 3.1 - Схема маршрутизации документов:')
-    img3_path = create_simple_image(450, 300, 'lightyellow', 'Маршрутизация', '../documents/temp_img_ext1_3.png')
-    doc.add_picture(img3_path, width=Inches(4.5))
+    ('para', ''),
+    ('para', 'Рисунок 3.1 - Схема маршрутизации документов:'),
+    ('image', 450, 300, 'lightyellow', 'Маршрутизация', 4.5),
     
-    doc.add_heading('3.3. Модуль отчетности', 2)
+    ('heading', '3.3. Модуль отчетности', 2),
     
-    doc.add_paragraph(
+    ('para', (
         'Модуль должен обеспечивать формирование различных типов отчетов: '
         'статистические, аналитические, регламентированные.'
-    )
+    )),
     
     # Таблица 4 - Типы отчетов
-    table4 = doc.add_table(rows=6, cols=2)
-    table4.style = 'Light Grid Accent 1'
-    header_cells = table4.rows[0].cells
-    header_cells[0].text = 'Тип отчета'
-    header_cells[1].text = 'Периодичность'
-    
-    data4 = [
-        ['Ежедневный', 'Ежедневно'],
-        ['Еженедельный', 'Еженедельно'],
-        ['Ежемесячный', 'Ежемесячно'],
-        ['Квартальный', 'Ежеквартально'],
-        ['Годовой', 'Ежегодно']
-    ]
-    
-    for i, row_data in enumerate(data4, 1):
-        row_cells = table4.rows[i].cells
-        for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
+    ('table', 6, ('Тип отчета', 'Периодичность'), (
+        ('Ежедневный', 'Ежедневно'),
+        ('Еженедельный', 'Еженедельно'),
+        ('Ежемесячный', 'Ежемесячно'),
+        ('Квартальный', 'Ежеквартально'),
+        ('Годовой', 'Ежегодно')
+    )),
     
     # Раздел 4
-    doc.add_page_break()
-    doc.add_heading('4. Технические требования', 1)
+    ('page_break',),
+    ('heading', '4. Технические требования', 1),
     
-    doc.add_heading('4.1. Требования к серверному оборудованию', 2)
+    ('heading', '4.1. Требования к серверному оборудованию', 2),
     
-    doc.add_paragraph(
+    ('para', (
         'Система должна работать на серверах с минимальными характеристиками: '
         'процессор не менее 4 ядер, оперативная память не менее 16 ГБ.'
-    )
+    )),
     
     # Таблица 5 - Требования к оборудованию
-    table5 = doc.add_table(rows=6, cols=3)
-    table5.style = 'Light Grid Accent 1'
-    header_cells = table5.rows[0].cells
-    header_cells[0].text = 'Компонент'
-    header_cells[1].text = 'Минимум'
-    header_cells[2].text = 'Рекомендуется'
-    
-    data5 = [
-        ['Процессор', '4 ядра', '8 ядер'],
-        ['ОЗУ', '16 ГБ', '32 ГБ'],
-        ['Диск', '500 ГБ SSD', '1 ТБ SSD'],
-        ['Сеть', '1 Гбит/с', '10 Гбит/с'],
-        ['ОС', 'Linux/Windows Server', 'Linux/Windows Server']
-    ]
-    
-    for i, row_data in enumerate(data5, 1):
-        row_cells = table5.rows[i].cells
-        for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
+    ('table', 6, ('Компонент', 'Минимум', 'Рекомендуется'), (
+        ('Процессор', '4 ядра', '8 ядер'),
+        ('ОЗУ', '16 ГБ', '32 ГБ'),
+        ('Диск', '500 ГБ SSD', '1 ТБ SSD'),
+        ('Сеть', '1 Гбит/с', '10 Гбит/с'),
+        ('ОС', 'Linux/Windows Server', 'Linux/Windows Server')
+    )),
     
-    doc.add_heading('4.2. Требования к программному обеспечению', 2)
+    ('heading', '4.2. Требования к программному обеспечению', 2),
     
-    doc.add_paragraph(
+    ('para', (
         'Система должна работать на следующих платформах: Windows Server 2016 и выше, '
         'Linux (Ubuntu 18.04 и выше, CentOS 7 и выше).'
-    )
+    )),
     
     # Изображение 4
-    doc.add_paragraph()
-    doc.add_paragraph('Рисунок 4.1 - Схема развертывания:')
-    img4_path = create_simple_image(500, 350, 'lightcoral', 'Развертывание', '../documents/temp_img_ext1_4.png')
-    doc.add_picture(img4_path, width=Inches(5))
+    ('para', ''),
+    ('para', 'Рисунок 4.1 - Схема развертывания:'),
+    ('image', 500, 350, 'lightcoral', 'Развертывание', 5),
     
     # Раздел 5
-    doc.add_page_break()
-    doc.add_heading('5. Требования к интерфейсу', 1)
+    ('page_break',),
+    ('heading', '5. Требования к интерфейсу', 1),
     
-    doc.add_heading('5.1. Общие требования', 2)
+    ('heading', '5.1. Общие требования', 2),
     
-    doc.add_paragraph(
+    ('para', (
         'Пользовательский интерфейс должен быть интуитивно понятным и удобным. '
         'Поддержка адаптивного дизайна для различных устройств.'
-    )
+    )),
     
-    doc.add_heading('5.2. Требования к дизайну', 2)
+    ('heading', '5.2. Требования к дизайну', 2),
     
-    doc.add_paragraph(
+    ('para', (
         'Интерфейс должен соответствовать современным стандартам дизайна. '
         'Поддержка темной и светлой темы оформления.'
-    )
+    )),
     
     # Раздел 6
-    doc.add_page_break()
-    doc.add_heading('6. Требования к безопасности', 1)
+    ('page_break',),
+    ('heading', '6. Требования к безопасности', 1),
     
-    doc.add_heading('6.1. Защита данных', 2)
+    ('heading', '6.1. Защита данных', 2),
     
-    doc.add_paragraph(
+    ('para', (
         'Система должна обеспечивать шифрование данных при передаче и хранении. '
         'Использование протоколов TLS 1.2 и выше.'
-    )
+    )),
     
     # Таблица 6 - Уровни безопасности
-    table6 = doc.add_table(rows=5, cols=2)
-    table6.style = 'Light Grid Accent 1'
-    header_cells = table6.rows[0].cells
-    header_cells[0].text = 'Уровень'
-    header_cells[1].text = 'Описание'
-    
-    data6 = [
-        ['Высокий', 'Шифрование всех данных'],
-        ['Средний', 'Шифрование критичных данных'],
-        ['Базовый', 'Стандартная защита']
-    ]
-    
-    for i, row_data in enumerate(data6, 1):
-        row_cells = table6.rows[i].cells
-        for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
+    ('table', 5, ('Уровень', 'Описание'), (
+        ('Высокий', 'Шифрование всех данных'),
+        ('Средний', 'Шифрование критичных данных'),
+        ('Базовый', 'Стандартная защита')
+    )),
     
-    doc.add_heading('6.2. Аудит и логирование', 2)
+    ('heading', '6.2. Аудит и логирование', 2),
     
-    doc.add_paragraph(
+    ('para', (
         'Система должна вести подробные логи всех операций. '
         'Хранение логов не менее 1 года.'
-    )
+    )),
     
     # Изображение 5
-    doc.add_paragraph()
-    doc.add_paragraph('Рисунок 6.1 - Схема безопасности:')
-    img5_path = create_simple_image(400, 300, 'lightpink', 'Безопасность', '../documents/temp_img_ext1_5.png')
-    doc.add_picture(img5_path, width=Inches(4))
+    ('para', ''),
+    ('para', 'Рисунок 6.1 - Схема безопасности:'),
+    ('image', 400, 300, 'lightpink', 'Безопасность', 4),
     
     # Раздел 7
-    doc.add_page_break()
-    doc.add_heading('7. Этапы разработки', 1)
+    ('page_break',),
+    ('heading', '7. Этапы разработки', 1),
     
-    doc.add_heading('7.1. Этап 1: Проектирование', 2)
+    ('heading', '7.1. Этап 1: Проектирование', 2),
     
-    doc.add_paragraph(
+    ('para', (
         'На этапе проектирования выполняется разработка архитектуры системы, '
         'проектирование базы данных, разработка технического проекта.'
-    )
+    )),
     
     # Таблица 7 - Этапы разработки
-    table7 = doc.add_table(rows=6, cols=3)
-    table7.style = 'Light Grid Accent 1'
-    header_cells = table7.rows[0].cells
-    header_cells[0].text = 'Этап'
-    header_cells[1].text = 'Срок'
-    header_cells[2].text = 'Результат'
-    
-    data7 = [
-        ['Проектирование', '2 месяца', 'Технический проект'],
-        ['Разработка', '6 месяцев', 'Рабочая версия'],
-        ['Тестирование', '2 месяца', 'Протестированная система'],
-        ['Внедрение', '1 месяц', 'Внедренная система'],
-        ['Поддержка', '12 месяцев', 'Стабильная работа']
-    ]
-    
-    for i, row_data in enumerate(data7, 1):
-        row_cells = table7.rows[i].cells
-        for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
+    ('table', 6, ('Этап', 'Срок', 'Результат'), (
+        ('Проектирование', '2 месяца', 'Технический проект'),
+        ('Разработка', '6 месяцев', 'Рабочая версия'),
+        ('Тестирование', '2 месяца', 'Протестированная система'),
+        ('Внедрение', '1 месяц', 'Внедренная система'),
+        ('Поддержка', '12 месяцев', 'Стабильная работа')
+    )),
     
-    doc.add_heading('7.2. Этап 2: Разработка', 2)
+    ('heading', '7.2. Этап 2: Разработка', 2),
     
-    doc.add_paragraph(
+    ('para', (
         'На этапе разработки выполняется программирование модулей системы, '
         'интеграция компонентов, разработка интерфейсов.'
-    )
+    )),
     
     # Изображение 6
-    doc.add_paragraph()
-    doc.add_paragraph('Рисунок 7.1 - Диаграмма Ганта:')
-    img6_path = create_simple_image(600, 200, 'lightcyan', 'Диаграмма Ганта', '../documents/temp_img_ext1_6.png')
-    doc.add_picture(img6_path, width=Inches(6))
+    ('para', ''),
+    ('para', 'Рисунок 7.1 - Диаграмма Ганта:'),
+    ('image', 600, 200, 'lightcyan', 'Диаграмма Ганта', 6),
     
     # Раздел 8
-    doc.add_page_break()
-    doc.add_heading('8. Заключение', 1)
+    ('page_break',),
+    ('heading', '8. Заключение', 1),
     
-    doc.add_paragraph(
+    ('para', (
         'Разработка системы должна быть выполнена в соответствии с настоящим '
         'техническим заданием. Срок разработки составляет 12 месяцев с момента '
         'подписания договора.'
-    )
+    )),
     
-    doc.add_paragraph(
+    ('para', (
         'Система должна пройти все этапы тестирования и быть готова к промышленной эксплуатации.'
-    )
-    
-    # Удаление временных файлов
-    temp_files = [
-        '../documents/temp_img_ext1_1.png', '../documents/temp_img_ext1_2.png',
-        '../documents/temp_img_ext1_3.png', '../documents/temp_img_ext1_4.png',
-        '../documents/temp_img_ext1_5.png', '../documents/temp_img_ext1_6.png'
-    ]
-    for f in temp_files:
-        if os.path.exists(f):
-            os.remove(f)
-    
-    doc.save('../documents/extended_test_document_1.docx')
-    print("Создан файл: ../documents/extended_test_document_1.docx")
-
+    )),
+)
 
-def create_extended_document_2():
-    """Создание второго масштабного тестового документа (с изменениями)."""
-    doc = Document()
-    
+# Вторая версия документа: грамматические изменения, измененные
+# и новые строки таблиц, новые разделы и изображения
+DOCUMENT_2 = (
     # Заголовок документа
-    title = doc.add_heading('Техническое задание на разработку информационной системы управления предприятием', 0)
-    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    ('title', 'Техническое задание на разработку информационной системы управления предприятием'),
     
     # Содержание (с изменениями)
-    doc.add_page_break()
-    doc.add_heading('Содержание', 1)
-    doc.add_paragraph('1. Общие положения')
-    doc.add_paragraph('2. Требования к системе')
-    doc.add_paragraph('3. Функциональные требования')
-    doc.add_paragraph('4. Технические требования')
-    doc.add_paragraph('5. Требования к интерфейсу')
-    doc.add_paragraph('6. Требования к безопасности')
-    doc.add_paragraph('7. Этапы разработки')
-    doc.add_paragraph('8. Интеграция с внешними системами')  # Новый раздел
-    doc.add_paragraph('9. Заключение')
+    ('page_break',),
+    ('heading', 'Содержание', 1),
+    ('para', '1. Общие положения'),
+    ('para', '2. Требования к системе'),
+    ('para', '3. Функциональные требования'),
+    ('para', '4. Технические требования'),
+    ('para', '5. Требования к интерфейсу'),
+    ('para', '6. Требования к безопасности'),
+    ('para', '7. Этапы разработки'),
+    ('para', '8. Интеграция с внешними системами'),  # Новый раздел
+    ('para', '9. Заключение'),
     
     # Раздел 1 (с грамматическими изменениями)
-    doc.add_page_break()
-    doc.add_heading('1. Общие положения', 1)
+    ('page_break',),
+    ('heading', '1. Общие положения', 1),
     
     # Грамматические изменения: добавлена запятая
-    doc.add_paragraph(
+    ('para', (
         'Настоящее техническое задание определяет требования к разработке '
         'информационной системы управления предприятием. Система предназначена '
         'для комплексной автоматизации всех бизнес-процессов организации, и повышения эффективности работы.'
-    )
+    )),
     
-    doc.add_heading('1.1. Назначение системы', 2)
+    ('heading', '1.1. Назначение системы', 2),
     
-    doc.add_paragraph(
+    ('para', (
         'Информационная система управления предприятием предназначена для решения '
         'следующих основных задач:'
-    )
+    )),
     
-    doc.add_paragraph('• Автоматизация учета и управления ресурсами предприятия', style='List Bullet')
-    doc.add_paragraph('• Управление документооборотом и делопроизводством', style='List Bullet')
-    doc.add_paragraph('• Контроль выполнения задач и проектов', style='List Bullet')
-    doc.add_paragraph('• Аналитика и формирование отчетности', style='List Bullet')
-    doc.add_paragraph('• Интеграция с внешними системами', style='List Bullet')
-    doc.add_paragraph('• Управление персоналом и кадровый учет', style='List Bullet')  # Новый пункт
+    ('bullets', (
+        '• Автоматизация учета и управления ресурсами предприятия',
+        '• Управление документооборотом и делопроизводством',
+        '• Контроль выполнения задач и проектов',
+        '• Аналитика и формирование отчетности',
+        '• Интеграция с внешними системами',
+        '• Управление персоналом и кадровый учет'  # Новый пункт
+    )),
     
-    doc.add_heading('1.2. Область применения', 2)
+    ('heading', '1.2. Область применения', 2),
     
     # Грамматические изменения: изменена пунктуация
-    doc.add_paragraph(
+    ('para', (
         'Система предназначена для использования в организациях различных отраслей '
         'экономики. Может быть адаптирована под специфику конкретного предприятия, и интегрирована с существующими системами.'
-    )
+    )),
     
     # Таблица 1 - Области применения (с изменениями)
-    doc.add_heading('1.3. Области применения системы', 2)
-    
-    table1 = doc.add_table(rows=7, cols=2)  # Добавлена строка
-    table1.style = 'Light Grid Accent 1'
-    header_cells = table1.rows[0].cells
-    header_cells[0].text = 'Отрасль'
-    header_cells[1].text = 'Применение'
-    
-    data1 = [
-        ['Производство', 'Управление производственными процессами и качеством'],
-        ['Торговля', 'Управление продажами, складом и логистикой'],  # Изменено
-        ['Услуги', 'Управление клиентской базой и сервисами'],
-        ['Строительство', 'Управление проектами и ресурсами'],  # Изменено
-        ['Образование', 'Управление учебным процессом и студентами'],  # Изменено
-        ['Медицина', 'Управление медицинскими записями']  # Новая строка
-    ]
+    ('heading', '1.3. Области применения системы', 2),
     
-    for i, row_data in enumerate(data1, 1):
-        row_cells = table1.rows[i].cells
-        for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
+    ('table', 7, ('Отрасль', 'Применение'), (  # Добавлена строка
+        ('Производство', 'Управление производственными процессами и качеством'),
+        ('Торговля', 'Управление продажами, складом и логистикой'),  # Изменено
+        ('Услуги', 'Управление клиентской базой и сервисами'),
+        ('Строительство', 'Управление проектами и ресурсами'),  # Изменено
+        ('Образование', 'Управление учебным процессом и студентами'),  # Изменено
+        ('Медицина', 'Управление медицинскими записями')  # Новая строка
+    )),
     
     # Изображение 1 (измененное)
-    doc.add_paragraph()
-    doc.add_paragraph('Рисунок 1.1 - Схема архитектуры системы:')
-    img1_path = create_simple_image(500, 300, 'lightgreen', 'Архитектура v2.0', '../documents/temp_img_ext2_1.png')  # Изменен цвет и текст
-    doc.add_picture(img1_path, width=Inches(5))
+    ('para', ''),
+    ('para', 'Рисунок 1.1 - Схема архитектуры системы:'),
+    ('image', 500, 300, 'lightgreen', 'Архитектура v2.0', 5),  # Изменен цвет и текст
     
     # Раздел 2 (с изменениями)
-    doc.add_page_break()
-    doc.add_heading('2. Требования к системе', 1)
+    ('page_break',),
+    ('heading', '2. Требования к системе', 1),
     
-    doc.add_heading('2.1. Общие требования', 2)
+    ('heading', '2.1. Общие требования', 2),
     
     # Грамматические изменения: изменена запятая
-    doc.add_paragraph(
+    ('para', (
         'Система должна обеспечивать надежную работу в режиме 24/7. '
         'Время отклика системы не должно превышать 1.5 секунд для стандартных операций.'  # Изменено значение
-    )
+    )),
     
-    doc.add_heading('2.2. Требования к производительности', 2)
+    ('heading', '2.2. Требования к производительности', 2),
     
     # Изменения: новые значения
-    doc.add_paragraph(
+    ('para', (
         'Система должна обрабатывать не менее 8000 транзакций в минуту. '  # Изменено
         'Поддерживать одновременную работу не менее 1000 пользователей.'  # Изменено
-    )
+    )),
     
     # Таблица 2 - Требования к производительности (с изменениями)
-    table2 = doc.add_table(rows=6, cols=3)  # Добавлена строка
-    table2.style = 'Light Grid Accent 1'
-    header_cells = table2.rows[0].cells
-    header_cells[0].text = 'Параметр'
-    header_cells[1].text = 'Требование'
-    header_cells[2].text = 'Единица измерения'
-    
-    data2 = [
-        ['Пропускная способность', '8000', 'транзакций/мин'],  # Изменено
-        ['Время отклика', '1.5', 'секунд'],  # Изменено
-        ['Количество пользователей', '1000', 'одновременно'],  # Изменено
-        ['Доступность', '99.95', '%'],  # Изменено
-        ['Версия системы', '2.0.4', '']  # Новая строка
-    ]
+    ('table', 6, ('Параметр', 'Требование', 'Единица измерения'), (  # Добавлена строка
+        ('Пропускная способность', '8000', 'транзакций/мин'),  # Изменено
+        ('Время отклика', '1.5', 'секунд'),  # Изменено
+        ('Количество пользователей', '1000', 'одновременно'),  # Изменено
+        ('Доступность', '99.95', '%'),  # Изменено
+        ('Версия системы', '2.0.4', '')  # Новая строка
+    )),
     
-    for i, row_data in enumerate(data2, 1):
-        row_cells = table2.rows[i].cells
-        for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
-    
-    doc.add_heading('2.3. Требования к масштабируемости', 2)
+    ('heading', '2.3. Требования к масштабируемости', 2),
     
     # Грамматические изменения: добавлена запятая
-    doc.add_paragraph(
+    ('para', (
         'Система должна поддерживать горизонтальное масштабирование, и вертикальное масштабирование. '
         'Возможность добавления новых серверов без остановки работы системы.'
-    )
+    )),
     
     # Изображение 2 (новое)
-    doc.add_paragraph()
-    doc.add_paragraph('Рисунок 2.1 - Схема масштабирования:')
-    img2_path = create_simple_image(400, 250, 'lightblue', 'Масштабирование v2', '../documents/temp_img_ext2_2.png')
-    doc.add_picture(img2_path, width=Inches(4))
+    ('para', ''),
+    ('para', 'Рисунок 2.1 - Схема масштабирования:'),
+    ('image', 400, 250, 'lightblue', 'Масштабирование v2', 4),
     
     # Новое изображение
-    doc.add_paragraph()
-    doc.add_paragraph('Рисунок 2.2 - Схема кластеризации:')
-    img2_2_path = create_simple_image(350, 200, 'lightyellow', 'Кластер', '../documents/temp_img_ext2_2_2.png')
-    doc.add_picture(img2_2_path, width=Inches(3.5))
+    ('para', ''),
+    ('para', 'Рисунок 2.2 - Схема кластеризации:'),
+    ('image', 350, 200, 'lightyellow', 'Кластер', 3.5),
     
     # Раздел 3 (с изменениями)
-    doc.add_page_break()
-    doc.add_heading('3. Функциональные требования', 1)
+    ('page_break',),
+    ('heading', '3. Функциональные требования', 1),
     
-    doc.add_heading('3.1. Модуль управления пользователями', 2)
+    ('heading', '3.1. Модуль управления пользователями', 2),
     
     # Грамматические изменения: изменена пунктуация
-    doc.add_paragraph(
+    ('para', (
         'Модуль должен обеспечивать создание, редактирование, и удаление учетных записей пользователей. '
         'Поддержка ролевой модели доступа, и многофакторной аутентификации.'
-    )
+    )),
     
-    doc.add_heading('3.1.1. Управление ролями', 3)
+    ('heading', '3.1.1. Управление ролями', 3),
     
-    doc.add_paragraph('Система должна поддерживать следующие роли:')
-    doc.add_paragraph('• Администратор системы', style='List Bullet')
-    doc.add_paragraph('• Менеджер', style='List Bullet')
-    doc.add_paragraph('• Пользователь', style='List Bullet')
-    doc.add_paragraph('• Гость', style='List Bullet')
-    doc.add_paragraph('• Аудитор', style='List Bullet')  # Новый пункт
+    ('para', 'Система должна поддерживать следующие роли:'),
+    ('bullets', (
+        '• Администратор системы',
+        '• Менеджер',
+        '• Пользователь',
+        '• Гость',
+        '• Аудитор'  # Новый пункт
+    )),
     
-    doc.add_heading('3.1.2. Аутентификация', 3)
+    ('heading', '3.1.2. Аутентификация', 3),
     
     # Изменения: добавлен текст
-    doc.add_paragraph(
+    ('para', (
         'Система должна обеспечивать безопасную аутентификацию пользователей. '
         'Поддержка двухфакторной аутентификации, биометрической аутентификации, и интеграции с Active Directory.'
-    )
+    )),
     
     # Таблица 3 - Роли и права доступа (с изменениями)
-    table3 = doc.add_table(rows=6, cols=4)  # Добавлена строка
-    table3.style = 'Light Grid Accent 1'
-    header_cells = table3.rows[0].cells
-    header_cells[0].text = 'Роль'
-    header_cells[1].text = 'Просмотр'
-    header_cells[2].text = 'Редактирование'
-    header_cells[3].text = 'Удаление'
-    
-    data3 = [
-        ['Администратор', 'Да', 'Да', 'Да'],
-        ['Менеджер', 'Да', 'Да', 'Ограничен'],  # Изменено
-        ['Пользователь', 'Да', 'Нет', 'Нет'],
-        ['Гость', 'Ограничен', 'Нет', 'Нет'],  # Изменено
-        ['Аудитор', 'Да', 'Нет', 'Нет']  # Новая строка
-    ]
+    ('table', 6, ('Роль', 'Просмотр', 'Редактирование', 'Удаление'), (  # Добавлена строка
+        ('Администратор', 'Да', 'Да', 'Да'),
+        ('Менеджер', 'Да', 'Да', 'Ограничен'),  # Изменено
+        ('Пользователь', 'Да', 'Нет', 'Нет'),
+        ('Гость', 'Ограничен', 'Нет', 'Нет'),  # Изменено
+        ('Аудитор', 'Да', 'Нет', 'Нет')  # Новая строка
+    )),
     
-    for i, row_data in enumerate(data3, 1):
-        row_cells = table3.rows[i].cells
-        for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
-    
-    doc.add_heading('3.2. Модуль управления документами', 2)
+    ('heading', '3.2. Модуль управления документами', 2),
     
     # Грамматические изменения: изменена запятая
-    doc.add_paragraph(
+    ('para', (
         'Модуль обеспечивает полный цикл работы с документами: создание, редактирование, '
         'согласование, утверждение, архивирование, и удаление.'
-    )
+    )),
     
-    doc.add_heading('3.2.1. Создание документов', 3)
+    ('heading', '3.2.1. Создание документов', 3),
     
     # Изменения: добавлен текст
-    doc.add_paragraph(
+    ('para', (
         'Система должна поддерживать создание документов различных типов: '
         'приказы, распоряжения, договоры, акты, протоколы, и другие. Поддержка шаблонов документов.'
-    )
+    )),
     
-    doc.add_heading('3.2.2. Маршрутизация документов', 3)
+    ('heading', '3.2.2. Маршрутизация документов', 3),
     
     # Грамматические изменения: изменена пунктуация
-    doc.add_paragraph(
+    ('para', (
         'Система должна обеспечивать настройку маршрутов движения документов. '
         'Поддержка параллельного, последовательного, и условного согласования.'
-    )
+    )),
     
     # Изображение 3 (измененное)
-    doc.add_paragraph()
-    doc.add_paragraph('Рисунок 3.1 - Схема маршрутизации документов:')
-    img3_path = create_simple_image(450, 300, 'lightcoral', 'Маршрутизация v2', '../documents/temp_img_ext2_3.png')  # Изменен цвет
-    doc.add_picture(img3_path, width=Inches(4.5))
+    ('para', ''),
+    ('para', 'Рисунок 3.1 - Схема маршрутизации документов:'),
+    ('image', 450, 300, 'lightcoral', 'Маршрутизация v2', 4.5),  # Изменен цвет
     
-    doc.add_heading('3.3. Модуль отчетности', 2)
+    ('heading', '3.3. Модуль отчетности', 2),
     
     # Грамматические изменения: добавлена запятая
-    doc.add_paragraph(
+    ('para', (
         'Модуль должен обеспечивать формирование различных типов отчетов: '
         'статистические, аналитические, регламентированные, и пользовательские.'
-    )
+    )),
     
     # Таблица 4 - Типы отчетов (с изменениями)
-    table4 = doc.add_table(rows=7, cols=2)  # Добавлена строка
-    table4.style = 'Light Grid Accent 1'
-    header_cells = table4.rows[0].cells
-    header_cells[0].text = 'Тип отчета'
-    header_cells[1].text = 'Периодичность'
-    
-    data4 = [
-        ['Ежедневный', 'Ежедневно'],
-        ['Еженедельный', 'Еженедельно'],
-        ['Ежемесячный', 'Ежемесячно'],
-        ['Квартальный', 'Ежеквартально'],
-        ['Годовой', 'Ежегодно'],
-        ['По требованию', 'По запросу']  # Новая строка
-    ]
-    
-    for i, row_data in enumerate(data4, 1):
-        row_cells = table4.rows[i].cells
-        for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
+    ('table', 7, ('Тип отчета', 'Периодичность'), (  # Добавлена строка
+        ('Ежедневный', 'Ежедневно'),
+        ('Еженедельный', 'Еженедельно'),
+        ('Ежемесячный', 'Ежемесячно'),
+        ('Квартальный', 'Ежеквартально'),
+        ('Годовой', 'Ежегодно'),
+        ('По требованию', 'По запросу')  # Новая строка
+    )),
     
     # Раздел 4 (с изменениями)
-    doc.add_page_break()
-    doc.add_heading('4. Технические требования', 1)
+    ('page_break',),
+    ('heading', '4. Технические требования', 1),
     
-    doc.add_heading('4.1. Требования к серверному оборудованию', 2)
+    ('heading', '4.1. Требования к серверному оборудованию', 2),
     
     # Изменения: новые значения
-    doc.add_paragraph(
+    ('para', (
         'Система должна работать на серверах с минимальными характеристиками: '
         'процессор не менее 8 ядер, оперативная память не менее 32 ГБ.'  # Изменено
-    )
+    )),
     
     # Таблица 5 - Требования к оборудованию (с изменениями)
-    table5 = doc.add_table(rows=6, cols=3)
-    table5.style = 'Light Grid Accent 1'
-    header_cells = table5.rows[0].cells
-    header_cells[0].text = 'Компонент'
-    header_cells[1].text = 'Минимум'
-    header_cells[2].text = 'Рекомендуется'
-    
-    data5 = [
-        ['Процессор', '8 ядер', '16 ядер'],  # Изменено
-        ['ОЗУ', '32 ГБ', '64 ГБ'],  # Изменено
-        ['Диск', '1 ТБ SSD', '2 ТБ SSD'],  # Изменено
-        ['Сеть', '10 Гбит/с', '25 Гбит/с'],  # Изменено
-        ['ОС', 'Linux/Windows Server', 'Linux/Windows Server']
-    ]
+    ('table', 6, ('Компонент', 'Минимум', 'Рекомендуется'), (
+        ('Процессор', '8 ядер', '16 ядер'),  # Изменено
+        ('ОЗУ', '32 ГБ', '64 ГБ'),  # Изменено
+        ('Диск', '1 ТБ SSD', '2 ТБ SSD'),  # Изменено
+        ('Сеть', '10 Гбит/с', '25 Гбит/с'),  # Изменено
+        ('ОС', 'Linux/Windows Server', 'Linux/Windows Server')
+    )),
     
-    for i, row_data in enumerate(data5, 1):
-        row_cells = table5.rows[i].cells
-        for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
-    
-    doc.add_heading('4.2. Требования к программному обеспечению', 2)
+    ('heading', '4.2. Требования к программному обеспечению', 2),
     
     # Грамматические изменения: изменена пунктуация
-    doc.add_paragraph(
+    ('para', (
         'Система должна работать на следующих платформах: Windows Server 2016 и выше, '
         'Linux (Ubuntu 18.04 и выше, CentOS 7 и выше, Debian 10 и выше).'  # Добавлено
-    )
+    )),
     
     # Изображение 4 (измененное)
-    doc.add_paragraph()
-    doc.add_paragraph('Рисунок 4.1 - Схема развертывания:')
-    img4_path = create_simple_image(500, 350, 'lightpink', 'Развертывание v2', '../documents/temp_img_ext2_4.png')  # Изменен цвет
-    doc.add_picture(img4_path, width=Inches(5))
+    ('para', ''),
+    ('para', 'Рисунок 4.1 - Схема развертывания:'),
+    ('image', 500, 350, 'lightpink', 'Развертывание v2', 5),  # Изменен цвет
     
     # Раздел 5 (с изменениями)
-    doc.add_page_break()
-    doc.add_heading('5. Требования к интерфейсу', 1)
+    ('page_break',),
+    ('heading', '5. Требования к интерфейсу', 1),
     
-    doc.add_heading('5.1. Общие требования', 2)
+    ('heading', '5.1. Общие требования', 2),
     
     # Грамматические изменения: изменена пунктуация
-    doc.add_paragraph(
+    ('para', (
         'Пользовательский интерфейс должен быть интуитивно понятным, и удобным. '
         'Поддержка адаптивного дизайна для различных устройств, и мобильных приложений.'
-    )
+    )),
     
-    doc.add_heading('5.2. Требования к дизайну', 2)
+    ('heading', '5.2. Требования к дизайну', 2),
     
     # Изменения: добавлен текст
-    doc.add_paragraph(
+    ('para', (
         'Интерфейс должен соответствовать современным стандартам дизайна. '
         'Поддержка темной и светлой темы оформления. Поддержка кастомизации цветовой схемы.'
-    )
+    )),
     
     # Раздел 6 (с изменениями)
-    doc.add_page_break()
-    doc.add_heading('6. Требования к безопасности', 1)
+    ('page_break',),
+    ('heading', '6. Требования к безопасности', 1),
     
-    doc.add_heading('6.1. Защита данных', 2)
+    ('heading', '6.1. Защита данных', 2),
     
     # Грамматические изменения: изменена пунктуация
-    doc.add_paragraph(
+    ('para', (
         'Система должна обеспечивать шифрование данных при передаче, и хранении. '
         'Использование протоколов TLS 1.3 и выше.'  # Изменено
-    )
+    )),
     
     # Таблица 6 - Уровни безопасности (с изменениями)
-    table6 = doc.add_table(rows=5, cols=2)
-    table6.style = 'Light Grid Accent 1'
-    header_cells = table6.rows[0].cells
-    header_cells[0].text = 'Уровень'
-    header_cells[1].text = 'Описание'
-    
-    data6 = [
-        ['Высокий', 'Шифрование всех данных, двухфакторная аутентификация'],  # Изменено
-        ['Средний', 'Шифрование критичных данных, однофакторная аутентификация'],  # Изменено
-        ['Базовый', 'Стандартная защита, парольная аутентификация']  # Изменено
-    ]
-    
-    for i, row_data in enumerate(data6, 1):
-        row_cells = table6.rows[i].cells
-        for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
+    ('table', 5, ('Уровень', 'Описание'), (
+        ('Высокий', 'Шифрование всех данных, двухфакторная аутентификация'),  # Изменено
+        ('Средний', 'Шифрование критичных данных, однофакторная аутентификация'),  # Изменено
+        ('Базовый', 'Стандартная защита, парольная аутентификация')  # Изменено
+    )),
     
-    doc.add_heading('6.2. Аудит и логирование', 2)
+    ('heading', '6.2. Аудит и логирование', 2),
     
     # Изменения: изменены значения
-    doc.add_paragraph(
+    ('para', (
         'Система должна вести подробные логи всех операций. '
         'Хранение логов не менее 3 лет.'  # Изменено
-    )
+    )),
     
     # Изображение 5 (измененное)
-    doc.add_paragraph()
-    doc.add_paragraph('Рисунок 6.1 - Схема безопасности:')
-    img5_path = create_simple_image(400, 300, 'lightcyan', 'Безопасность v2', '../documents/temp_img_ext2_5.png')  # Изменен цвет
-    doc.add_picture(img5_path, width=Inches(4))
+    ('para', ''),
+    ('para', 'Рисунок 6.1 - Схема безопасности:'),
+    ('image', 400, 300, 'lightcyan', 'Безопасность v2', 4),  # Изменен цвет
     
     # Раздел 7 (с изменениями)
-    doc.add_page_break()
-    doc.add_heading('7. Этапы разработки', 1)
+    ('page_break',),
+    ('heading', '7. Этапы разработки', 1),
     
-    doc.add_heading('7.1. Этап 1: Проектирование', 2)
+    ('heading', '7.1. Этап 1: Проектирование', 2),
     
     # Грамматические изменения: изменена пунктуация
-    doc.add_paragraph(
+    ('para', (
         'На этапе проектирования выполняется разработка архитектуры системы, '
         'проектирование базы данных, разработка технического проекта, и создание прототипов интерфейсов.'
-    )
+    )),
     
     # Таблица 7 - Этапы разработки (с изменениями)
-    table7 = doc.add_table(rows=6, cols=3)
-    table7.style = 'Light Grid Accent 1'
-    header_cells = table7.rows[0].cells
-    header_cells[0].text = 'Этап'
-    header_cells[1].text = 'Срок'
-    header_cells[2].text = 'Результат'
-    
-    data7 = [
-        ['Проектирование', '3 месяца', 'Технический проект'],  # Изменено
-        ['Разработка', '8 месяцев', 'Рабочая версия'],  # Изменено
-        ['Тестирование', '2 месяца', 'Протестированная система'],
-        ['Внедрение', '1 месяц', 'Внедренная система'],
-        ['Поддержка', '24 месяца', 'Стабильная работа']  # Изменено
-    ]
+    ('table', 6, ('Этап', 'Срок', 'Результат'), (
+        ('Проектирование', '3 месяца', 'Технический проект'),  # Изменено
+        ('Разработка', '8 месяцев', 'Рабочая версия'),  # Изменено
+        ('Тестирование', '2 месяца', 'Протестированная система'),
+        ('Внедрение', '1 месяц', 'Внедренная система'),
+        ('Поддержка', '24 месяца', 'Стабильная работа')  # Изменено
+    )),
     
-    for i, row_data in enumerate(data7, 1):
-        row_cells = table7.rows[i].cells
-        for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
-    
-    doc.add_heading('7.2. Этап 2: Разработка', 2)
+    ('heading', '7.2. Этап 2: Разработка', 2),
     
     # Изменения: добавлен текст
-    doc.add_paragraph(
+    ('para', (
         'На этапе разработки выполняется программирование модулей системы, '
         'интеграция компонентов, разработка интерфейсов, и написание документации.'
-    )
+    )),
     
     # Изображение 6 (измененное)
-    doc.add_paragraph()
-    doc.add_paragraph('Рисунок 7.1 - Диаграмма Ганта:')
-    img6_path = create_simple_image(600, 200, 'lightsteelblue', 'Диаграмма Ганта v2', '../documents/temp_img_ext2_6.png')  # Изменен цвет
-    doc.add_picture(img6_path, width=Inches(6))
+    ('para', ''),
+    ('para', 'Рисунок 7.1 - Диаграмма Ганта:'),
+    ('image', 600, 200, 'lightsteelblue', 'Диаграмма Ганта v2', 6),  # Изменен цвет
     
     # Новый раздел 8
-    doc.add_page_break()
-    doc.add_heading('8. Интеграция с внешними системами', 1)
+    ('page_break',),
+    ('heading', '8. Интеграция с внешними системами', 1),
     
-    doc.add_heading('8.1. Типы интеграций', 2)
+    ('heading', '8.1. Типы интеграций', 2),
     
-    doc.add_paragraph(
+    ('para', (
         'Система должна поддерживать интеграцию с различными внешними системами: '
         '1С, SAP, Oracle, Microsoft Dynamics, и другими.'
-    )
+    )),
     
     # Таблица 8 - Интеграции (новая таблица)
-    table8 = doc.add_table(rows=5, cols=2)
-    table8.style = 'Light Grid Accent 1'
-    header_cells = table8.rows[0].cells
-    header_cells[0].text = 'Система'
-    header_cells[1].text = 'Тип интеграции'
-    
-    data8 = [
-        ['1С', 'API, файловый обмен'],
-        ['SAP', 'RFC, IDoc'],
-        ['Oracle', 'API, база данных'],
-        ['Microsoft Dynamics', 'API, веб-сервисы']
-    ]
-    
-    for i, row_data in enumerate(data8, 1):
-        row_cells = table8.rows[i].cells
-        for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
+    ('table', 5, ('Система', 'Тип интеграции'), (
+        ('1С', 'API, файловый обмен'),
+        ('SAP', 'RFC, IDoc'),
+        ('Oracle', 'API, база данных'),
+        ('Microsoft Dynamics', 'API, веб-сервисы')
+    )),
     
     # Изображение 7 (новое)
-    doc.add_paragraph()
-    doc.add_paragraph('Рисунок 8.1 - Схема интеграций:')
-    img7_path = create_simple_image(500, 300, 'lightgoldenrodyellow', 'Интеграции', '../documents/temp_img_ext2_7.png')
-    doc.add_picture(img7_path, width=Inches(5))
+    ('para', ''),
+    ('para', 'Рисунок 8.1 - Схема интеграций:'),
+    ('image', 500, 300, 'lightgoldenrodyellow', 'Интеграции', 5),
     
     # Раздел 9 (было 8)
-    doc.add_page_break()
-    doc.add_heading('9. Заключение', 1)
+    ('page_break',),
+    ('heading', '9. Заключение', 1),
     
     # Грамматические изменения: изменена пунктуация
-    doc.add_paragraph(
+    ('para', (
         'Разработка системы должна быть выполнена в соответствии с настоящим '
         'техническим заданием. Срок разработки составляет 14 месяцев с момента '
         'подписания договора.'  # Изменено
-    )
+    )),
     
-    doc.add_paragraph(
+    ('para', (
         'Система должна пройти все этапы тестирования, и быть готова к промышленной эксплуатации.'
-    )
-    
-    # Удаление временных файлов
-    temp_files = [
-        '../documents/temp_img_ext2_1.png', '../documents/temp_img_ext2_2.png',
-        '../documents/temp_img_ext2_2_2.png', '../documents/temp_img_ext2_3.png',
-        '../documents/temp_img_ext2_4.png', '../documents/temp_img_ext2_5.png',
-        '../documents/temp_img_ext2_6.png', '../documents/temp_img_ext2_7.png'
+    )),
+)
+
+
+def zip_rewrite(data, compression=zipfile.ZIP_STORED):
+    """
+    Перепаковка ZIP архива (DOCX) с другим методом сжатия.
+    
+    python-docx всегда сохраняет части документа со сжатием DEFLATE.
+    Несжатый DOCX в несколько раз больше, поэтому используется только
+    для временных документов (FAST_IMAGES=1).
+    
+    Args:
+        data: Содержимое архива
+        compression: Метод сжатия частей
+    
+    Returns:
+        Содержимое перепакованного архива
+    """
+    with zipfile.ZipFile(io.BytesIO(data)) as src:
+        entries = [(info, src.read(info)) for info in src.infolist()]
+    
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression) as dst:
+        for info, content in entries:
+            info.compress_type = compression
+            dst.writestr(info, content)
+    return buffer.getvalue()
+
+
+def build_document(sections, output_path):
+    """
+    Сборка DOCX документа по описанию блоков.
+    
+    Args:
+        sections: Последовательность блоков документа (см. DOCUMENT_1)
+        output_path: Путь к создаваемому DOCX файлу
+    """
+    # Изображения создаются заранее, до сборки документа
+    output_dir, output_name = os.path.split(output_path)
+    stem = os.path.splitext(output_name)[0]
+    image_blocks = [block for block in sections if block[0] == 'image']
+    images = [
+        block[1:5] + (os.path.join(output_dir, f'temp_{stem}_img{i}.png'),)
+        for i, block in enumerate(image_blocks, 1)
     ]
-    for f in temp_files:
-        if os.path.exists(f):
-            os.remove(f)
-    
-    doc.save('../documents/extended_test_document_2.docx')
-    print("Создан файл: ../documents/extended_test_document_2.docx")
+    img_paths = generate_images(images)
+    next_image = iter(img_paths).__next__
+    
+    doc = copy.deepcopy(_template())
+    # Методы документа связываются один раз на весь цикл
+    add_heading = doc.add_heading
+    add_paragraph = doc.add_paragraph
+    for block in sections:
+        kind = block[0]
+        if kind == 'title':
+            title = add_heading(block[1], 0)
+            title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        elif kind == 'page_break':
+            doc.add_page_break()
+        elif kind == 'heading':
+            add_heading(block[1], block[2])
+        elif kind == 'para':
+            add_paragraph(block[1])
+        elif kind == 'bullets':
+            add_bullets(doc, block[1])
+        elif kind == 'table':
+            _, rows, header, data = block
+            add_table_xml(doc, rows, header, data)
+        elif kind == 'image':
+            doc.add_picture(next_image(), width=Inches(block[5]))
+        else:
+            raise ValueError(f"Неизвестный тип блока: {kind}")
+    
+    # Документ собирается в памяти и записывается на диск одним вызовом в фоне
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    data = buffer.getvalue()
+    if FAST_IMAGES:
+        # Временные документы: без сжатия частей при чтении
+        data = zip_rewrite(data)
+    save_async(output_path, data)
+    print(f"Создан файл: {output_path}")
+
+
+def create_extended_document_1():
+    """Создание первого масштабного тестового документа."""
+    build_document(DOCUMENT_1, '../documents/extended_test_document_1.docx')
+
+
+def create_extended_document_2():
+    """Создание второго масштабного тестового документа (с изменениями)."""
+    build_document(DOCUMENT_2, '../documents/extended_test_document_2.docx')
+
+
+def _run(builder):
+    """Запуск функции создания документа в процессе пула."""
+    try:
+        builder()
+    finally:
+        # Обработчики atexit в процессах пула не вызываются
+        flush_saves()
+        _cleanup_pngs()
 
 
 if __name__ == "__main__":
     print("Создание масштабных тестовых документов...")
     print("=" * 60)
     
-    create_extended_document_1()
-    create_extended_document_2()
+    # Документы независимы и создаются параллельно
+    builders = [create_extended_document_1, create_extended_document_2]
+    with ProcessPoolExecutor(max_workers=len(builders)) as executor:
+        list(executor.map(_run, builders))
     
     print("=" * 60)
     print("Все масштабные тестовые документы созданы успешно!")
@@ -6,9 +6,95 @@ from docx import Document
 from docx.shared import Pt, RGBColor, Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from PIL import Image, ImageDraw, ImageFont
-import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import io
 
+# Стиль таблиц и общий заголовок таблицы технических характеристик
+TABLE_STYLE = 'Light Grid Accent 1'
+HEADERS_TECH = ('Параметр', 'Требование', 'Примечание')
+
+
+def _set_tc_text(tc, text):
+    """Замена содержимого ячейки (w:tc) одним абзацем с текстом."""
+    tc.clear_content()
+    tc.add_p().add_r().text = text
+
+
+# Пул буферов изображений: (ширина, высота) -> свободные изображения
+_IMG_POOL = {}
+
+
+def acquire_image(width, height, color):
+    """Изображение из пула (или новое), залитое цветом фона."""
+    bucket = _IMG_POOL.setdefault((width, height), [])
+    if not bucket:
+        return Image.new('RGB', (width, height), color=color)
+    img = bucket.pop()
+    ImageDraw.Draw(img).rectangle([0, 0, width, height], fill=color)
+    return img
+
+
+def release_image(img):
+    """Возврат изображения в пул после добавления в документ."""
+    _IMG_POOL[img.size].append(img)
+
+
+def image_stream(img):
+    """Изображение PNG в памяти для doc.add_picture."""
+    buffer = io.BytesIO()
+    img.save(buffer, format='PNG')
+    buffer.seek(0)
+    return buffer
+
+
+@lru_cache(maxsize=8)
+def _make_row_filler(ncols):
+    """
+    Функция заполнения строк таблицы с ncols столбцами.
+    
+    Код генерируется под число столбцов: ячейки строки заполняются
+    последовательными присваиваниями, без внутреннего цикла по столбцам.
+    """
+    src = 'def fill_rows(trs, rows):\n'
+    src += '    for tr, row in zip(trs, rows):\n'
+    src += '        tcs = tr.tc_lst\n'
+    src += ''.join(f'        set_text(tcs[{j}], row[{j}])\n' for j in range(ncols))
+    namespace = {'set_text': _set_tc_text}
+    exec(src, namespace)
+    return namespace['fill_rows']
+
+
+def fill_table_fast(table, header, data):
+    """
+    Заполнение таблицы заголовком и строками данных.
+    
+    Строки (w:tr) и ячейки (w:tc) перебираются напрямую по XML за один
+    проход, без table.rows[i].cells и свойства cell.text. Каждая строка
+    данных должна содержать len(header) значений.
+    """
+    trs = table._tbl.tr_lst
+    fill_rows = _make_row_filler(len(header))
+    fill_rows(trs[:1], (header,))
+    fill_rows(trs[1:], data)
+
+
+def bulk_paragraphs(doc, items):
+    """
+    Добавление группы абзацев в конец документа.
+    
+    Абзацы вставляются перед временным абзацем-якорем через
+    insert_paragraph_before, без поиска конца документа на каждый абзац.
+    
+    Args:
+        doc: Документ
+        items: Последовательность кортежей (текст, стиль)
+    """
+    sentinel = doc.add_paragraph()
+    for text, style in items:
+        sentinel.insert_paragraph_before(text, style=style)
+    sentinel._p.getparent().remove(sentinel._p)
+
 
 def create_test_document_1():
     """Создание первого тестового документа."""
@@ -38,10 +124,12 @@ def create_test_document_1():
         'Информационная система предназначена для решения следующих задач:'
     )
     
-    doc.add_paragraph('• Учет и регистрация входящих и исходящих документов', style='List Bullet')
-    doc.add_paragraph('• Контроль исполнения документов', style='List Bullet')
-    doc.add_paragraph('• Поиск документов по различным критериям', style='List Bullet')
-    doc.add_paragraph('• Формирование отчетов и статистики', style='List Bullet')
+    bulk_paragraphs(doc, [
+        ('• Учет и регистрация входящих и исходящих документов', 'List Bullet'),
+        ('• Контроль исполнения документов', 'List Bullet'),
+        ('• Поиск документов по различным критериям', 'List Bullet'),
+        ('• Формирование отчетов и статистики', 'List Bullet')
+    ])
     
     # Раздел 2
     doc.add_heading('2. Требования к функциональным характеристикам', 1)
@@ -73,10 +161,12 @@ def create_test_document_1():
         'Система должна обеспечивать поиск документов по следующим параметрам:'
     )
     
-    doc.add_paragraph('• По названию или содержимому', style='List Bullet')
-    doc.add_paragraph('• По дате создания или изменения', style='List Bullet')
-    doc.add_paragraph('• По автору документа', style='List Bullet')
-    doc.add_paragraph('• По типу документа', style='List Bullet')
+    bulk_paragraphs(doc, [
+        ('• По названию или содержимому', 'List Bullet'),
+        ('• По дате создания или изменения', 'List Bullet'),
+        ('• По автору документа', 'List Bullet'),
+        ('• По типу документа', 'List Bullet')
+    ])
     
     # Раздел 3
     doc.add_heading('3. Требования к интерфейсу', 1)
@@ -96,13 +186,7 @@ def create_test_document_1():
     doc.add_heading('3.1. Технические характеристики', 2)
     
     table = doc.add_table(rows=4, cols=3)
-    table.style = 'Light Grid Accent 1'
-    
-    # Заголовки таблицы
-    header_cells = table.rows[0].cells
-    header_cells[0].text = 'Параметр'
-    header_cells[1].text = 'Требование'
-    header_cells[2].text = 'Примечание'
+    table.style = TABLE_STYLE
     
     # Данные таблицы
     data_rows = [
@@ -111,28 +195,22 @@ def create_test_document_1():
         ['Доступность', '99.9%', 'В рабочее время']
     ]
     
-    for i, row_data in enumerate(data_rows, 1):
-        row_cells = table.rows[i].cells
-        for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
+    fill_table_fast(table, HEADERS_TECH, data_rows)
     
     # Добавление изображения (создаем простое тестовое изображение)
     doc.add_paragraph()  # Пустая строка
     doc.add_paragraph('Схема архитектуры системы:')
     
     # Создаем простое изображение
-    img = Image.new('RGB', (400, 200), color='lightblue')
+    img = acquire_image(400, 200, 'lightblue')
     draw = ImageDraw.Draw(img)
     draw.rectangle([50, 50, 350, 150], outline='black', width=2)
     draw.text((150, 90), 'Система управления', fill='black')
     draw.text((150, 110), 'документооборотом', fill='black')
     
-    # Сохраняем изображение во временный файл
-    img_path = '../documents/temp_img_1.png'
-    img.save(img_path)
-    
-    # Добавляем изображение в документ
-    doc.add_picture(img_path, width=Inches(4))
+    # Добавляем изображение в документ (без временного файла)
+    doc.add_picture(image_stream(img), width=Inches(4))
+    release_image(img)
     
     # Заключение
     doc.add_heading('Заключение', 1)
@@ -143,10 +221,6 @@ def create_test_document_1():
         'программного обеспечения.'
     )
     
-    # Удаляем временный файл изображения
-    if os.path.exists(img_path):
-        os.remove(img_path)
-    
     doc.save('../documents/test_document_1.docx')
     print("Создан файл: ../documents/test_document_1.docx")
 
@@ -181,11 +255,13 @@ def create_test_document_2():
         'Информационная система предназначена для решения следующих задач:'
     )
     
-    doc.add_paragraph('• Учет и регистрация входящих и исходящих документов', style='List Bullet')
-    doc.add_paragraph('• Контроль исполнения документов', style='List Bullet')
-    doc.add_paragraph('• Поиск документов по различным критериям', style='List Bullet')
-    doc.add_paragraph('• Формирование отчетов и статистики', style='List Bullet')
-    doc.add_paragraph('• Архивирование документов', style='List Bullet')
+    bulk_paragraphs(doc, [
+        ('• Учет и регистрация входящих и исходящих документов', 'List Bullet'),
+        ('• Контроль исполнения документов', 'List Bullet'),
+        ('• Поиск документов по различным критериям', 'List Bullet'),
+        ('• Формирование отчетов и статистики', 'List Bullet'),
+        ('• Архивирование документов', 'List Bullet')
+    ])
     
     # Раздел 2
     doc.add_heading('2. Требования к функциональным характеристикам', 1)
@@ -225,11 +301,13 @@ def create_test_document_2():
         'Система должна обеспечивать расширенный поиск документов по следующим параметрам:'
     )
     
-    doc.add_paragraph('• По названию или содержимому (полнотекстовый поиск)', style='List Bullet')
-    doc.add_paragraph('• По дате создания или изменения', style='List Bullet')
-    doc.add_paragraph('• По автору документа', style='List Bullet')
-    doc.add_paragraph('• По типу документа', style='List Bullet')
-    doc.add_paragraph('• По тегам и метаданным', style='List Bullet')
+    bulk_paragraphs(doc, [
+        ('• По названию или содержимому (полнотекстовый поиск)', 'List Bullet'),
+        ('• По дате создания или изменения', 'List Bullet'),
+        ('• По автору документа', 'List Bullet'),
+        ('• По типу документа', 'List Bullet'),
+        ('• По тегам и метаданным', 'List Bullet')
+    ])
     
     # Новый раздел
     doc.add_heading('2.3. Безопасность данных', 2)
@@ -238,9 +316,11 @@ def create_test_document_2():
         'Система должна обеспечивать защиту данных на всех уровнях:'
     )
     
-    doc.add_paragraph('• Шифрование данных при хранении', style='List Bullet')
-    doc.add_paragraph('• Контроль доступа на основе ролей', style='List Bullet')
-    doc.add_paragraph('• Аудит всех операций с документами', style='List Bullet')
+    bulk_paragraphs(doc, [
+        ('• Шифрование данных при хранении', 'List Bullet'),
+        ('• Контроль доступа на основе ролей', 'List Bullet'),
+        ('• Аудит всех операций с документами', 'List Bullet')
+    ])
     
     # Раздел 3
     doc.add_heading('3. Требования к интерфейсу', 1)
@@ -265,13 +345,7 @@ def create_test_document_2():
     doc.add_heading('3.1. Технические характеристики', 2)
     
     table = doc.add_table(rows=5, cols=3)
-    table.style = 'Light Grid Accent 1'
-    
-    # Заголовки таблицы
-    header_cells = table.rows[0].cells
-    header_cells[0].text = 'Параметр'
-    header_cells[1].text = 'Требование'
-    header_cells[2].text = 'Примечание'
+    table.style = TABLE_STYLE
     
     # Данные таблицы (с изменениями)
     data_rows = [
@@ -281,41 +355,34 @@ def create_test_document_2():
         ['Версия системы', '2.0.4', 'Текущая версия']  # Новая строка
     ]
     
-    for i, row_data in enumerate(data_rows, 1):
-        row_cells = table.rows[i].cells
-        for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
+    fill_table_fast(table, HEADERS_TECH, data_rows)
     
     # Измененное изображение
     doc.add_paragraph()  # Пустая строка
     doc.add_paragraph('Схема архитектуры системы:')
     
     # Создаем измененное изображение
-    img = Image.new('RGB', (400, 200), color='lightgreen')  # Изменен цвет
+    img = acquire_image(400, 200, 'lightgreen')  # Изменен цвет
     draw = ImageDraw.Draw(img)
     draw.rectangle([50, 50, 350, 150], outline='black', width=2)
     draw.text((150, 90), 'Система управления', fill='black')
     draw.text((150, 110), 'документооборотом v2.0', fill='black')  # Добавлен текст версии
     
-    # Сохраняем изображение во временный файл
-    img_path = '../documents/temp_img_2.png'
-    img.save(img_path)
-    
-    # Добавляем изображение в документ
-    doc.add_picture(img_path, width=Inches(4))
+    # Добавляем изображение в документ (без временного файла)
+    doc.add_picture(image_stream(img), width=Inches(4))
+    release_image(img)
     
     # Добавляем еще одно изображение (новое)
     doc.add_paragraph()  # Пустая строка
     doc.add_paragraph('Диаграмма процессов:')
     
-    img2 = Image.new('RGB', (300, 150), color='lightyellow')
+    img2 = acquire_image(300, 150, 'lightyellow')
     draw2 = ImageDraw.Draw(img2)
     draw2.ellipse([50, 30, 250, 120], outline='black', width=2)
     draw2.text((100, 65), 'Процесс', fill='black')
     
-    img2_path = '../documents/temp_img_2_2.png'
-    img2.save(img2_path)
-    doc.add_picture(img2_path, width=Inches(3))
+    doc.add_picture(image_stream(img2), width=Inches(3))
+    release_image(img2)
     
     # Заключение
     doc.add_heading('Заключение', 1)
@@ -330,11 +397,6 @@ def create_test_document_2():
         'Срок разработки системы составляет 6 месяцев с момента подписания договора.'
     )
     
-    # Удаляем временные файлы изображений
-    for img_file in [img_path, img2_path]:
-        if os.path.exists(img_file):
-            os.remove(img_file)
-    
     doc.save('../documents/test_document_2.docx')
     print("Создан файл: ../documents/test_document_2.docx")
 
@@ -359,9 +421,11 @@ def create_test_document_3():
     
     doc.add_paragraph('В течение отчетного периода были выполнены следующие задачи:')
     
-    doc.add_paragraph('• Разработка архитектуры системы', style='List Bullet')
-    doc.add_paragraph('• Создание базы данных', style='List Bullet')
-    doc.add_paragraph('• Реализация основного функционала', style='List Bullet')
+    bulk_paragraphs(doc, [
+        ('• Разработка архитектуры системы', 'List Bullet'),
+        ('• Создание базы данных', 'List Bullet'),
+        ('• Реализация основного функционала', 'List Bullet')
+    ])
     
     # Раздел 2
     doc.add_heading('2. Результаты', 1)
@@ -375,11 +439,7 @@ def create_test_document_3():
     doc.add_heading('2.1. Статистика разработки', 2)
     
     table = doc.add_table(rows=4, cols=2)
-    table.style = 'Light Grid Accent 1'
-    
-    header_cells = table.rows[0].cells
-    header_cells[0].text = 'Показатель'
-    header_cells[1].text = 'Значение'
+    table.style = TABLE_STYLE
     
     data_rows = [
         ['Модулей разработано', '15'],
@@ -387,16 +447,13 @@ def create_test_document_3():
         ['Тестов написано', '320']
     ]
     
-    for i, row_data in enumerate(data_rows, 1):
-        row_cells = table.rows[i].cells
-        for j, cell_data in enumerate(row_data):
-            row_cells[j].text = cell_data
+    fill_table_fast(table, ('Показатель', 'Значение'), data_rows)
     
     # Изображение
     doc.add_paragraph()  # Пустая строка
     doc.add_paragraph('График выполнения работ:')
     
-    img = Image.new('RGB', (350, 200), color='lightcoral')
+    img = acquire_image(350, 200, 'lightcoral')
     draw = ImageDraw.Draw(img)
     # Простой график
     points = [(50, 150), (100, 120), (150, 100), (200, 80), (250, 60), (300, 50)]
@@ -404,30 +461,31 @@ def create_test_document_3():
         draw.line([points[i], points[i+1]], fill='black', width=2)
     draw.text((100, 160), 'Прогресс разработки', fill='black')
     
-    img_path = '../documents/temp_img_3.png'
-    img.save(img_path)
-    doc.add_picture(img_path, width=Inches(3.5))
+    doc.add_picture(image_stream(img), width=Inches(3.5))
+    release_image(img)
     
     # Заключение
     doc.add_heading('Заключение', 1)
     
     doc.add_paragraph('Работа выполнена в полном объеме согласно плану.')
     
-    # Удаляем временный файл изображения
-    if os.path.exists(img_path):
-        os.remove(img_path)
-    
     doc.save('../documents/test_document_3.docx')
     print("Создан файл: ../documents/test_document_3.docx")
 
 
+def _run(builder):
+    """Запуск функции создания документа в процессе пула."""
+    builder()
+
+
 if __name__ == "__main__":
     print("Создание тестовых документов...")
     print("-" * 50)
     
-    create_test_document_1()
-    create_test_document_2()
-    create_test_document_3()
+    # Документы независимы и создаются параллельно
+    builders = [create_test_document_1, create_test_document_2, create_test_document_3]
+    with ProcessPoolExecutor(max_workers=len(builders)) as executor:
+        list(executor.map(_run, builders))
     
     print("-" * 50)
     print("Все тестовые документы созданы успешно!")
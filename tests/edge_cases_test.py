@@ -2,151 +2,260 @@
 Тестирование граничных случаев и обработки ошибок
 """
 
+import argparse
 import subprocess
 import sys
 import io
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List
 from pathlib import Path
+from cli_worker import call_worker, start_worker, stop_worker
+
+# Количество постоянных процессов для выполнения случаев
+WORKER_COUNT = 4
+
+# Ограничение времени выполнения одного случая в секундах
+CASE_TIMEOUT = 60
+
+# Сколько байт stderr декодировать для вывода при ошибке
+STDERR_PREVIEW_BYTES = 4096
+
+# Общие части команд: запуск CLI текущим интерпретатором (без поиска
+# python в PATH) и пара тестовых документов
+CLI_BASE = [sys.executable, 'cli.py']
+TEST_DOCS = ['documents/test_document_1.docx', 'documents/test_document_2.docx']
+
+# Папка результатов (относительно текущей директории, как и у cli.py)
+RESULTS_DIR = Path('results')
 
 # Установка кодировки для Windows
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8')
 
-def test_edge_case(cmd, description, should_fail=False):
-    """Тест граничного случая"""
-    print(f"\n{'='*60}")
-    print(f"ГРАНИЧНЫЙ СЛУЧАЙ: {description}")
-    print(f"{'='*60}")
-    print(f"Команда: {' '.join(cmd)}")
+@dataclass
+class EdgeCase:
+    """Граничный случай: команда, описание и ожидаемый результат"""
+    cmd: List[str]
+    desc: str
+    should_fail: bool = False
+
+def run_case(cmd, worker=None):
+    """
+    Выполнение команды граничного случая.
+    
+    Args:
+        cmd: Команда вида CLI_BASE + [аргументы...]
+        worker: Постоянный процесс cli_worker.py; None - отдельный процесс.
+            При превышении CASE_TIMEOUT рабочий процесс завершается
+    
+    Returns:
+        Кортеж (код возврата, вывод ошибок); для отдельного процесса
+        вывод ошибок возвращается в байтах
+    """
+    if worker is not None:
+        reply = call_worker(worker, cmd[2:], timeout=CASE_TIMEOUT)
+        if reply is None:
+            raise RuntimeError(f"рабочий процесс завершился (код: {worker.poll()})")
+        return reply['rc'], reply['out']
+    
+    # Вывод не декодируется: stderr нужен только при ошибке (см. test_edge_case)
+    result = subprocess.run(cmd, capture_output=True, timeout=CASE_TIMEOUT)
+    return result.returncode, result.stderr
+
+def test_edge_case(cmd, description, should_fail=False, log=print, worker=None):
+    """
+    Тест граничного случая
+    
+    log - функция вывода строки (по умолчанию print); при параллельном
+    запуске вывод собирается и печатается после завершения теста.
+    worker - постоянный процесс cli_worker.py (см. run_case)
+    """
+    log(f"\n{'='*60}")
+    log(f"ГРАНИЧНЫЙ СЛУЧАЙ: {description}")
+    log(f"{'='*60}")
+    log(f"Команда: {' '.join(cmd)}")
     
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='replace',
-            timeout=60
-        )
+        returncode, stderr = run_case(cmd, worker)
         
         if should_fail:
-            if result.returncode != 0:
-                print(f"[OK] Ожидаемая ошибка обработана корректно")
+            if returncode != 0:
+                log(f"[OK] Ожидаемая ошибка обработана корректно")
                 return True
             else:
-                print(f"[FAIL] Ожидалась ошибка, но команда выполнилась успешно")
+                log(f"[FAIL] Ожидалась ошибка, но команда выполнилась успешно")
                 return False
         else:
-            if result.returncode == 0:
-                print(f"[OK] Успешно выполнено")
+            if returncode == 0:
+                log(f"[OK] Успешно выполнено")
                 return True
             else:
-                print(f"[FAIL] Ошибка выполнения (код: {result.returncode})")
-                if result.stderr:
-                    print("STDERR:")
-                    for line in result.stderr.split('\n')[:5]:
-                        print(f"  {line}")
+                log(f"[FAIL] Ошибка выполнения (код: {returncode})")
+                if stderr:
+                    if isinstance(stderr, bytes):
+                        stderr = stderr[:STDERR_PREVIEW_BYTES].decode('utf-8', 'replace')
+                    log("STDERR:")
+                    for line in stderr.split('\n')[:5]:
+                        log(f"  {line}")
                 return False
     except subprocess.TimeoutExpired:
-        print(f"[FAIL] Таймаут выполнения")
+        log(f"[FAIL] Таймаут выполнения")
         return False
     except Exception as e:
-        print(f"[FAIL] Исключение: {e}")
+        log(f"[FAIL] Исключение: {e}")
         return False
 
 def main():
+    arg_parser = argparse.ArgumentParser(description='Тестирование граничных случаев compareDocx')
+    arg_parser.add_argument('--subprocess', action='store_true',
+                            help='Запускать каждый случай в отдельном подпроцессе '
+                                 '(по умолчанию - в постоянных процессах cli_worker.py)')
+    args = arg_parser.parse_args()
+    
     print("="*60)
     print("ТЕСТИРОВАНИЕ ГРАНИЧНЫХ СЛУЧАЕВ И ОБРАБОТКИ ОШИБОК")
     print("="*60)
     
+    # Случаи выполняются параллельно, поэтому каждый пишет результаты в свою
+    # папку внутри папки запуска: папки по умолчанию (с меткой времени
+    # до секунды) у одновременных запусков совпадали бы
+    run_dir = RESULTS_DIR / f"edge_cases_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    
     test_cases = [
         # Несуществующие файлы
-        {
-            'cmd': ['python', 'cli.py', 'nonexistent1.docx', 'nonexistent2.docx', '--xlsx'],
-            'desc': 'Несуществующие файлы',
-            'should_fail': True
-        },
+        EdgeCase(
+            cmd=CLI_BASE + ['nonexistent1.docx', 'nonexistent2.docx', '--xlsx'],
+            desc='Несуществующие файлы',
+            should_fail=True
+        ),
         
         # Неправильное расширение
-        {
-            'cmd': ['python', 'cli.py', 'README.md', 'README.md', '--xlsx'],
-            'desc': 'Неправильное расширение файла (.md вместо .docx)',
-            'should_fail': True
-        },
+        EdgeCase(
+            cmd=CLI_BASE + ['README.md', 'README.md', '--xlsx'],
+            desc='Неправильное расширение файла (.md вместо .docx)',
+            should_fail=True
+        ),
         
         # Один файл не существует
-        {
-            'cmd': ['python', 'cli.py', 'documents/test_document_1.docx', 'nonexistent.docx', '--xlsx'],
-            'desc': 'Один файл не существует',
-            'should_fail': True
-        },
+        EdgeCase(
+            cmd=CLI_BASE + ['documents/test_document_1.docx', 'nonexistent.docx', '--xlsx'],
+            desc='Один файл не существует',
+            should_fail=True
+        ),
         
         # Справка
-        {
-            'cmd': ['python', 'cli.py', '--help'],
-            'desc': 'Вывод справки',
-            'should_fail': False
-        },
+        EdgeCase(
+            cmd=CLI_BASE + ['--help'],
+            desc='Вывод справки',
+            should_fail=False
+        ),
         
         # Неправильные параметры фильтрации
-        {
-            'cmd': ['python', 'cli.py', 'documents/test_document_1.docx', 'documents/test_document_2.docx', 
-                   '--xlsx', '--filter-status', 'invalid_status'],
-            'desc': 'Неправильный статус фильтрации',
-            'should_fail': False  # Должно обработаться корректно
-        },
+        EdgeCase(
+            cmd=CLI_BASE + TEST_DOCS + ['--xlsx', '--filter-status', 'invalid_status'],
+            desc='Неправильный статус фильтрации',
+            should_fail=False  # Должно обработаться корректно
+        ),
         
         # Неправильное значение схожести
-        {
-            'cmd': ['python', 'cli.py', 'documents/test_document_1.docx', 'documents/test_document_2.docx', 
-                   '--xlsx', '--filter-min-similarity', 'invalid'],
-            'desc': 'Неправильное значение схожести (не число)',
-            'should_fail': True
-        },
+        EdgeCase(
+            cmd=CLI_BASE + TEST_DOCS + ['--xlsx', '--filter-min-similarity', 'invalid'],
+            desc='Неправильное значение схожести (не число)',
+            should_fail=True
+        ),
         
         # Схожесть вне диапазона
-        {
-            'cmd': ['python', 'cli.py', 'documents/test_document_1.docx', 'documents/test_document_2.docx', 
-                   '--xlsx', '--filter-min-similarity', '2.0'],
-            'desc': 'Схожесть вне диапазона (>1.0)',
-            'should_fail': False  # Должно обработаться корректно
-        },
+        EdgeCase(
+            cmd=CLI_BASE + TEST_DOCS + ['--xlsx', '--filter-min-similarity', '2.0'],
+            desc='Схожесть вне диапазона (>1.0)',
+            should_fail=False  # Должно обработаться корректно
+        ),
         
         # Путь к несуществующей директории вывода
-        {
-            'cmd': ['python', 'cli.py', 'documents/test_document_1.docx', 'documents/test_document_2.docx', 
-                   '--xlsx', '--output-dir', 'nonexistent/path/to/results'],
-            'desc': 'Несуществующая директория вывода (должна создаться)',
-            'should_fail': False
-        },
+        EdgeCase(
+            cmd=CLI_BASE + TEST_DOCS + ['--xlsx', '--output-dir', str(run_dir / 'nonexistent/path/to/results')],
+            desc='Несуществующая директория вывода (должна создаться)',
+            should_fail=False
+        ),
         
         # Одинаковые файлы
-        {
-            'cmd': ['python', 'cli.py', 'documents/test_document_1.docx', 'documents/test_document_1.docx', '--xlsx'],
-            'desc': 'Сравнение файла с самим собой',
-            'should_fail': False
-        },
+        EdgeCase(
+            cmd=CLI_BASE + ['documents/test_document_1.docx', 'documents/test_document_1.docx', '--xlsx'],
+            desc='Сравнение файла с самим собой',
+            should_fail=False
+        ),
         
         # Множественные флаги форматов
-        {
-            'cmd': ['python', 'cli.py', 'documents/test_document_1.docx', 'documents/test_document_2.docx', 
-                   '--xlsx', '--xlsx', '--json', '--json'],
-            'desc': 'Дублирование флагов форматов',
-            'should_fail': False
-        },
+        EdgeCase(
+            cmd=CLI_BASE + TEST_DOCS + ['--xlsx', '--xlsx', '--json', '--json'],
+            desc='Дублирование флагов форматов',
+            should_fail=False
+        ),
     ]
     
-    results = []
+    # Случай с --output-dir проверяет создание этой папки и пишет только в нее
     for i, test_case in enumerate(test_cases, 1):
-        print(f"\n[{i}/{len(test_cases)}]")
-        success = test_edge_case(
-            test_case['cmd'],
-            test_case['desc'],
-            test_case.get('should_fail', False)
+        if '--help' not in test_case.cmd and '--output-dir' not in test_case.cmd:
+            test_case.cmd = test_case.cmd + ['--result-dir', str(run_dir / f"case_{i:02d}")]
+    
+    # Случаи независимы и запускаются параллельно: по умолчанию в нескольких
+    # постоянных процессах cli_worker.py (интерпретатор и модули проекта
+    # загружаются один раз на процесс), с --subprocess - каждый в отдельном
+    # процессе; вывод каждого случая собирается отдельно и печатается
+    # в исходном порядке
+    workers = queue.Queue()
+    worker_count = min(WORKER_COUNT, len(test_cases))
+    if not args.subprocess:
+        for _ in range(worker_count):
+            workers.put(start_worker())
+    
+    def run_in_subprocess(test_case, log):
+        return test_edge_case(
+            test_case.cmd,
+            test_case.desc,
+            test_case.should_fail,
+            log.append
         )
+    
+    def run_in_worker(test_case, log):
+        worker = workers.get()
+        try:
+            return test_edge_case(
+                test_case.cmd,
+                test_case.desc,
+                test_case.should_fail,
+                log.append,
+                worker
+            )
+        finally:
+            # Процесс, завершенный по таймауту или упавший, заменяется новым
+            if worker.poll() is not None:
+                worker = start_worker()
+            workers.put(worker)
+    
+    run = run_in_subprocess if args.subprocess else run_in_worker
+    logs = [[] for _ in test_cases]
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        futures = [
+            executor.submit(run, test_case, log)
+            for test_case, log in zip(test_cases, logs)
+        ]
+    
+    while not workers.empty():
+        stop_worker(workers.get())
+    
+    results = []
+    for i, (test_case, future, log) in enumerate(zip(test_cases, futures, logs), 1):
+        print(f"\n[{i}/{len(test_cases)}]")
+        for line in log:
+            print(line)
         results.append({
-            'test': test_case['desc'],
-            'success': success
+            'test': test_case.desc,
+            'success': future.result()
         })
     
     # Итоговый отчет
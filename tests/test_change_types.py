@@ -3,16 +3,13 @@
 """
 
 import pytest
-from compare import Compare
 
 
 class TestGeneralCorrections:
     """Тесты для определения общих правок."""
     
-    def test_version_correction(self):
+    def test_version_correction(self, comparator):
         """Тест определения исправления версии документа."""
-        comparator = Compare.__new__(Compare)
-        
         text1 = "Версия документа: 1.0"
         text2 = "Версия документа: 2.0"
         
@@ -24,27 +21,21 @@ class TestGeneralCorrections:
             subtype = comparator._determine_change_subtype(text1, text2, change_type, "")
             assert "версии документа" in subtype.lower() or "версия" in subtype.lower()
     
-    def test_version_correction_various_formats(self):
+    @pytest.mark.parametrize("text1,text2", [
+        ("Версия: 1.0", "Версия: 2.0"),
+        ("Version: 1.0", "Version: 2.0"),
+        ("v. 1.0", "v. 2.0"),
+        ("Ревизия: 1.0", "Ревизия: 2.0"),
+        ("Revision: 1.0", "Revision: 2.0"),
+        ("Ред. 1.0", "Ред. 2.0"),
+    ])
+    def test_version_correction_various_formats(self, comparator, text1, text2):
         """Тест определения версии в различных форматах."""
-        comparator = Compare.__new__(Compare)
-        
-        test_cases = [
-            ("Версия: 1.0", "Версия: 2.0"),
-            ("Version: 1.0", "Version: 2.0"),
-            ("v. 1.0", "v. 2.0"),
-            ("Ревизия: 1.0", "Ревизия: 2.0"),
-            ("Revision: 1.0", "Revision: 2.0"),
-            ("Ред. 1.0", "Ред. 2.0"),
-        ]
-        
-        for text1, text2 in test_cases:
-            change_type = comparator._determine_change_type(text1, text2)
-            assert change_type == "Общие правки"
+        change_type = comparator._determine_change_type(text1, text2)
+        assert change_type == "Общие правки"
     
-    def test_page_count_correction(self):
+    def test_page_count_correction(self, comparator):
         """Тест определения актуализации количества листов."""
-        comparator = Compare.__new__(Compare)
-        
         text1 = "Всего листов: 10"
         text2 = "Всего листов: 12"
         
@@ -56,27 +47,21 @@ class TestGeneralCorrections:
             subtype = comparator._determine_change_subtype(text1, text2, change_type, "")
             assert "количества листов" in subtype.lower() or "страниц" in subtype.lower() or "листов" in subtype.lower()
     
-    def test_page_count_various_formats(self):
+    @pytest.mark.parametrize("text1,text2", [
+        ("Листов: 10", "Листов: 12"),
+        ("Страниц: 10", "Страниц: 12"),
+        ("Pages: 10", "Pages: 12"),
+        ("Всего листов: 10", "Всего листов: 12"),
+        ("Количество листов: 10", "Количество листов: 12"),
+    ])
+    def test_page_count_various_formats(self, comparator, text1, text2):
         """Тест определения количества листов в различных форматах."""
-        comparator = Compare.__new__(Compare)
-        
-        test_cases = [
-            ("Листов: 10", "Листов: 12"),
-            ("Страниц: 10", "Страниц: 12"),
-            ("Pages: 10", "Pages: 12"),
-            ("Всего листов: 10", "Всего листов: 12"),
-            ("Количество листов: 10", "Количество листов: 12"),
-        ]
-        
-        for text1, text2 in test_cases:
-            change_type = comparator._determine_change_type(text1, text2, "")
-            # Может быть "Общие правки" или "Изменение содержания" в зависимости от логики
-            assert change_type in ["Общие правки", "Изменение содержания"]
+        change_type = comparator._determine_change_type(text1, text2, "")
+        # Может быть "Общие правки" или "Изменение содержания" в зависимости от логики
+        assert change_type in ["Общие правки", "Изменение содержания"]
     
-    def test_spelling_correction(self):
+    def test_spelling_correction(self, comparator):
         """Тест определения исправления орфографических ошибок."""
-        comparator = Compare.__new__(Compare)
-        
         text1 = "Этот текст содержит ошшибку"
         text2 = "Этот текст содержит ошибку"
         
@@ -86,10 +71,8 @@ class TestGeneralCorrections:
             subtype = comparator._determine_change_subtype(text1, text2, change_type)
             assert "орфографических" in subtype.lower() or "орфографические" in subtype.lower()
     
-    def test_punctuation_correction(self):
+    def test_punctuation_correction(self, comparator):
         """Тест определения исправления пунктуации."""
-        comparator = Compare.__new__(Compare)
-        
         text1 = "Текст без запятой где нужно"
         text2 = "Текст, без запятой, где нужно"
         
@@ -103,10 +86,8 @@ class TestGeneralCorrections:
 class TestChangeSubtypes:
     """Тесты для определения подтипов изменений."""
     
-    def test_subtype_for_formatting(self):
+    def test_subtype_for_formatting(self, comparator):
         """Тест подтипа для изменения форматирования."""
-        comparator = Compare.__new__(Compare)
-        
         text1 = "Одинаковый текст"
         text2 = "Одинаковый текст"
         
@@ -114,10 +95,8 @@ class TestChangeSubtypes:
         subtype = comparator._determine_change_subtype(text1, text2, change_type)
         assert subtype == "Изменение стиля"
     
-    def test_subtype_for_text_addition(self):
+    def test_subtype_for_text_addition(self, comparator):
         """Тест подтипа для добавления текста."""
-        comparator = Compare.__new__(Compare)
-        
         # Добавление нескольких слов
         text1 = "Короткий текст"
         text2 = "Короткий текст с дополнительными словами"
@@ -126,10 +105,8 @@ class TestChangeSubtypes:
         subtype = comparator._determine_change_subtype(text1, text2, change_type)
         assert "Добавление" in subtype
     
-    def test_subtype_for_text_deletion(self):
+    def test_subtype_for_text_deletion(self, comparator):
         """Тест подтипа для удаления текста."""
-        comparator = Compare.__new__(Compare)
-        
         text1 = "Длинный текст с множеством слов"
         text2 = "Длинный текст"
         
@@ -137,10 +114,8 @@ class TestChangeSubtypes:
         subtype = comparator._determine_change_subtype(text1, text2, change_type)
         assert "Удаление" in subtype
     
-    def test_subtype_for_content_change(self):
+    def test_subtype_for_content_change(self, comparator):
         """Тест подтипа для изменения содержания."""
-        comparator = Compare.__new__(Compare)
-        
         text1 = "Первый вариант текста"
         text2 = "Второй вариант текста"
         
@@ -149,10 +124,8 @@ class TestChangeSubtypes:
             subtype = comparator._determine_change_subtype(text1, text2, change_type)
             assert subtype == "Изменение смысла"
     
-    def test_subtype_for_word_order(self):
+    def test_subtype_for_word_order(self, comparator):
         """Тест подтипа для изменения порядка слов."""
-        comparator = Compare.__new__(Compare)
-        
         text1 = "Первый второй третий"
         text2 = "Третий второй первый"
         
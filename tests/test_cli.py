@@ -2,10 +2,24 @@
 Тесты для CLI интерфейса.
 """
 
+import logging
 import pytest
-import subprocess
-import sys
 from pathlib import Path
+from cli_worker import run_cli
+
+# Корень проекта: CLI запускается из него, как и при вызове python cli.py
+PROJECT_ROOT = Path(__file__).parent.parent
+DOC1 = PROJECT_ROOT / "documents" / "test_document_1.docx"
+DOC2 = PROJECT_ROOT / "documents" / "test_document_2.docx"
+
+
+@pytest.fixture(scope="session")
+def comparison_bundle():
+    """Результаты сравнения тестовых документов, вычисленные один раз на сессию."""
+    if not (DOC1.exists() and DOC2.exists()):
+        pytest.skip("Тестовые документы не найдены")
+    from result_cache import get_comparison_bundle
+    return get_comparison_bundle(str(DOC1), str(DOC2), use_cache=False)
 
 
 class TestCLI:
@@ -14,119 +28,126 @@ class TestCLI:
     @pytest.fixture
     def test_documents(self):
         """Фикстура с путями к тестовым документам."""
-        documents_dir = Path(__file__).parent.parent / "documents"
-        doc1 = documents_dir / "test_document_1.docx"
-        doc2 = documents_dir / "test_document_2.docx"
-        
-        if not (doc1.exists() and doc2.exists()):
+        if not (DOC1.exists() and DOC2.exists()):
             pytest.skip("Тестовые документы не найдены")
         
-        return str(doc1), str(doc2)
+        return str(DOC1), str(DOC2)
+    
+    @pytest.fixture
+    def cli(self, monkeypatch):
+        """
+        Фикстура для вызова cli.main в текущем процессе.
+        
+        Возвращает функцию, принимающую аргументы командной строки
+        и возвращающую кортеж (код возврата, вывод команды).
+        """
+        from cli import main
+        monkeypatch.chdir(PROJECT_ROOT)
+        return lambda *argv: run_cli(main, list(argv))
+    
+    @pytest.fixture
+    def shared_comparison(self, monkeypatch, comparison_bundle):
+        """
+        Подмена сравнения в CLI готовыми результатами comparison_bundle.
+        
+        Тесты экспорта и фильтров проверяют обработку аргументов и запись
+        результатов; само сравнение выполняется полностью только
+        в test_cli_basic_comparison.
+        """
+        import cli
+        monkeypatch.setattr(cli, "get_comparison_bundle",
+                            lambda *args, **kwargs: comparison_bundle)
     
-    def test_cli_help(self):
+    def test_cli_help(self, cli):
         """Тест вывода справки."""
-        result = subprocess.run(
-            [sys.executable, "cli.py", "--help"],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent
-        )
-        
-        assert result.returncode == 0
-        assert "usage" in result.stdout.lower() or "использование" in result.stdout.lower()
-        assert "--help" in result.stdout
+        returncode, output = cli("--help")
+        
+        assert returncode == 0
+        assert "usage" in output.lower() or "использование" in output.lower()
+        assert "--help" in output
     
-    def test_cli_basic_comparison(self, tmp_path, test_documents):
+    def test_cli_basic_comparison(self, cli, tmp_path, test_documents):
         """Тест базового сравнения через CLI."""
         doc1, doc2 = test_documents
         
-        result = subprocess.run(
-            [sys.executable, "cli.py", doc1, doc2, "--xlsx", "--no-llm"],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent
-        )
+        returncode, output = cli(doc1, doc2, "--xlsx", "--no-llm", "--no-cache")
         
-        assert result.returncode == 0
-        assert "успешно" in result.stdout.lower() or "success" in result.stdout.lower()
+        assert returncode == 0
+        assert "успешно" in output.lower() or "success" in output.lower()
     
-    def test_cli_multiple_formats(self, tmp_path, test_documents):
+    def test_cli_multiple_formats(self, cli, tmp_path, test_documents, shared_comparison):
         """Тест экспорта в несколько форматов."""
         doc1, doc2 = test_documents
         
-        result = subprocess.run(
-            [sys.executable, "cli.py", doc1, doc2, "--xlsx", "--csv", "--json", "--html", "--no-llm"],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent
-        )
+        returncode, output = cli(doc1, doc2, "--xlsx", "--csv", "--json", "--html", "--no-llm")
         
-        assert result.returncode == 0
+        assert returncode == 0
     
-    def test_cli_output_dir(self, tmp_path, test_documents):
+    def test_cli_output_dir(self, cli, tmp_path, test_documents, shared_comparison):
         """Тест указания директории для результатов."""
         doc1, doc2 = test_documents
         output_dir = tmp_path / "custom_output"
         
-        result = subprocess.run(
-            [sys.executable, "cli.py", doc1, doc2, "--xlsx", "--no-llm", "--output-dir", str(output_dir)],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent
-        )
+        returncode, output = cli(doc1, doc2, "--xlsx", "--no-llm", "--output-dir", str(output_dir))
         
-        assert result.returncode == 0
+        assert returncode == 0
         # Проверяем, что результаты созданы в указанной директории
         result_dirs = list(output_dir.glob("comparison_*"))
         assert len(result_dirs) > 0
     
-    def test_cli_filter_status(self, tmp_path, test_documents):
+    def test_cli_result_dir(self, cli, tmp_path, test_documents, shared_comparison):
+        """Тест сохранения результатов точно в указанную папку."""
+        doc1, doc2 = test_documents
+        result_dir = tmp_path / "exact_output"
+        
+        returncode, output = cli(doc1, doc2, "--json", "--no-llm", "--result-dir", str(result_dir))
+        
+        assert returncode == 0
+        # Файлы создаются прямо в папке, без вложенной папки с временной меткой
+        assert list(result_dir.glob("*.json"))
+        assert not list(result_dir.glob("comparison_*"))
+    
+    def test_cli_filter_status(self, cli, tmp_path, test_documents, shared_comparison):
         """Тест фильтрации по статусу."""
         doc1, doc2 = test_documents
         
-        result = subprocess.run(
-            [sys.executable, "cli.py", doc1, doc2, "--json", "--no-llm", "--filter-status", "modified", "added"],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent
-        )
+        returncode, output = cli(doc1, doc2, "--json", "--no-llm", "--filter-status", "modified", "added")
         
-        assert result.returncode == 0
+        assert returncode == 0
     
-    def test_cli_filter_min_similarity(self, tmp_path, test_documents):
+    def test_cli_filter_min_similarity(self, cli, tmp_path, test_documents, shared_comparison):
         """Тест фильтрации по минимальной схожести."""
         doc1, doc2 = test_documents
         
-        result = subprocess.run(
-            [sys.executable, "cli.py", doc1, doc2, "--json", "--no-llm", "--filter-min-similarity", "0.5"],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent
-        )
+        returncode, output = cli(doc1, doc2, "--json", "--no-llm", "--filter-min-similarity", "0.5")
         
-        assert result.returncode == 0
+        assert returncode == 0
+    
+    def test_cli_cache_flags(self):
+        """Тест флагов кэша: без флага используется config.cache.enabled (по умолчанию выключен)."""
+        from cli import cache_mode, create_parser
+        parser = create_parser()
+        
+        assert cache_mode(parser.parse_args(["a.docx", "b.docx"])) is None
+        assert cache_mode(parser.parse_args(["a.docx", "b.docx", "--cache"])) is True
+        assert cache_mode(parser.parse_args(["a.docx", "b.docx", "--no-cache"])) is False
     
-    def test_cli_invalid_file(self):
+    def test_cli_invalid_file(self, cli):
         """Тест обработки несуществующего файла."""
-        result = subprocess.run(
-            [sys.executable, "cli.py", "nonexistent1.docx", "nonexistent2.docx", "--no-llm"],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent
-        )
-        
-        assert result.returncode != 0
+        returncode, output = cli("nonexistent1.docx", "nonexistent2.docx", "--no-llm")
+        
+        assert returncode != 0
     
-    def test_cli_log_level(self, tmp_path, test_documents):
+    def test_cli_log_level(self, cli, tmp_path, test_documents, shared_comparison):
         """Тест установки уровня логирования."""
         doc1, doc2 = test_documents
         
-        result = subprocess.run(
-            [sys.executable, "cli.py", doc1, doc2, "--xlsx", "--no-llm", "--log-level", "DEBUG"],
-            capture_output=True,
-            text=True,
-            cwd=Path(__file__).parent.parent
-        )
+        project_logger = logging.getLogger("compareDocx")
+        level_before = project_logger.level
+        
+        returncode, output = cli(doc1, doc2, "--xlsx", "--no-llm", "--log-level", "DEBUG")
         
-        assert result.returncode == 0
+        assert returncode == 0
+        # Уровень логирования не переходит на следующие команды
+        assert project_logger.level == level_before
 
@@ -3,7 +3,7 @@ Unit-тесты для модуля compare.
 """
 
 import pytest
-from compare import Compare
+from compare import similarity_backend, similarity_matrix, text_ratio
 from docx_file import DocxFile
 from config import config
 
@@ -11,29 +11,25 @@ from config import config
 class TestNormalizeText:
     """Тесты для метода _normalize_text."""
     
-    def test_normalize_spaces(self):
+    def test_normalize_spaces(self, comparator):
         """Тест нормализации множественных пробелов."""
-        comparator = Compare.__new__(Compare)
         text = "Текст   с    множественными     пробелами"
         result = comparator._normalize_text(text)
         assert "  " not in result  # Не должно быть двойных пробелов
     
-    def test_normalize_line_breaks(self):
+    def test_normalize_line_breaks(self, comparator):
         """Тест нормализации переносов строк."""
-        comparator = Compare.__new__(Compare)
         text = "Текст\nс\nпереносами\nстрок"
         result = comparator._normalize_text(text)
         assert "\n" not in result
     
-    def test_empty_text(self):
+    def test_empty_text(self, comparator):
         """Тест нормализации пустого текста."""
-        comparator = Compare.__new__(Compare)
         result = comparator._normalize_text("")
         assert result == ""
     
-    def test_whitespace_only(self):
+    def test_whitespace_only(self, comparator):
         """Тест нормализации текста только с пробелами."""
-        comparator = Compare.__new__(Compare)
         result = comparator._normalize_text("   \n\n   ")
         assert result == ""
 
@@ -41,44 +37,76 @@ class TestNormalizeText:
 class TestCalculateSimilarity:
     """Тесты для метода _calculate_similarity."""
     
-    def test_identical_texts(self):
+    def test_identical_texts(self, comparator):
         """Тест схожести идентичных текстов."""
-        comparator = Compare.__new__(Compare)
         text = "Одинаковый текст"
         similarity = comparator._calculate_similarity(text, text)
         assert similarity == 1.0
     
-    def test_different_texts(self):
+    def test_different_texts(self, comparator):
         """Тест схожести разных текстов."""
-        comparator = Compare.__new__(Compare)
         text1 = "Первый текст"
         text2 = "Совсем другой текст"
         similarity = comparator._calculate_similarity(text1, text2)
         assert 0.0 <= similarity < 1.0
     
-    def test_similar_texts(self):
+    def test_similar_texts(self, comparator):
         """Тест схожести похожих текстов."""
-        comparator = Compare.__new__(Compare)
         text1 = "Текст с небольшими изменениями"
         text2 = "Текст с небольшими изменениями и дополнениями"
         similarity = comparator._calculate_similarity(text1, text2)
         assert similarity > 0.5
+    
+    def test_empty_text(self, comparator):
+        """Тест схожести пустого и непустого текста."""
+        assert comparator._calculate_similarity("", "Текст") == 0.0
+        assert comparator._calculate_similarity("   ", "") == 1.0
+    
+    def test_cutoff(self, comparator):
+        """Тест порога: значения ниже него отсекаются, остальные точные."""
+        text1 = "Текст с небольшими изменениями"
+        text2 = "Текст с небольшими изменениями и дополнениями"
+        similarity = comparator._calculate_similarity(text1, text2)
+        assert comparator._calculate_similarity(text1, text2, similarity) == similarity
+        assert comparator._calculate_similarity(text1, text2, min(similarity + 0.1, 1.0)) == 0.0
+    
+    def test_similarity_matrix(self):
+        """Тест пакетного вычисления схожести: значения совпадают с попарными."""
+        texts1 = ["Первый текст", "Второй абзац документа", ""]
+        texts2 = ["Первый текст документа", "Совсем другой текст"]
+        matrix = similarity_matrix(texts1, texts2)
+        for i, text1 in enumerate(texts1):
+            for j, text2 in enumerate(texts2):
+                assert matrix[i][j] == text_ratio(text1, text2)
+    
+    def test_default_backend_is_difflib(self):
+        """Тест: по умолчанию используется difflib, даже если rapidfuzz установлен."""
+        assert config.comparison.similarity_backend == "difflib"
+        assert similarity_backend() == "difflib"
+        assert text_ratio("абв", "абг") == pytest.approx(2 / 3)
+    
+    def test_rapidfuzz_backend(self, monkeypatch):
+        """Тест явного выбора rapidfuzz: значения совпадают с fuzz.ratio."""
+        fuzz = pytest.importorskip("rapidfuzz.fuzz")
+        monkeypatch.setattr(config.comparison, "similarity_backend", "rapidfuzz")
+        assert similarity_backend() == "rapidfuzz"
+        text1 = "Текст с небольшими изменениями"
+        text2 = "Текст с изменениями и дополнениями"
+        assert text_ratio(text1, text2) == fuzz.ratio(text1, text2) / 100.0
 
 
 class TestDetermineChangeType:
     """Тесты для метода _determine_change_type."""
     
-    def test_formatting_only(self):
+    def test_formatting_only(self, comparator):
         """Тест определения изменения только форматирования."""
-        comparator = Compare.__new__(Compare)
         text1 = "Одинаковый текст"
         text2 = "Одинаковый текст"  # Тот же текст
         change_type = comparator._determine_change_type(text1, text2)
         assert change_type == "Изменение форматирования"
     
-    def test_text_addition(self):
+    def test_text_addition(self, comparator):
         """Тест определения добавления текста."""
-        comparator = Compare.__new__(Compare)
         text1 = "Короткий текст"
         text2 = "Короткий текст с дополнительными словами"
         change_type = comparator._determine_change_type(text1, text2)
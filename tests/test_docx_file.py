@@ -7,20 +7,24 @@ from pathlib import Path
 from docx_file import DocxFile
 from exceptions import DocumentLoadError, DocumentParseError
 
+# Тестовый документ, используемый большинством тестов
+DOC_FILE = Path(__file__).parent.parent / "documents" / "test_document_1.docx"
+
+
+@pytest.fixture(scope="module")
+def docx():
+    """Тестовый документ, загруженный один раз на модуль (без кэша парсинга)."""
+    if not DOC_FILE.exists():
+        pytest.skip("Тестовый документ не найден")
+    return DocxFile(str(DOC_FILE), use_cache=False)
+
 
 class TestDocxFile:
     """Тесты для класса DocxFile."""
     
-    def test_load_existing_file(self):
+    def test_load_existing_file(self, docx):
         """Тест загрузки существующего файла."""
-        documents_dir = Path(__file__).parent.parent / "documents"
-        doc_file = documents_dir / "test_document_1.docx"
-        
-        if not doc_file.exists():
-            pytest.skip("Тестовый документ не найден")
-        
-        docx = DocxFile(str(doc_file))
-        assert docx.file_path == str(doc_file)
+        assert docx.file_path == str(DOC_FILE)
         assert docx.document is not None
     
     def test_load_nonexistent_file(self):
@@ -28,15 +32,8 @@ class TestDocxFile:
         with pytest.raises(DocumentLoadError):
             DocxFile("nonexistent_file.docx")
     
-    def test_get_all_paragraphs(self):
+    def test_get_all_paragraphs(self, docx):
         """Тест получения всех абзацев."""
-        documents_dir = Path(__file__).parent.parent / "documents"
-        doc_file = documents_dir / "test_document_1.docx"
-        
-        if not doc_file.exists():
-            pytest.skip("Тестовый документ не найден")
-        
-        docx = DocxFile(str(doc_file))
         paragraphs = docx.get_all_paragraphs()
         
         assert isinstance(paragraphs, list)
@@ -49,43 +46,32 @@ class TestDocxFile:
             # Проверяем наличие хотя бы одного из полей индекса
             assert any(key in para for key in ["index", "index_1", "section_index", "chapter_index"])
     
-    def test_get_tables(self):
-        """Тест получения таблиц."""
-        documents_dir = Path(__file__).parent.parent / "documents"
-        doc_file = documents_dir / "test_document_1.docx"
-        
-        if not doc_file.exists():
-            pytest.skip("Тестовый документ не найден")
+    def test_get_paragraph_columns(self, docx):
+        """Тест столбцов абзацев: выровнены по позиции с get_all_paragraphs()."""
+        paragraphs = docx.get_all_paragraphs()
+        columns = docx.get_paragraph_columns()
         
-        docx = DocxFile(str(doc_file))
+        for name in ("text", "index", "page", "full_path"):
+            assert len(columns[name]) == len(paragraphs)
+        assert columns["text"] == [p["text"] for p in paragraphs]
+        assert columns["page"] == [p["page"] for p in paragraphs]
+    
+    def test_get_tables(self, docx):
+        """Тест получения таблиц."""
         tables = docx.get_tables()
         
         assert isinstance(tables, list)
         # Может быть 0 таблиц, это нормально
     
-    def test_get_images(self):
+    def test_get_images(self, docx):
         """Тест получения изображений."""
-        documents_dir = Path(__file__).parent.parent / "documents"
-        doc_file = documents_dir / "test_document_1.docx"
-        
-        if not doc_file.exists():
-            pytest.skip("Тестовый документ не найден")
-        
-        docx = DocxFile(str(doc_file))
         images = docx.get_images()
         
         assert isinstance(images, list)
         # Может быть 0 изображений, это нормально
     
-    def test_page_estimation(self):
+    def test_page_estimation(self, docx):
         """Тест оценки страниц."""
-        documents_dir = Path(__file__).parent.parent / "documents"
-        doc_file = documents_dir / "test_document_1.docx"
-        
-        if not doc_file.exists():
-            pytest.skip("Тестовый документ не найден")
-        
-        docx = DocxFile(str(doc_file))
         paragraphs = docx.get_all_paragraphs()
         
         # Проверяем, что у абзацев есть поле page
@@ -94,15 +80,8 @@ class TestDocxFile:
             assert "page" in para
             assert isinstance(para["page"], (int, type(None)))
     
-    def test_full_path_building(self):
+    def test_full_path_building(self, docx):
         """Тест построения полного пути."""
-        documents_dir = Path(__file__).parent.parent / "documents"
-        doc_file = documents_dir / "test_document_1.docx"
-        
-        if not doc_file.exists():
-            pytest.skip("Тестовый документ не найден")
-        
-        docx = DocxFile(str(doc_file))
         paragraphs = docx.get_all_paragraphs()
         
         # Проверяем, что у абзацев есть поле full_path
@@ -111,3 +90,34 @@ class TestDocxFile:
             assert "full_path" in para
             assert isinstance(para["full_path"], str)
 
+    
+    def test_open_document_mmap(self):
+        """Тест открытия документа через отображение в память."""
+        if not DOC_FILE.exists():
+            pytest.skip("Тестовый документ не найден")
+        
+        document = DocxFile._open_document(str(DOC_FILE))
+        
+        # Документ должен оставаться доступным после закрытия отображения
+        assert len(document.paragraphs) > 0
+    
+    def test_parsed_cache(self, tmp_path, monkeypatch):
+        """Тест повторного открытия документа из кэша парсинга."""
+        from config import config
+        
+        if not DOC_FILE.exists():
+            pytest.skip("Тестовый документ не найден")
+        
+        monkeypatch.setattr(config.cache, "directory", str(tmp_path))
+        first = DocxFile(str(DOC_FILE), use_cache=True)
+        assert list(tmp_path.rglob("*.pkl"))
+        
+        # При попадании в кэш документ не открывается
+        def fail(file_path):
+            raise AssertionError("Документ не должен открываться")
+        monkeypatch.setattr(DocxFile, "_open_document", staticmethod(fail))
+        
+        second = DocxFile(str(DOC_FILE), use_cache=True)
+        assert second.get_all_paragraphs() == first.get_all_paragraphs()
+        assert second.get_tables() == first.get_tables()
+        assert second.get_images() == first.get_images()
@@ -12,10 +12,29 @@ from csv_export import CSVExporter
 from html_export import HTMLExporter
 from compare import Compare
 
+# Импорт orjson для быстрого разбора экспортированного JSON (опционально)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-@pytest.fixture
+
+def load_json(path):
+    """Чтение JSON файла (через orjson, если установлен)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
 def sample_comparison_results():
-    """Фикстура с примерными результатами сравнения."""
+    """
+    Фикстура с примерными результатами сравнения.
+    
+    Создается один раз на сессию: экспортеры только читают результаты.
+    """
     return [
         {
             "index_1": 1,
@@ -71,9 +90,9 @@ def sample_comparison_results():
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_statistics():
-    """Фикстура с примерной статистикой."""
+    """Фикстура с примерной статистикой (одна на сессию, только для чтения)."""
     return {
         "total": 3,
         "identical": 1,
@@ -99,46 +118,56 @@ def sample_statistics():
     }
 
 
+@pytest.fixture(scope="module")
+def excel_output(tmp_path_factory, sample_comparison_results, sample_statistics):
+    """Excel файл с примерными результатами (экспорт один раз на модуль)."""
+    output_file = tmp_path_factory.mktemp("excel") / "test.xlsx"
+    ExcelExporter(str(output_file)).export_comparison(
+        sample_comparison_results,
+        sample_statistics,
+        "test1.docx",
+        "test2.docx"
+    )
+    return output_file
+
+
+@pytest.fixture(scope="module")
+def csv_output(tmp_path_factory, sample_comparison_results, sample_statistics):
+    """Папка с CSV файлами примерных результатов (экспорт один раз на модуль)."""
+    output_dir = tmp_path_factory.mktemp("csv")
+    CSVExporter(str(output_dir)).export_comparison(
+        sample_comparison_results,
+        sample_statistics,
+        "test1.docx",
+        "test2.docx"
+    )
+    return output_dir
+
+
 class TestExcelExporter:
     """Тесты для Excel экспортера."""
     
-    def test_excel_export_basic(self, tmp_path, sample_comparison_results, sample_statistics):
+    def test_excel_export_basic(self, excel_output):
         """Тест базового экспорта в Excel."""
-        output_file = tmp_path / "test.xlsx"
-        exporter = ExcelExporter(str(output_file))
-        
-        exporter.export_comparison(
-            sample_comparison_results,
-            sample_statistics,
-            "test1.docx",
-            "test2.docx"
-        )
-        
-        assert output_file.exists()
-        assert output_file.stat().st_size > 0
+        assert excel_output.exists()
+        assert excel_output.stat().st_size > 0
     
-    def test_excel_export_with_subtype(self, tmp_path, sample_comparison_results, sample_statistics):
+    def test_excel_export_with_subtype(self, excel_output):
         """Тест экспорта в Excel с подтипами изменений."""
-        output_file = tmp_path / "test.xlsx"
-        exporter = ExcelExporter(str(output_file))
-        
-        exporter.export_comparison(
-            sample_comparison_results,
-            sample_statistics,
-            "test1.docx",
-            "test2.docx"
-        )
-        
         # Проверяем, что файл создан и содержит данные
-        assert output_file.exists()
+        assert excel_output.exists()
         
         # Можно добавить проверку содержимого через openpyxl
         from openpyxl import load_workbook
-        wb = load_workbook(output_file)
-        ws = wb.active
+        # Нужна только строка заголовков: read_only читает лист потоково
+        wb = load_workbook(excel_output, read_only=True, data_only=True)
+        try:
+            ws = wb.active
+            headers = [cell.value for cell in next(ws.iter_rows(min_row=1, max_row=1))]
+        finally:
+            wb.close()
         
         # Проверяем наличие столбца "Подтип изменений"
-        headers = [cell.value for cell in ws[1]]
         assert "Подтип изменений" in headers
 
 
@@ -159,13 +188,12 @@ class TestJSONExporter:
         
         assert output_file.exists()
         
-        with open(output_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            assert "comparison_results" in data
-            assert "statistics" in data
-            assert len(data["comparison_results"]) == 3
-            # Проверяем наличие change_subtype
-            assert "change_subtype" in data["comparison_results"][0]
+        data = load_json(output_file)
+        assert "comparison_results" in data
+        assert "statistics" in data
+        assert len(data["comparison_results"]) == 3
+        # Проверяем наличие change_subtype
+        assert "change_subtype" in data["comparison_results"][0]
     
     def test_json_export_compact(self, tmp_path, sample_comparison_results, sample_statistics):
         """Тест экспорта в компактный JSON."""
@@ -181,9 +209,8 @@ class TestJSONExporter:
         
         assert output_file.exists()
         
-        with open(output_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            assert "comparison_results" in data
+        data = load_json(output_file)
+        assert "comparison_results" in data
     
     def test_json_export_with_filters(self, tmp_path, sample_comparison_results, sample_statistics):
         """Тест экспорта в JSON с фильтрами."""
@@ -202,30 +229,42 @@ class TestJSONExporter:
             filters=filters
         )
         
-        with open(output_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            # Должны остаться только modified и added
-            assert len(data["comparison_results"]) == 2
-            for result in data["comparison_results"]:
-                assert result["status"] in ["modified", "added"]
-
-
-class TestCSVExporter:
-    """Тесты для CSV экспортера."""
+        data = load_json(output_file)
+        # Должны остаться только modified и added
+        assert len(data["comparison_results"]) == 2
+        for result in data["comparison_results"]:
+            assert result["status"] in ["modified", "added"]
     
-    def test_csv_export_basic(self, tmp_path, sample_comparison_results, sample_statistics):
-        """Тест базового экспорта в CSV."""
-        exporter = CSVExporter(str(tmp_path))
+    def test_json_export_summary(self, tmp_path, sample_comparison_results, sample_statistics):
+        """Тест сводки по экспортированным результатам."""
+        output_file = tmp_path / "test.json"
+        exporter = JSONExporter(str(output_file), pretty=True)
         
         exporter.export_comparison(
             sample_comparison_results,
             sample_statistics,
             "test1.docx",
-            "test2.docx"
+            "test2.docx",
+            filters={"status": ["modified", "added"]}
         )
         
+        data = load_json(output_file)
+        summary = data["summary"]
+        # Сводка считается по отфильтрованным результатам
+        assert summary["total"] == len(data["comparison_results"])
+        assert summary["identical"] == 0
+        assert summary["modified"] == 1
+        assert summary["added"] == 1
+        assert summary["tables"] == 0
+
+
+class TestCSVExporter:
+    """Тесты для CSV экспортера."""
+    
+    def test_csv_export_basic(self, csv_output):
+        """Тест базового экспорта в CSV."""
         # Проверяем, что созданы CSV файлы
-        csv_files = list(tmp_path.glob("*.csv"))
+        csv_files = list(csv_output.glob("*.csv"))
         assert len(csv_files) > 0
         
         # Проверяем содержимое основного файла
@@ -235,30 +274,19 @@ class TestCSVExporter:
             headers = next(reader)
             assert "Подтип изменений" in headers
             
-            rows = list(reader)
-            assert len(rows) == 3
+            # Строки считаются потоково, без списка всех строк
+            assert sum(1 for _ in reader) == 3
     
-    def test_csv_export_changes_only(self, tmp_path, sample_comparison_results, sample_statistics):
+    def test_csv_export_changes_only(self, csv_output):
         """Тест экспорта только изменений в CSV."""
-        exporter = CSVExporter(str(tmp_path))
-        
-        exporter.export_comparison(
-            sample_comparison_results,
-            sample_statistics,
-            "test1.docx",
-            "test2.docx"
-        )
-        
         # Проверяем наличие файла с изменениями
-        changes_file = tmp_path / "test1_vs_test2_changes_only_*.csv"
-        csv_files = list(tmp_path.glob("*changes_only*.csv"))
+        csv_files = list(csv_output.glob("*changes_only*.csv"))
         if csv_files:
             with open(csv_files[0], 'r', encoding='utf-8-sig') as f:
                 reader = csv.reader(f)
                 headers = next(reader)
-                rows = list(reader)
                 # Должны быть только изменения (не identical)
-                for row in rows:
+                for row in reader:
                     if len(row) > 1:
                         assert row[1] != "identical"
 
@@ -2,156 +2,155 @@
 Интеграционные тесты для полного цикла работы программы.
 """
 
+import json
 import pytest
 import os
+from collections import namedtuple
 from pathlib import Path
-from compare import Compare
+from config import config
+from result_cache import get_comparison_bundle
 from excel_export import ExcelExporter
 from json_export import JSONExporter
 from csv_export import CSVExporter
 from html_export import HTMLExporter
 
+# Импорт ijson для потоковой проверки JSON экспорта (опционально)
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Результаты сравнения тестовых документов (см. фикстуру comparator_bundle)
+CompareBundle = namedtuple(
+    "CompareBundle", ["results", "statistics", "table_changes", "image_changes"]
+)
+
+# Размер начала/конца HTML файла, в котором ищутся теги <html> и </html>
+HTML_SCAN_BYTES = 512
+
+
+@pytest.fixture(scope="module")
+def comparator_bundle(request):
+    """
+    Сравнение тестовых документов, выполненное один раз на модуль.
+    
+    Результаты кэшируются через result_cache в папке кэша pytest, поэтому
+    повторные запуски тестов не сравнивают документы заново. Ключ записи
+    включает содержимое документов и исходный код модулей сравнения:
+    после изменения Compare сравнение выполняется заново. Очистка -
+    pytest --cache-clear.
+    
+    Returns:
+        CompareBundle с результатами сравнения
+    """
+    documents_dir = Path(__file__).parent.parent / "documents"
+    doc1 = documents_dir / "test_document_1.docx"
+    doc2 = documents_dir / "test_document_2.docx"
+    
+    if not (doc1.exists() and doc2.exists()):
+        pytest.skip("Тестовые документы не найдены")
+    
+    # Без плагина cacheprovider (-p no:cacheprovider) сравнение выполняется без кэша
+    pytest_cache = getattr(request.config, "cache", None)
+    if pytest_cache is None:
+        bundle = get_comparison_bundle(str(doc1), str(doc2), use_cache=False)
+    else:
+        saved_directory = config.cache.directory
+        config.cache.directory = str(pytest_cache.mkdir("compare"))
+        try:
+            bundle = get_comparison_bundle(str(doc1), str(doc2), use_cache=True)
+        finally:
+            config.cache.directory = saved_directory
+    
+    return CompareBundle(
+        bundle["results"],
+        bundle["statistics"],
+        bundle["table_changes"],
+        bundle["image_changes"],
+    )
+
+
+def _check_excel(output_dir: Path):
+    """Проверка Excel экспорта."""
+    assert (output_dir / "test_output.xlsx").exists()
+
+
+def _check_json(output_dir: Path):
+    """Проверка JSON экспорта: наличие разделов верхнего уровня."""
+    output_file = output_dir / "test_output.json"
+    assert output_file.exists()
+    # С ijson файл читается только до появления обоих ключей
+    expected = {"statistics", "comparison_results"}
+    if IJSON_AVAILABLE:
+        keys = set()
+        with open(output_file, 'rb') as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix == '' and event == 'map_key':
+                    keys.add(value)
+                    if expected <= keys:
+                        break
+    else:
+        with open(output_file, 'r', encoding='utf-8') as f:
+            keys = set(json.load(f))
+    assert expected <= keys
+
+
+def _check_csv(output_dir: Path):
+    """Проверка CSV экспорта: созданы CSV файлы."""
+    assert len(list(output_dir.glob("*.csv"))) > 0
+
+
+def _check_html(output_dir: Path):
+    """Проверка HTML экспорта: теги <html> и </html> в начале и конце файла."""
+    output_file = output_dir / "test_output.html"
+    assert output_file.exists()
+    # Файл читается только в начале и в конце, без загрузки всего документа
+    size = output_file.stat().st_size
+    with open(output_file, 'rb') as f:
+        head = f.read(HTML_SCAN_BYTES).lower()
+        f.seek(max(0, size - HTML_SCAN_BYTES))
+        tail = f.read().lower()
+    assert b"<html" in head
+    assert b"</html>" in tail
+
 
 @pytest.mark.integration
+@pytest.mark.xdist_group("integration_compare")
 class TestFullComparisonCycle:
     """Интеграционные тесты полного цикла сравнения."""
     
-    def test_comparison_with_real_documents(self):
+    def test_comparison_with_real_documents(self, comparator_bundle):
         """Тест сравнения реальных документов из папки documents."""
-        documents_dir = Path(__file__).parent.parent / "documents"
-        
-        # Проверяем наличие тестовых документов
-        doc1 = documents_dir / "test_document_1.docx"
-        doc2 = documents_dir / "test_document_2.docx"
-        
-        if not (doc1.exists() and doc2.exists()):
-            pytest.skip("Тестовые документы не найдены")
-        
-        # Выполняем сравнение
-        comparator = Compare(str(doc1), str(doc2))
+        results = comparator_bundle.results
+        statistics = comparator_bundle.statistics
         
         # Проверяем результаты
-        results = comparator.get_comparison_results()
         assert len(results) > 0
         
-        statistics = comparator.get_statistics()
         assert statistics["total"] > 0
         assert "identical" in statistics
         assert "modified" in statistics
     
-    def test_export_to_excel(self, tmp_path):
-        """Тест экспорта в Excel."""
-        documents_dir = Path(__file__).parent.parent / "documents"
-        doc1 = documents_dir / "test_document_1.docx"
-        doc2 = documents_dir / "test_document_2.docx"
-        
-        if not (doc1.exists() and doc2.exists()):
-            pytest.skip("Тестовые документы не найдены")
-        
-        comparator = Compare(str(doc1), str(doc2))
-        results = comparator.get_comparison_results()
-        statistics = comparator.get_statistics()
-        
-        output_file = tmp_path / "test_output.xlsx"
-        exporter = ExcelExporter(str(output_file))
+    @pytest.mark.parametrize("make_exporter,check", [
+        pytest.param(lambda path: ExcelExporter(str(path / "test_output.xlsx")),
+                     _check_excel, id="excel"),
+        pytest.param(lambda path: JSONExporter(str(path / "test_output.json"), pretty=True),
+                     _check_json, id="json"),
+        pytest.param(lambda path: CSVExporter(str(path)), _check_csv, id="csv"),
+        pytest.param(lambda path: HTMLExporter(str(path / "test_output.html")),
+                     _check_html, id="html"),
+    ])
+    def test_export(self, tmp_path, comparator_bundle, make_exporter, check):
+        """Тест экспорта результатов сравнения в каждый из форматов."""
+        exporter = make_exporter(tmp_path)
         exporter.export_comparison(
-            results,
-            statistics,
+            comparator_bundle.results,
+            comparator_bundle.statistics,
             "test1.docx",
             "test2.docx",
-            comparator.get_table_changes(),
-            comparator.get_image_changes()
+            comparator_bundle.table_changes,
+            comparator_bundle.image_changes
         )
         
-        assert output_file.exists()
-    
-    def test_export_to_json(self, tmp_path):
-        """Тест экспорта в JSON."""
-        documents_dir = Path(__file__).parent.parent / "documents"
-        doc1 = documents_dir / "test_document_1.docx"
-        doc2 = documents_dir / "test_document_2.docx"
-        
-        if not (doc1.exists() and doc2.exists()):
-            pytest.skip("Тестовые документы не найдены")
-        
-        comparator = Compare(str(doc1), str(doc2))
-        results = comparator.get_comparison_results()
-        statistics = comparator.get_statistics()
-        
-        output_file = tmp_path / "test_output.json"
-        exporter = JSONExporter(str(output_file), pretty=True)
-        exporter.export_comparison(
-            results,
-            statistics,
-            "test1.docx",
-            "test2.docx",
-            comparator.get_table_changes(),
-            comparator.get_image_changes()
-        )
-        
-        assert output_file.exists()
-        # Проверяем, что файл содержит валидный JSON
-        import json
-        with open(output_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            assert "statistics" in data
-            assert "comparison_results" in data
-    
-    def test_export_to_csv(self, tmp_path):
-        """Тест экспорта в CSV."""
-        documents_dir = Path(__file__).parent.parent / "documents"
-        doc1 = documents_dir / "test_document_1.docx"
-        doc2 = documents_dir / "test_document_2.docx"
-        
-        if not (doc1.exists() and doc2.exists()):
-            pytest.skip("Тестовые документы не найдены")
-        
-        comparator = Compare(str(doc1), str(doc2))
-        results = comparator.get_comparison_results()
-        statistics = comparator.get_statistics()
-        
-        exporter = CSVExporter(str(tmp_path))
-        exporter.export_comparison(
-            results,
-            statistics,
-            "test1.docx",
-            "test2.docx",
-            comparator.get_table_changes(),
-            comparator.get_image_changes()
-        )
-        
-        # Проверяем, что созданы CSV файлы
-        csv_files = list(tmp_path.glob("*.csv"))
-        assert len(csv_files) > 0
-    
-    def test_export_to_html(self, tmp_path):
-        """Тест экспорта в HTML."""
-        documents_dir = Path(__file__).parent.parent / "documents"
-        doc1 = documents_dir / "test_document_1.docx"
-        doc2 = documents_dir / "test_document_2.docx"
-        
-        if not (doc1.exists() and doc2.exists()):
-            pytest.skip("Тестовые документы не найдены")
-        
-        comparator = Compare(str(doc1), str(doc2))
-        results = comparator.get_comparison_results()
-        statistics = comparator.get_statistics()
-        
-        output_file = tmp_path / "test_output.html"
-        exporter = HTMLExporter(str(output_file))
-        exporter.export_comparison(
-            results,
-            statistics,
-            "test1.docx",
-            "test2.docx",
-            comparator.get_table_changes(),
-            comparator.get_image_changes()
-        )
-        
-        assert output_file.exists()
-        # Проверяем, что файл содержит HTML
-        with open(output_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-            assert "<html" in content.lower()
-            assert "</html>" in content.lower()
-
+        check(tmp_path)
@@ -0,0 +1,152 @@
+"""
+Тесты для модуля result_cache.
+"""
+
+import pytest
+from pathlib import Path
+from config import config
+import result_cache
+from result_cache import (
+    get_comparison_bundle, llm_cache_mode, load_results, make_cache_key, make_parse_key,
+    save_results
+)
+from llm_adapter import LLMAdapter
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Фикстура с временной папкой кэша."""
+    directory = tmp_path / "cache"
+    monkeypatch.setattr(config.cache, "directory", str(directory))
+    return directory
+
+
+@pytest.fixture
+def test_documents():
+    """Фикстура с путями к тестовым документам."""
+    documents_dir = Path(__file__).parent.parent / "documents"
+    doc1 = documents_dir / "test_document_1.docx"
+    doc2 = documents_dir / "test_document_2.docx"
+    
+    if not (doc1.exists() and doc2.exists()):
+        pytest.skip("Тестовые документы не найдены")
+    
+    return str(doc1), str(doc2)
+
+
+class TestResultCache:
+    """Тесты для кэша результатов сравнения."""
+    
+    def test_cache_key_depends_on_llm_mode(self, test_documents):
+        """Тест зависимости ключа от режима LLM."""
+        doc1, doc2 = test_documents
+        assert make_cache_key(doc1, doc2) == make_cache_key(doc1, doc2)
+        assert make_cache_key(doc1, doc2) != make_cache_key(doc1, doc2, "model")
+        assert make_cache_key(doc1, doc2) != make_cache_key(doc2, doc1)
+    
+    def test_cache_key_depends_on_llm_params(self, test_documents, monkeypatch):
+        """Тест зависимости ключа от параметров генерации LLM."""
+        doc1, doc2 = test_documents
+        monkeypatch.delenv("OPENAI_TOP_P", raising=False)
+        adapter = LLMAdapter(model="model", temperature=0.3, max_tokens=200)
+        key = make_cache_key(doc1, doc2, llm_cache_mode(adapter))
+        
+        assert make_cache_key(doc1, doc2, llm_cache_mode(
+            LLMAdapter(model="model", temperature=0.7, max_tokens=200))) != key
+        assert make_cache_key(doc1, doc2, llm_cache_mode(
+            LLMAdapter(model="model", temperature=0.3, max_tokens=500))) != key
+        
+        monkeypatch.setenv("OPENAI_TOP_P", "0.9")
+        assert make_cache_key(doc1, doc2, llm_cache_mode(adapter)) != key
+    
+    def test_save_and_load(self, cache_dir):
+        """Тест сохранения и загрузки записи."""
+        assert load_results("missing") is None
+        save_results("key", {"results": [1, 2, 3]})
+        assert load_results("key") == {"results": [1, 2, 3]}
+    
+    def test_eviction(self, cache_dir, monkeypatch):
+        """Тест вытеснения старых записей."""
+        monkeypatch.setattr(config.cache, "max_entries", 2)
+        for i in range(4):
+            save_results(f"key{i}", {"i": i})
+        assert len(list(cache_dir.glob("*.pkl"))) == 2
+    
+    def test_bundle_from_cache(self, cache_dir, test_documents, monkeypatch):
+        """Тест повторного сравнения без вызова Compare."""
+        doc1, doc2 = test_documents
+        first = get_comparison_bundle(doc1, doc2, use_cache=True)
+        
+        def fail(*args, **kwargs):
+            raise AssertionError("Compare не должен вызываться при попадании в кэш")
+        
+        monkeypatch.setattr(result_cache, "Compare", fail)
+        second = get_comparison_bundle(doc1, doc2, use_cache=True)
+        assert second["statistics"] == first["statistics"]
+        
+        with pytest.raises(AssertionError):
+            get_comparison_bundle(doc1, doc2, use_cache=False)
+        
+        # Кэш отключен по умолчанию
+        monkeypatch.setattr(config.cache, "enabled", False)
+        with pytest.raises(AssertionError):
+            get_comparison_bundle(doc1, doc2)
+    
+    def test_cache_key_depends_on_prompts(self, test_documents, tmp_path, monkeypatch):
+        """Тест зависимости ключа от содержимого файлов промптов."""
+        doc1, doc2 = test_documents
+        prompts_dir = tmp_path / "prompts"
+        prompts_dir.mkdir()
+        prompt_file = prompts_dir / "system_prompt.txt"
+        prompt_file.write_text("Первая версия промпта", encoding="utf-8")
+        monkeypatch.setattr(result_cache, "PROMPTS_DIR", prompts_dir)
+        
+        key = make_cache_key(doc1, doc2, "model")
+        prompt_file.write_text("Вторая версия промпта", encoding="utf-8")
+        assert make_cache_key(doc1, doc2, "model") != key
+    
+    def test_parse_key_depends_on_parser_source(self, test_documents, tmp_path, monkeypatch):
+        """Тест зависимости ключа кэша парсинга от исходного кода парсера."""
+        doc1, _ = test_documents
+        parser_file = tmp_path / "docx_file.py"
+        parser_file.write_text("# первая версия парсера", encoding="utf-8")
+        monkeypatch.setattr(result_cache, "SOURCE_DIR", tmp_path)
+        
+        result_cache.source_hash.cache_clear()
+        try:
+            key = make_parse_key(doc1)
+            parser_file.write_text("# вторая версия парсера", encoding="utf-8")
+            result_cache.source_hash.cache_clear()
+            assert make_parse_key(doc1) != key
+        finally:
+            result_cache.source_hash.cache_clear()
+    
+    def test_failed_llm_not_cached(self, cache_dir, test_documents, monkeypatch):
+        """Тест: результаты с неудавшимся LLM анализом не сохраняются."""
+        doc1, doc2 = test_documents
+        
+        class FailingComparator:
+            """Сравнитель, у которого LLM анализ не удался."""
+            llm_failures = 1
+            
+            def __init__(self, *args, **kwargs):
+                pass
+            
+            def get_comparison_results(self):
+                return []
+            
+            def get_statistics(self):
+                return {}
+            
+            def get_table_changes(self):
+                return []
+            
+            def get_image_changes(self):
+                return []
+            
+            def _generate_summary_changes(self):
+                return ""
+        
+        monkeypatch.setattr(result_cache, "Compare", FailingComparator)
+        get_comparison_bundle(doc1, doc2, use_cache=True)
+        assert not list(cache_dir.glob("*.pkl"))
@@ -0,0 +1,86 @@
+"""
+Unit-тесты для модуля sequence_diff.
+"""
+
+import difflib
+import random
+import pytest
+from sequence_diff import get_matching_blocks
+
+
+def _lcs_length(seq1, seq2):
+    """Длина наибольшей общей подпоследовательности (эталонное ДП)."""
+    dp = [[0] * (len(seq2) + 1) for _ in range(len(seq1) + 1)]
+    for i, item1 in enumerate(seq1):
+        for j, item2 in enumerate(seq2):
+            if item1 == item2:
+                dp[i + 1][j + 1] = dp[i][j] + 1
+            else:
+                dp[i + 1][j + 1] = max(dp[i][j + 1], dp[i + 1][j])
+    return dp[-1][-1]
+
+
+class TestGetMatchingBlocks:
+    """Тесты для функции get_matching_blocks."""
+    
+    def test_identical_sequences(self):
+        """Тест идентичных последовательностей."""
+        seq = ["Первый абзац", "Второй абзац", "Третий абзац"]
+        blocks = get_matching_blocks(seq, list(seq))
+        assert blocks == [difflib.Match(0, 0, 3), difflib.Match(3, 3, 0)]
+    
+    def test_empty_sequences(self):
+        """Тест пустых последовательностей."""
+        assert get_matching_blocks([], []) == [difflib.Match(0, 0, 0)]
+        assert get_matching_blocks(["абзац"], []) == [difflib.Match(1, 0, 0)]
+    
+    def test_completely_different(self):
+        """Тест последовательностей без общих элементов."""
+        blocks = get_matching_blocks(["а", "б", "в"], ["г", "д"])
+        assert blocks == [difflib.Match(3, 2, 0)]
+    
+    def test_inserted_paragraph(self):
+        """Тест вставки абзаца в середину."""
+        seq1 = ["а", "б", "в", "г"]
+        seq2 = ["а", "б", "новый", "в", "г"]
+        blocks = get_matching_blocks(seq1, seq2)
+        assert blocks == [difflib.Match(0, 0, 2), difflib.Match(2, 3, 2), difflib.Match(4, 5, 0)]
+    
+    def test_min_common_ratio(self):
+        """Тест порога вырожденного случая."""
+        seq1 = ["общий", "а", "б", "в"]
+        seq2 = ["x", "общий", "y", "z"]
+        assert sum(b.size for b in get_matching_blocks(seq1, seq2, min_common_ratio=0.0)) == 1
+        assert sum(b.size for b in get_matching_blocks(seq1, seq2, min_common_ratio=0.5)) == 0
+    
+    def test_random_sequences_match_lcs(self):
+        """Тест оптимальности на случайных последовательностях."""
+        rng = random.Random(42)
+        for _ in range(300):
+            seq1 = [rng.choice("abcd") for _ in range(rng.randint(0, 25))]
+            seq2 = [rng.choice("abcd") for _ in range(rng.randint(0, 25))]
+            blocks = get_matching_blocks(seq1, seq2)
+            
+            assert blocks[-1] == difflib.Match(len(seq1), len(seq2), 0)
+            assert sum(b.size for b in blocks) == _lcs_length(seq1, seq2)
+            end_a = end_b = 0
+            for block in blocks[:-1]:
+                assert block.a >= end_a and block.b >= end_b
+                assert seq1[block.a:block.a + block.size] == seq2[block.b:block.b + block.size]
+                end_a, end_b = block.a + block.size, block.b + block.size
+    
+    def test_jit_matches_interpreter(self, monkeypatch):
+        """Тест совпадения JIT-версии с интерпретируемой."""
+        pytest.importorskip("numba")
+        import sequence_diff
+        
+        rng = random.Random(7)
+        seq1 = [rng.choice("abcdefgh") for _ in range(300)]
+        seq2 = [rng.choice("abcdefgh") for _ in range(280)]
+        
+        jit_blocks = get_matching_blocks(seq1, seq2)
+        monkeypatch.setattr(sequence_diff, "NUMBA_AVAILABLE", False)
+        python_blocks = get_matching_blocks(seq1, seq2)
+        
+        assert sum(b.size for b in jit_blocks) == sum(b.size for b in python_blocks)
+        assert sum(b.size for b in jit_blocks) == _lcs_length(seq1, seq2)
@@ -8,6 +8,7 @@ import tempfile
 import os
 from validators import (
     validate_file_path,
+    validate_file_paths,
     validate_file_size,
     validate_output_path,
     validate_document_structure
@@ -39,6 +40,14 @@ class TestValidateFilePath:
         with pytest.raises(ValidationError):
             validate_file_path("")
     
+    def test_uppercase_extension(self, tmp_path):
+        """Тест валидации файла с расширением в верхнем регистре."""
+        test_file = tmp_path / "TEST.DOCX"
+        test_file.write_bytes(b"test content")
+        
+        _, path_obj = validate_file_path(str(test_file))
+        assert path_obj.name == "TEST.DOCX"
+    
     def test_wrong_extension(self, tmp_path):
         """Тест валидации файла с неправильным расширением."""
         test_file = tmp_path / "test.txt"
@@ -47,6 +56,46 @@ class TestValidateFilePath:
         with pytest.raises(ValidationError):
             validate_file_path(str(test_file))
 
+    
+    def test_directory_path(self, tmp_path):
+        """Тест валидации пути к директории."""
+        directory = tmp_path / "dir.docx"
+        directory.mkdir()
+        
+        with pytest.raises(ValidationError):
+            validate_file_path(str(directory))
+
+
+class TestValidateFilePaths:
+    """Тесты для validate_file_paths."""
+    
+    def test_valid_files(self, tmp_path):
+        """Тест валидации нескольких файлов с сохранением порядка."""
+        files = [tmp_path / "b.docx", tmp_path / "a.docx"]
+        for test_file in files:
+            test_file.write_bytes(b"test content")
+        
+        result = validate_file_paths([str(f) for f in files])
+        assert [path_obj.name for _, path_obj in result] == ["b.docx", "a.docx"]
+        assert result[0][0] == str(files[0].absolute())
+    
+    def test_invalid_file(self, tmp_path):
+        """Тест остановки на первом невалидном файле."""
+        test_file = tmp_path / "test.docx"
+        test_file.write_bytes(b"test content")
+        
+        with pytest.raises(ValidationError):
+            validate_file_paths([str(test_file), str(tmp_path / "missing.docx")])
+    
+    def test_too_large_file(self, tmp_path, monkeypatch):
+        """Тест проверки размера файла."""
+        monkeypatch.setattr(config.document, "max_file_size_mb", 0.001)  # 1 KB
+        test_file = tmp_path / "test.docx"
+        test_file.write_bytes(b"x" * 2000)
+        
+        with pytest.raises(FileSizeError):
+            validate_file_paths([str(test_file)])
+
 
 class TestValidateFileSize:
     """Тесты для validate_file_size."""
@@ -76,6 +125,19 @@ class TestValidateFileSize:
         # Восстанавливаем оригинальное значение
         monkeypatch.setattr(config.document, "max_file_size_mb", original_max)
 
+    
+    def test_size_at_limit(self, tmp_path, monkeypatch):
+        """Тест файла размером ровно в лимит и на байт больше."""
+        monkeypatch.setattr(config.document, "max_file_size_mb", 0.001)  # 1048.576 байт
+        test_file = tmp_path / "test.docx"
+        
+        test_file.write_bytes(b"x" * 1048)
+        validate_file_size(test_file)
+        
+        test_file.write_bytes(b"x" * 1049)
+        with pytest.raises(FileSizeError):
+            validate_file_size(test_file)
+
 
 class TestValidateOutputPath:
     """Тесты для validate_output_path."""
@@ -127,3 +189,11 @@ class TestValidateDocumentStructure:
         
         monkeypatch.setattr(config.document, "max_tables", original_max)
 
+    
+    def test_limits_follow_config_changes(self, monkeypatch):
+        """Тест учета изменения лимитов после предыдущих вызовов."""
+        validate_document_structure(100, 10, 5)
+        monkeypatch.setattr(config.document, "max_images", 1)
+        
+        with pytest.raises(ValidationError):
+            validate_document_structure(100, 10, 5)
@@ -5,21 +5,39 @@
 """
 
 import os
+import stat
 from pathlib import Path
-from typing import Tuple
+from typing import Iterable, List, Tuple
 from exceptions import ValidationError, FileSizeError
 from config import config
 
+# Количество байт в мегабайте (для лимита config.document.max_file_size_mb)
+BYTES_PER_MB = 1024 * 1024
 
-def validate_file_path(file_path: str) -> Tuple[str, Path]:
+# Допустимые расширения выходного файла (регистр приводится только
+# для путей, не совпавших с ними напрямую)
+OUTPUT_EXTENSIONS = ('.xlsx', '.xls')
+
+
+def _has_docx_suffix(file_name: str) -> bool:
+    """Проверка расширения .docx без учета регистра (имя '.docx' не подходит)."""
+    if file_name.endswith('.docx'):
+        return len(file_name) > 5
+    return len(file_name) > 5 and file_name[-5:].lower() == '.docx'
+
+
+def _stat_docx_file(file_path: str) -> Tuple[Path, os.stat_result]:
     """
-    Валидация пути к файлу.
+    Проверка пути к DOCX файлу одним вызовом stat().
+    
+    Существование, тип и размер файла берутся из одного результата stat()
+    вместо отдельных вызовов exists(), is_file() и stat().
     
     Args:
         file_path: Путь к файлу
     
     Returns:
-        Кортеж (абсолютный путь как строка, Path объект)
+        Кортеж (нормализованный Path объект, результат os.stat)
     
     Raises:
         ValidationError: Если путь невалиден
@@ -32,39 +50,89 @@ def validate_file_path(file_path: str) -> Tuple[str, Path]:
     path_obj = Path(normalized_path)
     
     # Проверка существования
-    if not path_obj.exists():
+    try:
+        file_stat = os.stat(normalized_path)
+    except (FileNotFoundError, NotADirectoryError):
         raise ValidationError(f"Файл не найден: {normalized_path}")
+    except (OSError, ValueError) as e:
+        raise ValidationError(f"Нет доступа к файлу {normalized_path}: {e}")
     
     # Проверка, что это файл, а не директория
-    if not path_obj.is_file():
+    if not stat.S_ISREG(file_stat.st_mode):
         raise ValidationError(f"Указанный путь не является файлом: {normalized_path}")
     
     # Проверка расширения
-    if path_obj.suffix.lower() != '.docx':
+    if not _has_docx_suffix(path_obj.name):
         raise ValidationError(
             f"Неподдерживаемый формат файла: {path_obj.suffix}. "
             f"Ожидается .docx"
         )
     
-    return str(path_obj.absolute()), path_obj
+    return path_obj, file_stat
 
 
-def validate_file_size(file_path: Path) -> None:
+def validate_file_path(file_path: str) -> Tuple[str, Path]:
     """
-    Проверка размера файла.
+    Валидация пути к файлу.
     
     Args:
         file_path: Путь к файлу
     
+    Returns:
+        Кортеж (абсолютный путь как строка, Path объект)
+    
     Raises:
+        ValidationError: Если путь невалиден
+    """
+    path_obj, _ = _stat_docx_file(file_path)
+    return os.path.abspath(path_obj), path_obj
+
+
+def validate_file_paths(file_paths: Iterable[str]) -> List[Tuple[str, Path]]:
+    """
+    Валидация набора входных файлов: путь, формат и размер.
+    
+    Для каждого файла выполняется один вызов stat().
+    
+    Args:
+        file_paths: Пути к файлам
+    
+    Returns:
+        Список кортежей (абсолютный путь как строка, Path объект)
+        в порядке входных путей
+    
+    Raises:
+        ValidationError: Если путь невалиден
         FileSizeError: Если файл слишком большой
     """
-    file_size = file_path.stat().st_size
-    file_size_mb = file_size / (1024 * 1024)
+    validated = []
+    for file_path in file_paths:
+        path_obj, file_stat = _stat_docx_file(file_path)
+        _check_file_size(path_obj, file_stat.st_size)
+        validated.append((os.path.abspath(path_obj), path_obj))
+    return validated
+
+
+def _check_file_size(file_path: Path, file_size: int) -> None:
+    """Сравнение размера файла в байтах с config.document.max_file_size_mb."""
     max_size_mb = config.document.max_file_size_mb
     
-    if file_size_mb > max_size_mb:
-        raise FileSizeError(str(file_path), file_size_mb, max_size_mb)
+    # Сравнение целых байтов; размер в МБ вычисляется только для сообщения об ошибке
+    if file_size > int(max_size_mb * BYTES_PER_MB):
+        raise FileSizeError(str(file_path), file_size / BYTES_PER_MB, max_size_mb)
+
+
+def validate_file_size(file_path: Path) -> None:
+    """
+    Проверка размера файла.
+    
+    Args:
+        file_path: Путь к файлу
+    
+    Raises:
+        FileSizeError: Если файл слишком большой
+    """
+    _check_file_size(file_path, file_path.stat().st_size)
 
 
 def validate_output_path(output_path: str) -> Path:
@@ -88,7 +156,8 @@ def validate_output_path(output_path: str) -> Path:
     path_obj = Path(normalized_path)
     
     # Проверка расширения
-    if path_obj.suffix.lower() not in ['.xlsx', '.xls']:
+    if not normalized_path.endswith(OUTPUT_EXTENSIONS) and \
+            path_obj.suffix.lower() not in OUTPUT_EXTENSIONS:
         # Если расширение не указано, добавляем .xlsx
         if not path_obj.suffix:
             path_obj = path_obj.with_suffix('.xlsx')
@@ -124,9 +193,12 @@ def validate_document_structure(paragraphs_count: int, tables_count: int, images
     Raises:
         ValidationError: Если структура не соответствует ограничениям
     """
-    max_paragraphs = config.document.max_paragraphs
-    max_tables = config.document.max_tables
-    max_images = config.document.max_images
+    # Лимиты читаются при каждом вызове (а не кэшируются), чтобы изменения
+    # config.document во время работы сразу учитывались
+    document_config = config.document
+    max_paragraphs = document_config.max_paragraphs
+    max_tables = document_config.max_tables
+    max_images = document_config.max_images
     
     if paragraphs_count > max_paragraphs:
         raise ValidationError(